@@ -418,6 +418,32 @@ class TestGenerateSubsFromSource(TestDownloadYoutubeSubs):
         self.assertEqual(exception_message, "Something wrong with SubRip transcripts file during parsing.")
 
 
+class TestSjsonOutdated(TestDownloadYoutubeSubs):
+    """Tests for `sjson_outdated` function."""
+
+    def test_sjson_outdated(self):
+        youtube_subs = {
+            1.0: 'hI10vDNYz4M',
+            2.0: 'AKqURZnYqpk'
+        }
+        srt_filedata = textwrap.dedent("""
+            1
+            00:00:10,500 --> 00:00:13,000
+            Elephant's Dream
+        """)
+        self.clear_subs_content(youtube_subs)
+        self.addCleanup(self.clear_subs_content, youtube_subs)
+
+        # The uploaded transcripts don't exist.
+        self.assertTrue(transcripts_utils.sjson_outdated(self.course, 'outdated.srt', youtube_subs.values(), 'en'))
+
+        transcripts_utils.save_to_store(srt_filedata, 'outdated.srt', 'application/x-subrip', self.course.location)
+        self.assertTrue(transcripts_utils.sjson_outdated(self.course, 'outdated.srt', youtube_subs.values(), 'en'))
+
+        transcripts_utils.generate_subs_from_source(youtube_subs, 'srt', srt_filedata, self.course)
+        self.assertFalse(transcripts_utils.sjson_outdated(self.course, 'outdated.srt', youtube_subs.values(), 'en'))
+
+
 class TestGenerateSrtFromSjson(TestDownloadYoutubeSubs):
     """Tests for `generate_srt_from_sjson` function."""
 
@@ -609,6 +635,18 @@ class TestTranscript(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             transcripts_utils.Transcript.convert(self.srt_transcript, 'srt', 'sjson')
 
+    def test_convert_asset_cached(self):
+        asset = StaticContent(
+            None, 'subs.srt.sjson', 'application/json', self.sjson_transcript, content_digest=uuid4().hex
+        )
+        with patch.object(
+            transcripts_utils.Transcript, 'convert', wraps=transcripts_utils.Transcript.convert
+        ) as mock_convert:
+            self.assertEqual(transcripts_utils.Transcript.convert_asset(asset, 'sjson', 'txt'), self.txt_transcript)
+            self.assertEqual(transcripts_utils.Transcript.convert_asset(asset, 'sjson', 'txt'), self.txt_transcript)
+            self.assertEqual(transcripts_utils.Transcript.convert_asset(asset, 'sjson', 'srt'), self.srt_transcript)
+        self.assertEqual(mock_convert.call_count, 2)
+
 
 class TestSubsFilename(unittest.TestCase):
     """
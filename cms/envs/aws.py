@@ -123,6 +123,11 @@ DEFAULT_COURSE_ABOUT_IMAGE_URL = ENV_TOKENS.get('DEFAULT_COURSE_ABOUT_IMAGE_URL'
 # for course data
 GITHUB_REPO_ROOT = ENV_TOKENS.get('GITHUB_REPO_ROOT', GITHUB_REPO_ROOT)
 
+# Directory of compiled Mako template modules; point it at a release
+# specific directory to precompile templates during deployment.
+MAKO_MODULE_DIR = ENV_TOKENS.get('MAKO_MODULE_DIR', MAKO_MODULE_DIR)
+MAKO_WARM_UP_TEMPLATES = ENV_TOKENS.get('MAKO_WARM_UP_TEMPLATES', MAKO_WARM_UP_TEMPLATES)
+
 # STATIC_ROOT specifies the directory where static files are
 # collected
 
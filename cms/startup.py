@@ -9,6 +9,7 @@ settings.INSTALLED_APPS  # pylint: disable=pointless-statement
 
 from openedx.core.lib.django_startup import autostartup
 import django
+import edxmako.startup
 from monkey_patch import (
     third_party_auth,
     django_db_models_options
@@ -50,6 +51,9 @@ def run():
     xmodule.x_module.descriptor_global_handler_url = cms.lib.xblock.runtime.handler_url
     xmodule.x_module.descriptor_global_local_resource_url = xblock_local_resource_url
 
+    # Now that all the template directories are added.
+    edxmako.startup.warm_up()
+
 
 def add_mimetypes():
     """
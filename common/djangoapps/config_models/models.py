@@ -1,6 +1,12 @@
 """
 Django Model baseclass for database-backed configuration.
 """
+import cPickle as pickle
+import time
+from uuid import uuid4
+
+import crum
+from django.conf import settings
 from django.db import connection, models
 from django.contrib.auth.models import User
 from django.core.cache import caches, InvalidCacheBackendError
@@ -8,6 +14,8 @@ from django.utils.translation import ugettext_lazy as _
 
 from rest_framework.utils import model_meta
 
+import request_cache
+
 
 try:
     cache = caches['configuration']  # pylint: disable=invalid-name
@@ -15,6 +23,94 @@ except InvalidCacheBackendError:
     from django.core.cache import cache
 
 
+# Key of the configuration generation in the shared cache. It is changed
+# whenever any configuration entry is saved, which invalidates the entries of
+# the process-local cache.
+GENERATION_CACHE_KEY = 'configuration/generation'
+
+# Process-local cache of configuration entries, in front of the shared cache.
+# Maps cache key names to (generation, expiry time, pickled value) tuples.
+# Values are stored pickled, so that each hit returns its own copy, as the
+# shared cache does, which callers are free to modify.
+_local_cache = {}  # pylint: disable=invalid-name
+
+
+def _local_cache_timeout():
+    """
+    Returns the number of seconds for which configuration entries are kept in
+    the process-local cache, or 0 if the process-local cache is disabled.
+    """
+    return getattr(settings, 'CONFIGURATION_MODEL_LOCAL_CACHE_TIMEOUT', 0)
+
+
+def _current_generation():
+    """
+    Returns the current configuration generation from the shared cache, or
+    None if the shared cache does not keep it.
+
+    Within a request, the shared cache is only asked once.
+    """
+    generation_cache = request_cache.get_cache('config_models.generation') if crum.get_current_request() else {}
+    if 'generation' not in generation_cache:
+        generation = cache.get(GENERATION_CACHE_KEY)
+        if generation is None:
+            cache.add(GENERATION_CACHE_KEY, uuid4().hex, None)
+            generation = cache.get(GENERATION_CACHE_KEY)
+        generation_cache['generation'] = generation
+    return generation_cache['generation']
+
+
+def clear_local_cache():
+    """
+    Changes the configuration generation, so that all of the process-local
+    caches are cleared, and clears the one of this process.
+    """
+    cache.set(GENERATION_CACHE_KEY, uuid4().hex, None)
+    if crum.get_current_request():
+        request_cache.get_cache('config_models.generation').clear()
+    _local_cache.clear()
+
+
+def _get_cached(cache_key):
+    """
+    Returns the configuration value cached under the given key, from the
+    process-local cache if it is still valid, or else from the shared cache.
+    """
+    timeout = _local_cache_timeout()
+    if timeout:
+        generation = _current_generation()
+        if generation is not None:
+            cached_generation, expiry_time, pickled_value = _local_cache.get(cache_key, (None, 0, None))
+            if cached_generation == generation and expiry_time > time.time():
+                return pickle.loads(pickled_value)
+
+    value = cache.get(cache_key)
+    if timeout and value is not None:
+        _set_local(cache_key, value, timeout)
+    return value
+
+
+def _set_cached(cache_key, value, cache_timeout):
+    """
+    Caches the configuration value under the given key, both in the shared
+    cache and in the process-local cache.
+    """
+    cache.set(cache_key, value, cache_timeout)
+    timeout = _local_cache_timeout()
+    if timeout:
+        _set_local(cache_key, value, min(timeout, cache_timeout))
+
+
+def _set_local(cache_key, value, timeout):
+    """
+    Caches a pickled copy of the value in the process-local cache for the
+    current generation.
+    """
+    generation = _current_generation()
+    if generation is not None:
+        _local_cache[cache_key] = (generation, time.time() + timeout, pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+
 class ConfigurationModelManager(models.Manager):
     """
     Query manager for ConfigurationModel
@@ -102,6 +198,7 @@ class ConfigurationModel(models.Model):
         cache.delete(self.cache_key_name(*[getattr(self, key) for key in self.KEY_FIELDS]))
         if self.KEY_FIELDS:
             cache.delete(self.key_values_cache_key_name())
+        clear_local_cache()
 
     @classmethod
     def cache_key_name(cls, *args):
@@ -122,7 +219,7 @@ class ConfigurationModel(models.Model):
         from the database, or by creating a new empty entry (which is not
         persisted).
         """
-        cached = cache.get(cls.cache_key_name(*args))
+        cached = _get_cached(cls.cache_key_name(*args))
         if cached is not None:
             return cached
 
@@ -132,7 +229,7 @@ class ConfigurationModel(models.Model):
         except IndexError:
             current = cls(**key_dict)
 
-        cache.set(cls.cache_key_name(*args), current, cls.cache_timeout)
+        _set_cached(cls.cache_key_name(*args), current, cls.cache_timeout)
         return current
 
     @classmethod
@@ -173,11 +270,11 @@ class ConfigurationModel(models.Model):
         assert not kwargs, "'flat' is the only kwarg accepted"
         key_fields = key_fields or cls.KEY_FIELDS
         cache_key = cls.key_values_cache_key_name(*key_fields)
-        cached = cache.get(cache_key)
+        cached = _get_cached(cache_key)
         if cached is not None:
             return cached
         values = list(cls.objects.values_list(*key_fields, flat=flat).order_by().distinct())
-        cache.set(cache_key, values, cls.cache_timeout)
+        _set_cached(cache_key, values, cls.cache_timeout)
         return values
 
     def fields_equal(self, instance, fields_to_ignore=("id", "change_date", "changed_by")):
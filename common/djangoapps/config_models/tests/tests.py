@@ -5,14 +5,16 @@ Tests of ConfigurationModel
 
 import ddt
 from django.contrib.auth.models import User
+from django.core.cache.backends.locmem import LocMemCache
 from django.db import models
 from django.test import TestCase
+from django.test.utils import override_settings
 from rest_framework.test import APIRequestFactory
 
 from freezegun import freeze_time
 
 from mock import patch, Mock
-from config_models.models import ConfigurationModel
+from config_models.models import ConfigurationModel, GENERATION_CACHE_KEY, clear_local_cache
 from config_models.views import ConfigurationModelCurrentAPIView
 
 
@@ -415,6 +417,53 @@ class KeyedConfigurationModelTests(TestCase):
         self.assertFalse(ExampleKeyedConfig.equal_to_current({}))
 
 
+@override_settings(CONFIGURATION_MODEL_LOCAL_CACHE_TIMEOUT=60)
+class ConfigurationModelLocalCacheTests(TestCase):
+    """
+    Tests of the process-local cache of ConfigurationModel
+    """
+    def setUp(self):
+        super(ConfigurationModelLocalCacheTests, self).setUp()
+        self.user = User()
+        self.user.save()
+        self.shared_cache = LocMemCache('config_models_tests', {})
+        cache_patcher = patch('config_models.models.cache', self.shared_cache)
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+        self.addCleanup(clear_local_cache)
+        clear_local_cache()
+
+        with freeze_time('2012-01-01'):
+            ExampleConfig(changed_by=self.user, string_field='first').save()
+        ExampleConfig.current()
+
+    def test_local_cache_hit(self):
+        self.shared_cache.delete(ExampleConfig.cache_key_name())
+        with self.assertNumQueries(0):
+            self.assertEquals(ExampleConfig.current().string_field, 'first')
+
+    def test_local_cache_returns_copies(self):
+        self.shared_cache.delete(ExampleConfig.cache_key_name())
+        ExampleConfig.current().string_field = 'modified'
+        self.assertEquals(ExampleConfig.current().string_field, 'first')
+
+    def test_cleared_on_save(self):
+        ExampleConfig(changed_by=self.user, string_field='second').save()
+        self.assertEquals(ExampleConfig.current().string_field, 'second')
+
+    def test_cleared_by_other_process(self):
+        # Another process saves a new entry: it deletes the shared entry and changes the generation
+        ExampleConfig.objects.bulk_create([ExampleConfig(changed_by=self.user, string_field='second')])
+        self.shared_cache.delete(ExampleConfig.cache_key_name())
+        self.shared_cache.set(GENERATION_CACHE_KEY, 'other', None)
+        self.assertEquals(ExampleConfig.current().string_field, 'second')
+
+    def test_shared_cache_cleared(self):
+        ExampleConfig.objects.bulk_create([ExampleConfig(changed_by=self.user, string_field='second')])
+        self.shared_cache.clear()
+        self.assertEquals(ExampleConfig.current().string_field, 'second')
+
+
 @ddt.ddt
 class ConfigurationModelAPITests(TestCase):
     """
@@ -1,11 +1,30 @@
 """
 Helper functions for caching course assets.
 """
+import fcntl
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
 from django.core.cache import caches
 from django.core.cache.backends.base import InvalidCacheBackendError
 from opaque_keys import InvalidKeyError
+from xmodule.assetstore.assetmgr import AssetManager
+from xmodule.contentstore.content import StaticContentStream
 from . import CONTENTSERVER_VERSION
 
+log = logging.getLogger(__name__)
+
+DEFAULT_DISK_CACHE_MAX_SIZE = 10 * 1024 * 1024 * 1024
+DISK_CACHE_CHUNK_SIZE = 255 * 1024
+# Fraction of the maximum size down to which the disk cache is evicted.
+DISK_CACHE_EVICTION_RATIO = 0.9
+
 # See if there's a "course_assets" cache configured, and if not, fallback to the default cache.
 CONTENT_CACHE = caches['default']
 try:
@@ -14,18 +33,25 @@ except InvalidCacheBackendError:
     pass
 
 
+def _location_str(location):
+    """
+    Force the location to a Unicode string.
+    """
+    return unicode(location).encode("utf-8")
+
+
 def set_cached_content(content):
     """
     Stores the given piece of content in the cache, using its location as the key.
     """
-    CONTENT_CACHE.set(unicode(content.location).encode("utf-8"), content, version=CONTENTSERVER_VERSION)
+    CONTENT_CACHE.set(_location_str(content.location), content, version=CONTENTSERVER_VERSION)
 
 
 def get_cached_content(location):
     """
     Retrieves the given piece of content by its location if cached.
     """
-    return CONTENT_CACHE.get(unicode(location).encode("utf-8"), version=CONTENTSERVER_VERSION)
+    return CONTENT_CACHE.get(_location_str(location), version=CONTENTSERVER_VERSION)
 
 
 def del_cached_content(location):
@@ -35,15 +61,323 @@ def del_cached_content(location):
     It's possible that the content could have been cached without knowing the course_key,
     and so without having the run.
     """
-    def location_str(loc):
-        """Force the location to a Unicode string."""
-        return unicode(loc).encode("utf-8")
-
-    locations = [location_str(location)]
+    locations = [location]
     try:
-        locations.append(location_str(location.replace(run=None)))
+        locations.append(location.replace(run=None))
     except InvalidKeyError:
         # although deprecated keys allowed run=None, new keys don't if there is no version.
         pass
 
-    CONTENT_CACHE.delete_many(locations, version=CONTENTSERVER_VERSION)
+    CONTENT_CACHE.delete_many([_location_str(loc) for loc in locations], version=CONTENTSERVER_VERSION)
+
+    disk_cache = get_disk_cache()
+    if disk_cache is not None:
+        for loc in locations:
+            disk_cache.delete(loc)
+
+
+class DiskCachedContent(StaticContentStream):
+    """
+    An asset served out of the local disk cache.
+    """
+    def __init__(self, content, file_path):
+        super(DiskCachedContent, self).__init__(
+            content.location, content.name, content.content_type, open(file_path, 'rb'),
+            last_modified_at=content.last_modified_at, thumbnail_location=content.thumbnail_location,
+            import_path=content.import_path, length=content.length, locked=content.locked,
+            content_digest=content.content_digest,
+        )
+        self.file_path = file_path
+
+    @property
+    def file(self):
+        """
+        The open file holding the asset's data.
+        """
+        return self._stream
+
+
+class DiskContentCache(object):
+    """
+    A bounded, content-addressed cache of assets on the local disk.
+
+    It sits behind the Django cache for assets too large for memcached.
+    Entries are keyed by the asset location plus the content digest, so a
+    re-uploaded asset is never served from a stale file, even on hosts
+    which didn't see the upload. When the total size of the cached files
+    exceeds the configured maximum, the least recently used files are
+    evicted.
+
+    The cache directory is shared by all the processes of the host, so
+    files are added and evicted while holding an exclusive lock on a file
+    in the directory, and the total size is recounted from the directory
+    each time a file is added. Files are only added once per asset version,
+    so this walk stays rare.
+    """
+    LOCK_FILENAME = '.lock'
+    TEMP_FILE_PREFIX = '.tmp'
+
+    def __init__(self, directory, max_size):
+        self.directory = directory
+        self.max_size = max_size
+        # (location, digest) pairs being written into the cache by this process.
+        self._fills = set()
+        self._fills_lock = threading.Lock()
+
+    def _location_directory(self, location):
+        """
+        Returns the directory holding the cached versions of the asset at the given location.
+        """
+        location_hash = hashlib.md5(_location_str(location)).hexdigest()
+        return os.path.join(self.directory, location_hash[:2], location_hash)
+
+    def _file_path(self, content):
+        """
+        Returns the path of the file caching the given content.
+        """
+        return os.path.join(self._location_directory(content.location), content.content_digest)
+
+    def get(self, content):
+        """
+        Returns a DiskCachedContent serving the given content out of the
+        disk cache, or None if it isn't cached.
+        """
+        if not content.content_digest:
+            return None
+        file_path = self._file_path(content)
+        try:
+            # Mark the file as recently used, for LRU eviction.
+            os.utime(file_path, None)
+            return DiskCachedContent(content, file_path)
+        except (IOError, OSError):
+            return None
+
+    def cache_stream(self, content, chunks):
+        """
+        Yields the given chunks of the streamed content's data, writing them
+        into the disk cache as they are yielded.
+
+        The file is only added to the cache once all of the content's data
+        was yielded, so that concurrent readers never see a partially
+        written asset, and the data of abandoned streams is discarded.
+        """
+        temp_file = temp_path = None
+        if content.content_digest:
+            try:
+                location_directory = self._location_directory(content.location)
+                if not os.path.isdir(location_directory):
+                    os.makedirs(location_directory)
+                file_descriptor, temp_path = tempfile.mkstemp(
+                    prefix=self.TEMP_FILE_PREFIX, dir=location_directory
+                )
+                temp_file = os.fdopen(file_descriptor, 'wb')
+            except (IOError, OSError):
+                log.warning(u'Unable to write %s to the disk cache', unicode(content.location), exc_info=True)
+
+        size = 0
+        complete = False
+        try:
+            for chunk in chunks:
+                if temp_file is not None:
+                    try:
+                        temp_file.write(chunk)
+                        size += len(chunk)
+                    except (IOError, OSError):
+                        log.warning(u'Unable to write %s to the disk cache', unicode(content.location), exc_info=True)
+                        temp_file.close()
+                        _remove_file(temp_path)
+                        temp_file = None
+                yield chunk
+            complete = True
+        finally:
+            if temp_file is not None:
+                temp_file.close()
+                if complete and (content.length is None or size == content.length):
+                    self._add_file(temp_path, self._file_path(content))
+                else:
+                    _remove_file(temp_path)
+
+    def _write(self, content):
+        """
+        Writes all the data of the given streamed content into the disk cache.
+        """
+        for __ in self.cache_stream(content, content.stream_data(chunk_size=DISK_CACHE_CHUNK_SIZE)):
+            pass
+
+    def set(self, content):
+        """
+        Writes the data of the given streamed content into the disk cache and
+        returns a DiskCachedContent serving it, or None if it couldn't be cached.
+        """
+        self._write(content)
+        return self.get(content)
+
+    def fill_in_background(self, content):
+        """
+        Starts writing the given content into the disk cache from a thread,
+        which reads the asset out of the contentstore on its own, so that the
+        cache is filled whatever part of the asset the current request serves.
+
+        Returns the started thread, or None if the content can't be cached or
+        is already being written by this process.
+        """
+        if not content.content_digest:
+            return None
+        fill_key = (_location_str(content.location), content.content_digest)
+        with self._fills_lock:
+            if fill_key in self._fills:
+                return None
+            self._fills.add(fill_key)
+
+        thread = threading.Thread(target=self._fill, args=(content.location, fill_key), name='contentserver-fill')
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def _fill(self, location, fill_key):
+        """
+        Writes the asset at the given location into the disk cache.
+        """
+        try:
+            content = AssetManager.find(location, as_stream=True)
+            try:
+                if self.get(content) is None:
+                    self._write(content)
+            finally:
+                content.close()
+        except Exception:  # pylint: disable=broad-except
+            log.warning(u'Unable to fill the disk cache with %s', unicode(location), exc_info=True)
+        finally:
+            with self._fills_lock:
+                self._fills.discard(fill_key)
+
+    def delete(self, location):
+        """
+        Deletes all the cached versions of the asset at the given location.
+        """
+        shutil.rmtree(self._location_directory(location), ignore_errors=True)
+
+    @contextmanager
+    def _directory_lock(self):
+        """
+        Holds an exclusive lock on the cache directory, across processes.
+        """
+        with open(os.path.join(self.directory, self.LOCK_FILENAME), 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _add_file(self, temp_path, file_path):
+        """
+        Moves the written temporary file into place, and evicts files if the
+        cache went over its maximum size.
+        """
+        try:
+            with self._directory_lock():
+                os.rename(temp_path, file_path)
+                self._evict()
+        except (IOError, OSError):
+            log.warning(u'Unable to move %s into the disk cache', file_path, exc_info=True)
+            _remove_file(temp_path)
+
+    def evict(self):
+        """
+        Deletes the least recently used files until the cache fits in its maximum size.
+        """
+        with self._directory_lock():
+            self._evict()
+
+    def _evict(self):
+        """
+        Deletes the least recently used files until the cache fits in its
+        maximum size. Must be called with the directory lock held.
+        """
+        entries = self._entries()
+        total_size = sum(size for __, size, __ in entries)
+        if total_size > self.max_size:
+            # Evict somewhat below the maximum, so that the following
+            # additions don't each need to evict.
+            target_size = self.max_size * DISK_CACHE_EVICTION_RATIO
+            for __, size, file_path in sorted(entries):
+                if _remove_file(file_path):
+                    total_size -= size
+                if total_size <= target_size:
+                    break
+
+    def _entries(self):
+        """
+        Returns a list of (modification time, size, path) tuples of the
+        cached files, leaving out the lock file and the files being written.
+        """
+        entries = []
+        for dirpath, __, filenames in os.walk(self.directory):
+            for filename in filenames:
+                if filename.startswith('.'):
+                    continue
+                file_path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, file_path))
+        return entries
+
+
+def _remove_file(file_path):
+    """
+    Removes the file at the given path, returning whether it was removed.
+    """
+    try:
+        os.remove(file_path)
+        return True
+    except OSError:
+        return False
+
+
+# The DiskContentCache of each configuration, shared within the process so
+# that an asset is only written into the cache by one thread at a time.
+_disk_caches = {}  # pylint: disable=invalid-name
+
+
+def get_disk_cache():
+    """
+    Returns the DiskContentCache configured by CONTENTSERVER_DISK_CACHE, or
+    None if the disk cache is disabled.
+    """
+    config = getattr(settings, 'CONTENTSERVER_DISK_CACHE', None)
+    if not config:
+        return None
+    cache_config = (config['LOCATION'], config.get('MAX_SIZE', DEFAULT_DISK_CACHE_MAX_SIZE))
+    disk_cache = _disk_caches.get(cache_config)
+    if disk_cache is None:
+        disk_cache = _disk_caches.setdefault(cache_config, DiskContentCache(*cache_config))
+    return disk_cache
+
+
+def get_disk_cached_content(content):
+    """
+    Returns the given streamed content served out of the disk cache if it
+    is cached there, or else the content itself.
+    """
+    disk_cache = get_disk_cache()
+    if disk_cache is None:
+        return content
+
+    cached_content = disk_cache.get(content)
+    if cached_content is None:
+        return content
+
+    content.close()
+    return cached_content
+
+
+def fill_disk_cache(content):
+    """
+    Starts filling the disk cache with the given streamed content in the
+    background, if the disk cache is enabled.
+    """
+    disk_cache = get_disk_cache()
+    if disk_cache is not None:
+        disk_cache.fill_in_background(content)
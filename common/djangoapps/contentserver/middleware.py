@@ -7,17 +7,20 @@ import datetime
 import newrelic.agent
 from django.http import (
     HttpResponse, HttpResponseNotModified, HttpResponseForbidden,
-    HttpResponseBadRequest, HttpResponseNotFound, HttpResponsePermanentRedirect)
+    HttpResponseBadRequest, HttpResponseNotFound, HttpResponsePermanentRedirect,
+    StreamingHttpResponse, FileResponse)
 from student.models import CourseEnrollment
 from contentserver.models import CourseAssetCacheTtlConfig, CdnUserAgentsConfig
 
 from header_control import force_header_for_response
 from xmodule.assetstore.assetmgr import AssetManager
-from xmodule.contentstore.content import StaticContent, XASSET_LOCATION_TAG
+from xmodule.contentstore.content import StaticContent, StaticContentStream, XASSET_LOCATION_TAG
 from xmodule.modulestore import InvalidLocationError
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.locator import AssetLocator
-from .caching import get_cached_content, set_cached_content
+from .caching import (
+    DiskCachedContent, fill_disk_cache, get_cached_content, get_disk_cached_content, set_cached_content
+)
 from xmodule.modulestore.exceptions import ItemNotFoundError
 from xmodule.exceptions import NotFoundError
 
@@ -27,6 +30,10 @@ from xmodule.exceptions import NotFoundError
 log = logging.getLogger(__name__)
 HTTP_DATE_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
 
+# Size of the buffer used to stream assets out of GridFS. It matches the
+# default GridFS chunk size, so each read maps onto a single chunk.
+STREAMING_CHUNK_SIZE = 255 * 1024
+
 
 class StaticContentServer(object):
     """
@@ -75,6 +82,7 @@ class StaticContentServer(object):
             # them to the actual version.
             if requested_digest is not None and actual_digest is not None and (actual_digest != requested_digest):
                 actual_asset_path = StaticContent.add_version_to_asset_path(asset_path, actual_digest)
+                self.close_content(content)
                 return HttpResponsePermanentRedirect(actual_asset_path)
 
             # Set the basics for this request. Make sure that the course key for this
@@ -98,6 +106,7 @@ class StaticContentServer(object):
 
             # Check that user has access to the content.
             if not self.is_user_authorized(request, content, loc):
+                self.close_content(content)
                 return HttpResponseForbidden('Unauthorized')
 
             # Figure out if the client sent us a conditional request, and let them know
@@ -106,8 +115,14 @@ class StaticContentServer(object):
             if 'HTTP_IF_MODIFIED_SINCE' in request.META:
                 if_modified_since = request.META['HTTP_IF_MODIFIED_SINCE']
                 if if_modified_since == last_modified_at_str:
+                    self.close_content(content)
                     return HttpResponseNotModified()
 
+            # Now that the request is known to be authorized, fill the disk cache with
+            # an asset streamed out of the contentstore, whatever range is requested.
+            if isinstance(content, StaticContentStream) and not isinstance(content, DiskCachedContent):
+                fill_disk_cache(content)
+
             # *** File streaming within a byte range ***
             # If a Range is provided, parse Range attribute of the request
             # Add Content-Range in the response if Range is structurally correct
@@ -116,10 +131,6 @@ class StaticContentServer(object):
             # http://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.35
             response = None
             if request.META.get('HTTP_RANGE'):
-                # If we have a StaticContent, get a StaticContentStream.  Can't manipulate the bytes otherwise.
-                if type(content) == StaticContent:
-                    content = AssetManager.find(loc, as_stream=True)
-
                 header_value = request.META['HTTP_RANGE']
                 try:
                     unit, ranges = parse_range_header(header_value, content.length)
@@ -144,7 +155,9 @@ class StaticContentServer(object):
 
                         if 0 <= first <= last < content.length:
                             # If the byte range is satisfiable
-                            response = HttpResponse(content.stream_data_in_range(first, last))
+                            response = self.make_response(content, content.stream_data_in_range(
+                                first, last, chunk_size=STREAMING_CHUNK_SIZE
+                            ))
                             response['Content-Range'] = 'bytes {first}-{last}/{length}'.format(
                                 first=first, last=last, length=content.length
                             )
@@ -156,11 +169,16 @@ class StaticContentServer(object):
                             log.warning(
                                 u"Cannot satisfy ranges in Range header: %s for content: %s", header_value, unicode(loc)
                             )
+                            self.close_content(content)
                             return HttpResponse(status=416)  # Requested Range Not Satisfiable
 
             # If Range header is absent or syntactically invalid return a full content response.
             if response is None:
-                response = HttpResponse(content.stream_data())
+                if isinstance(content, DiskCachedContent):
+                    # Lets the WSGI server send the file with sendfile where available.
+                    response = FileResponse(content.file)
+                else:
+                    response = self.make_response(content, content.stream_data(chunk_size=STREAMING_CHUNK_SIZE))
                 response['Content-Length'] = content.length
 
             newrelic.agent.add_custom_parameter('contentserver.content_len', content.length)
@@ -178,6 +196,27 @@ class StaticContentServer(object):
 
             return response
 
+    @staticmethod
+    def make_response(content, data):
+        """
+        Returns a response serving the given data of the content.
+
+        Content which is streamed from the contentstore is sent with a
+        StreamingHttpResponse, so that large assets are never held in memory
+        as a whole; content which is already in memory is sent as is.
+        """
+        if isinstance(content, StaticContentStream):
+            return StreamingHttpResponse(data)
+        return HttpResponse(data)
+
+    @staticmethod
+    def close_content(content):
+        """
+        Closes the stream of the content, for requests which don't serve its data.
+        """
+        if isinstance(content, StaticContentStream):
+            content.close()
+
     def set_caching_headers(self, content, response):
         """
         Sets caching headers based on whether or not the asset is locked.
@@ -276,6 +315,11 @@ class StaticContentServer(object):
             if content.length is not None and content.length < 1048576:
                 content = content.copy_to_in_mem()
                 set_cached_content(content)
+            else:
+                # Larger assets are served out of the local disk cache instead, if
+                # enabled and already filled, so they don't have to be read out of
+                # GridFS every time.
+                content = get_disk_cached_content(content)
 
         return content
 
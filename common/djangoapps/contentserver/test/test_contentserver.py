@@ -5,8 +5,13 @@ import copy
 
 import datetime
 import ddt
+import hashlib
 import logging
+import os
+import shutil
+import tempfile
 import unittest
+from StringIO import StringIO
 from uuid import uuid4
 
 from django.conf import settings
@@ -16,14 +21,18 @@ from django.test.utils import override_settings
 from mock import patch
 
 from xmodule.contentstore.django import contentstore
-from xmodule.contentstore.content import StaticContent
+from xmodule.contentstore.content import StaticContent, StaticContentStream
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 from xmodule.modulestore.xml_importer import import_course_from_xml
 from xmodule.assetstore.assetmgr import AssetManager
 from opaque_keys import InvalidKeyError
+from opaque_keys.edx.locations import SlashSeparatedCourseKey
 from xmodule.modulestore.exceptions import ItemNotFoundError
 
+from contentserver.caching import (
+    DiskCachedContent, DiskContentCache, fill_disk_cache, get_disk_cached_content
+)
 from contentserver.middleware import parse_range_header, HTTP_DATE_FORMAT, StaticContentServer
 from student.models import CourseEnrollment
 from student.tests.factories import UserFactory, AdminFactory
@@ -204,6 +213,34 @@ class ContentStoreToyCourseTest(SharedModuleStoreTestCase):
             first=first_byte, last=last_byte, length=self.length_unlocked))
         self.assertEqual(resp['Content-Length'], str(last_byte - first_byte + 1))
 
+    @patch.object(StaticContentServer, 'load_asset_from_location', lambda self, loc: AssetManager.find(loc, as_stream=True))
+    def test_range_request_streamed_from_contentstore(self):
+        """
+        Test that a range request for an asset which is too large to be cached
+        is streamed from the contentstore.
+        """
+        first_byte = self.length_unlocked / 4
+        last_byte = self.length_unlocked / 2
+        resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes={first}-{last}'.format(
+            first=first_byte, last=last_byte))
+
+        self.assertEqual(resp.status_code, 206)
+        self.assertTrue(resp.streaming)
+        self.assertEqual(resp['Content-Length'], str(last_byte - first_byte + 1))
+        full_content = AssetManager.find(self.unlocked_asset).data
+        self.assertEqual(''.join(resp.streaming_content), full_content[first_byte:last_byte + 1])
+
+    @patch.object(StaticContentServer, 'load_asset_from_location', lambda self, loc: AssetManager.find(loc, as_stream=True))
+    def test_full_request_streamed_from_contentstore(self):
+        """
+        Test that an asset which is too large to be cached is streamed from the contentstore.
+        """
+        resp = self.client.get(self.url_unlocked)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.streaming)
+        self.assertEqual(resp['Content-Length'], str(self.length_unlocked))
+
     def test_range_request_multiple_ranges(self):
         """
         Test that multiple ranges in request outputs the full content.
@@ -411,3 +448,127 @@ class ParseRangeHeaderTestCase(unittest.TestCase):
         self.assertRaisesRegexp(
             exception_class, exception_message_regex, parse_range_header, header_value, self.content_length
         )
+
+
+class DiskContentCacheTestCase(unittest.TestCase):
+    """
+    Tests for the local disk cache of large assets.
+    """
+    def setUp(self):
+        super(DiskContentCacheTestCase, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.disk_cache = DiskContentCache(self.directory, max_size=1000)
+        self.course_key = SlashSeparatedCourseKey('edX', 'toy', '2012_Fall')
+
+    def _make_content(self, name, data, digest=None):
+        """
+        Returns a StaticContentStream over the given data.
+        """
+        return StaticContentStream(
+            self.course_key.make_asset_key('asset', name), name, 'application/octet-stream', StringIO(data),
+            length=len(data), content_digest=digest or hashlib.md5(data).hexdigest(),
+        )
+
+    def test_miss(self):
+        self.assertIsNone(self.disk_cache.get(self._make_content('video.mp4', 'a' * 100)))
+
+    def test_set_and_get(self):
+        cached_content = self.disk_cache.set(self._make_content('video.mp4', 'a' * 100))
+        self.assertEqual(cached_content.file.read(), 'a' * 100)
+
+        cached_content = self.disk_cache.get(self._make_content('video.mp4', 'a' * 100))
+        self.assertIsInstance(cached_content, DiskCachedContent)
+        self.assertEqual(''.join(cached_content.stream_data_in_range(10, 19)), 'a' * 10)
+
+    def test_new_digest_misses(self):
+        self.disk_cache.set(self._make_content('video.mp4', 'a' * 100))
+        self.assertIsNone(self.disk_cache.get(self._make_content('video.mp4', 'b' * 100)))
+
+    def test_delete(self):
+        self.disk_cache.set(self._make_content('video.mp4', 'a' * 100))
+        self.disk_cache.delete(self.course_key.make_asset_key('asset', 'video.mp4'))
+        self.assertIsNone(self.disk_cache.get(self._make_content('video.mp4', 'a' * 100)))
+
+    def test_lru_eviction(self):
+        self.disk_cache.set(self._make_content('first.mp4', 'a' * 400))
+        self.disk_cache.set(self._make_content('second.mp4', 'b' * 400))
+        # Make the first asset the least recently used one.
+        first_path = self.disk_cache.get(self._make_content('first.mp4', 'a' * 400)).file_path
+        os.utime(first_path, (0, 0))
+
+        self.disk_cache.set(self._make_content('third.mp4', 'c' * 400))
+
+        self.assertIsNone(self.disk_cache.get(self._make_content('first.mp4', 'a' * 400)))
+        self.assertIsNotNone(self.disk_cache.get(self._make_content('second.mp4', 'b' * 400)))
+        self.assertIsNotNone(self.disk_cache.get(self._make_content('third.mp4', 'c' * 400)))
+
+    def test_get_disk_cached_content_disabled(self):
+        content = self._make_content('video.mp4', 'a' * 100)
+        with override_settings(CONTENTSERVER_DISK_CACHE=None):
+            self.assertIs(get_disk_cached_content(content), content)
+
+    def test_cache_stream(self):
+        content = self._make_content('video.mp4', 'a' * 100)
+        chunks = list(self.disk_cache.cache_stream(content, content.stream_data(chunk_size=30)))
+        self.assertEqual(''.join(chunks), 'a' * 100)
+        self.assertEqual(self.disk_cache.get(content).file.read(), 'a' * 100)
+
+    def test_cache_stream_closed_early(self):
+        content = self._make_content('video.mp4', 'a' * 100)
+        chunks = self.disk_cache.cache_stream(content, content.stream_data(chunk_size=30))
+        next(chunks)
+        chunks.close()
+        self.assertIsNone(self.disk_cache.get(content))
+        # The partially written file was discarded.
+        self.assertEqual([filenames for __, __, filenames in os.walk(self.directory) if filenames], [])
+
+    def test_size_shared_between_processes(self):
+        # Each process has its own DiskContentCache over the same directory.
+        other_disk_cache = DiskContentCache(self.directory, max_size=1000)
+        self.disk_cache.set(self._make_content('first.mp4', 'a' * 400))
+        os.utime(self.disk_cache.get(self._make_content('first.mp4', 'a' * 400)).file_path, (0, 0))
+        other_disk_cache.set(self._make_content('second.mp4', 'b' * 400))
+
+        self.disk_cache.set(self._make_content('third.mp4', 'c' * 400))
+
+        self.assertIsNone(other_disk_cache.get(self._make_content('first.mp4', 'a' * 400)))
+        self.assertIsNotNone(other_disk_cache.get(self._make_content('second.mp4', 'b' * 400)))
+
+    @patch('contentserver.caching.AssetManager.find')
+    def test_fill_in_background(self, mock_find):
+        mock_find.side_effect = lambda location, as_stream: self._make_content('video.mp4', 'a' * 100)
+        content = self._make_content('video.mp4', 'a' * 100)
+
+        self.disk_cache.fill_in_background(content).join()
+
+        mock_find.assert_called_once_with(content.location, as_stream=True)
+        self.assertEqual(self.disk_cache.get(content).file.read(), 'a' * 100)
+
+    @patch('contentserver.caching.AssetManager.find')
+    @patch('contentserver.caching.threading.Thread')
+    def test_fill_in_progress(self, mock_thread, mock_find):
+        content = self._make_content('video.mp4', 'a' * 100)
+        self.assertIsNotNone(self.disk_cache.fill_in_background(content))
+        # The first fill hasn't run, so the asset isn't read a second time.
+        self.assertIsNone(self.disk_cache.fill_in_background(content))
+        self.assertEqual(mock_thread.call_count, 1)
+        self.assertFalse(mock_find.called)
+
+    @patch('contentserver.caching.AssetManager.find')
+    def test_get_disk_cached_content(self, mock_find):
+        mock_find.side_effect = lambda location, as_stream: self._make_content('video.mp4', 'a' * 100)
+        content = self._make_content('video.mp4', 'a' * 100)
+        with override_settings(CONTENTSERVER_DISK_CACHE={'LOCATION': self.directory, 'MAX_SIZE': 1000}):
+            # A miss doesn't fill the cache, which is only filled once the request is authorized.
+            self.assertIs(get_disk_cached_content(content), content)
+            self.assertIsNone(self.disk_cache.get(content))
+
+            with patch('contentserver.caching.threading.Thread') as mock_thread:
+                fill_disk_cache(content)
+            # Run the fill in the test's thread.
+            __, kwargs = mock_thread.call_args
+            kwargs['target'](*kwargs['args'])
+
+            cached_content = get_disk_cached_content(self._make_content('video.mp4', 'a' * 100))
+        self.assertIsInstance(cached_content, DiskCachedContent)
@@ -286,22 +286,34 @@ class CourseMode(models.Model):
         """
         now = datetime.now(pytz.UTC)
 
-        found_course_modes = cls.objects.filter(course_id=course_id)
+        # Imported here to avoid a circular import, student.models depends on this module.
+        from student.models import EnrollmentSnapshot
+        snapshot = EnrollmentSnapshot.get_for_current_user()
+        if snapshot is not None:
+            # Answer from the modes kept for the rest of the request, filtered as below.
+            modes = [
+                mode for mode in snapshot.get_course_modes(course_id)
+                if (include_expired or mode.expiration_datetime is None or mode.expiration_datetime >= now) and
+                not (only_selectable and mode.slug in cls.CREDIT_MODES)
+            ]
+        else:
+            found_course_modes = cls.objects.filter(course_id=course_id)
 
-        # Filter out expired course modes if include_expired is not set
-        if not include_expired:
-            found_course_modes = found_course_modes.filter(
-                Q(_expiration_datetime__isnull=True) | Q(_expiration_datetime__gte=now)
-            )
+            # Filter out expired course modes if include_expired is not set
+            if not include_expired:
+                found_course_modes = found_course_modes.filter(
+                    Q(_expiration_datetime__isnull=True) | Q(_expiration_datetime__gte=now)
+                )
+
+            # Credit course modes are currently not shown on the track selection page;
+            # they're available only when students complete a course.  For this reason,
+            # we exclude them from the list if we're only looking for selectable modes
+            # (e.g. on the track selection page or in the payment/verification flows).
+            if only_selectable:
+                found_course_modes = found_course_modes.exclude(mode_slug__in=cls.CREDIT_MODES)
 
-        # Credit course modes are currently not shown on the track selection page;
-        # they're available only when students complete a course.  For this reason,
-        # we exclude them from the list if we're only looking for selectable modes
-        # (e.g. on the track selection page or in the payment/verification flows).
-        if only_selectable:
-            found_course_modes = found_course_modes.exclude(mode_slug__in=cls.CREDIT_MODES)
+            modes = ([mode.to_tuple() for mode in found_course_modes])
 
-        modes = ([mode.to_tuple() for mode in found_course_modes])
         if not modes:
             modes = [cls.DEFAULT_MODE]
 
@@ -0,0 +1,31 @@
+"""
+Precompile the Mako templates of every registered lookup namespace.
+
+The compiled modules are written to the module directory of each lookup
+(under MAKO_MODULE_DIR), together with a manifest that lets freshly
+started workers load them at startup when MAKO_WARM_UP_TEMPLATES is set.
+Run it during deployment, after the code and themes are in place:
+
+    $ ./manage.py lms compile_mako_templates --settings=aws
+"""
+from django.core.management.base import BaseCommand
+
+from edxmako import precompile_lookups
+
+
+class Command(BaseCommand):
+    """
+    Management command to precompile Mako templates into a bundle.
+    """
+
+    help = "Precompile the Mako templates of all lookup namespaces and themes."
+
+    def handle(self, *args, **options):
+        for namespace, (compiled, failed) in sorted(precompile_lookups().items()):
+            self.stdout.write(
+                u"{namespace}: compiled {compiled} templates, skipped {failed} files".format(
+                    namespace=namespace,
+                    compiled=len(compiled),
+                    failed=len(failed),
+                )
+            )
@@ -4,6 +4,8 @@ Set up lookup paths for mako templates.
 
 import hashlib
 import contextlib
+import json
+import logging
 import os
 import pkg_resources
 
@@ -18,6 +20,17 @@ from openedx.core.djangoapps.theming.helpers import (
     strip_site_theme_templates_path,
 )
 
+log = logging.getLogger(__name__)
+
+# Name of the file, written next to the compiled template modules of a
+# lookup, which lists the templates that were precompiled for it.
+BUNDLE_MANIFEST_NAME = 'bundle.json'
+
+# Extensions of the files rendered as Mako templates. The lookup directories
+# also hold Underscore templates, and the theme directories hold sass, js,
+# images and fonts.
+TEMPLATE_EXTENSIONS = ('.html', '.txt', '.xml')
+
 
 class DynamicTemplateLookup(TemplateLookup):
     """
@@ -78,6 +91,104 @@ class DynamicTemplateLookup(TemplateLookup):
 
         return template
 
+    @property
+    def module_directory(self):
+        """
+        The directory the compiled modules of this lookup path are written to.
+        """
+        return self.template_args['module_directory']
+
+    def iter_template_uris(self):
+        """
+        Yield the uri of every template file found in the lookup directories,
+        in lookup order and without duplicates.
+        """
+        seen = set()
+        for directory in self.directories:
+            for dirpath, dirnames, filenames in os.walk(directory):
+                dirnames[:] = [name for name in dirnames if not name.startswith('.')]
+                for filename in filenames:
+                    if filename.startswith('.') or not filename.endswith(TEMPLATE_EXTENSIONS):
+                        continue
+                    uri = os.path.relpath(os.path.join(dirpath, filename), directory).replace(os.sep, '/')
+                    if uri not in seen:
+                        seen.add(uri)
+                        yield uri
+
+    def precompile(self):
+        """
+        Compile every template of the lookup path into the module directory
+        and write a bundle manifest listing them.
+
+        Files which aren't valid Mako templates (e.g. Underscore templates
+        living next to Mako ones) are skipped.
+
+        Returns:
+            (list, list): the uris that were compiled and the uris that failed.
+        """
+        compiled, failed = [], []
+        for uri in self.iter_template_uris():
+            try:
+                # Bypass the theming lookup: every themed template is already
+                # reachable through its own uri in the lookup directories.
+                super(DynamicTemplateLookup, self).get_template(uri)
+            except Exception:  # pylint: disable=broad-except
+                log.debug(u'Unable to compile %s as a Mako template', uri, exc_info=True)
+                failed.append(uri)
+            else:
+                compiled.append(uri)
+
+        manifest = {
+            'revision': getattr(settings, 'EDX_PLATFORM_REVISION', None),
+            'directories': [str(directory) for directory in self.directories],
+            'templates': compiled,
+        }
+        if not os.path.isdir(self.module_directory):
+            os.makedirs(self.module_directory)
+        with open(os.path.join(self.module_directory, BUNDLE_MANIFEST_NAME), 'w') as manifest_file:
+            json.dump(manifest, manifest_file)
+
+        return compiled, failed
+
+    def warm_up(self):
+        """
+        Load the templates of a precompiled bundle into memory.
+
+        Nothing is loaded unless a bundle exists for this lookup path and
+        it was built from the running revision of the code.
+
+        Mako caches templates under the exact uri they were looked up with,
+        so each template is loaded under both forms requests use: the
+        relative uri, as passed to `render_to_string`, produced by relative
+        includes and returned by `get_template_path_with_theme`, and the
+        absolute uri which includes such as `<%include file="/main.html"/>`
+        resolve to.
+
+        Returns:
+            int: the number of templates loaded.
+        """
+        manifest_path = os.path.join(self.module_directory, BUNDLE_MANIFEST_NAME)
+        try:
+            with open(manifest_path) as manifest_file:
+                manifest = json.load(manifest_file)
+        except (IOError, ValueError):
+            return 0
+
+        if manifest.get('revision') != getattr(settings, 'EDX_PLATFORM_REVISION', None):
+            log.info(u'Ignoring Mako template bundle %s built for another revision', manifest_path)
+            return 0
+
+        loaded = 0
+        for uri in manifest.get('templates', []):
+            try:
+                super(DynamicTemplateLookup, self).get_template(uri)
+                super(DynamicTemplateLookup, self).get_template('/' + uri)
+            except Exception:  # pylint: disable=broad-except
+                log.warning(u'Unable to load precompiled Mako template %s', uri, exc_info=True)
+            else:
+                loaded += 1
+        return loaded
+
 
 def clear_lookups(namespace):
     """
@@ -116,6 +227,26 @@ def lookup_template(namespace, name):
     return LOOKUP[namespace].get_template(name)
 
 
+def precompile_lookups():
+    """
+    Compile the templates of every registered namespace into a bundle.
+
+    Returns:
+        dict: the (compiled, failed) template uris, by namespace.
+    """
+    return {namespace: lookup.precompile() for namespace, lookup in LOOKUP.items()}
+
+
+def warm_up_lookups():
+    """
+    Load the precompiled template bundles of every registered namespace.
+
+    Returns:
+        int: the total number of templates loaded.
+    """
+    return sum(lookup.warm_up() for lookup in LOOKUP.values())
+
+
 @contextlib.contextmanager
 def save_lookups():
     """
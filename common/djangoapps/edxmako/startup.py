@@ -2,7 +2,7 @@
 Initialize the mako template lookup
 """
 from django.conf import settings
-from . import add_lookup, clear_lookups
+from . import add_lookup, clear_lookups, warm_up_lookups
 
 
 def run():
@@ -17,3 +17,17 @@ def run():
         clear_lookups(namespace)
         for directory in directories:
             add_lookup(namespace, directory)
+
+
+def warm_up():
+    """
+    Load the templates precompiled by the `compile_mako_templates`
+    management command, so that fresh workers don't pay the compilation
+    cost on their first requests.
+
+    This must be called once all the lookup directories are added, since
+    adding a directory to a lookup discards the templates it loaded: at the
+    end of the lms and cms startup, after the microsite and theme directories.
+    """
+    if getattr(settings, 'MAKO_WARM_UP_TEMPLATES', False):
+        warm_up_lookups()
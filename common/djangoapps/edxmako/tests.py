@@ -1,5 +1,8 @@
 
 from mock import patch, Mock
+import os
+import shutil
+import tempfile
 import unittest
 import ddt
 
@@ -12,6 +15,7 @@ from django.test.client import RequestFactory
 from django.core.urlresolvers import reverse
 from edxmako.request_context import get_template_request_context
 from edxmako import add_lookup, LOOKUP
+from edxmako.paths import DynamicTemplateLookup
 from edxmako.shortcuts import (
     marketing_link,
     is_marketing_link_set,
@@ -81,6 +85,55 @@ class AddLookupTests(TestCase):
         self.assertTrue(dirs[0].endswith('management'))
 
 
+class TemplateBundleTests(TestCase):
+    """
+    Test precompiling templates into a bundle and warming lookups up from it.
+    """
+    def setUp(self):
+        super(TemplateBundleTests, self).setUp()
+        self.template_dir = tempfile.mkdtemp()
+        self.module_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.template_dir)
+        self.addCleanup(shutil.rmtree, self.module_dir)
+
+        os.makedirs(os.path.join(self.template_dir, 'nested'))
+        with open(os.path.join(self.template_dir, 'hello.html'), 'w') as template:
+            template.write('Hello ${name}')
+        with open(os.path.join(self.template_dir, 'nested', 'broken.html'), 'w') as template:
+            template.write('<%def name="broken(">')
+        with open(os.path.join(self.template_dir, 'nested', 'logo.png'), 'w') as image:
+            image.write('not a template')
+
+    def _make_lookup(self):
+        """
+        Returns a lookup over the test template directory.
+        """
+        lookup = DynamicTemplateLookup(module_directory=self.module_dir, input_encoding='utf-8')
+        lookup.add_directory(self.template_dir)
+        return lookup
+
+    def test_precompile(self):
+        compiled, failed = self._make_lookup().precompile()
+        self.assertEqual(compiled, ['hello.html'])
+        self.assertEqual(failed, ['nested/broken.html'])
+
+    def test_warm_up(self):
+        self._make_lookup().precompile()
+        lookup = self._make_lookup()
+        self.assertEqual(lookup.warm_up(), 1)
+        self.assertIn('hello.html', lookup._collection)  # pylint: disable=protected-access
+        self.assertIn('/hello.html', lookup._collection)  # pylint: disable=protected-access
+
+    def test_warm_up_without_bundle(self):
+        self.assertEqual(self._make_lookup().warm_up(), 0)
+
+    def test_warm_up_other_revision(self):
+        with override_settings(EDX_PLATFORM_REVISION='old'):
+            self._make_lookup().precompile()
+        with override_settings(EDX_PLATFORM_REVISION='new'):
+            self.assertEqual(self._make_lookup().warm_up(), 0)
+
+
 class MakoRequestContextTest(TestCase):
     """
     Test MakoMiddleware.
@@ -1,11 +1,17 @@
 """
 Middleware that checks user standing for the purpose of keeping users with
-disabled accounts from accessing the site.
+disabled accounts from accessing the site, and that reports the queries
+saved by enrollment snapshots.
 """
+import logging
+
+import newrelic.agent
 from django.http import HttpResponseForbidden
 from django.utils.translation import ugettext as _
 from django.conf import settings
-from student.models import UserStanding
+from student.models import EnrollmentSnapshot, UserStanding
+
+log = logging.getLogger(__name__)
 
 
 class UserStandingMiddleware(object):
@@ -34,3 +40,20 @@ class UserStandingMiddleware(object):
                     ),
                 )
                 return HttpResponseForbidden(msg)
+
+
+class EnrollmentSnapshotMiddleware(object):
+    """
+    Reports the number of queries saved by the enrollment snapshots of each
+    request, to New Relic and the debug log.
+
+    Must be placed after the RequestCache middleware, so that it runs before
+    the snapshots are cleared at the end of the request.
+    """
+    def process_response(self, request, response):
+        """Report the queries saved by the snapshots of the request."""
+        queries_saved = EnrollmentSnapshot.get_queries_saved()
+        if queries_saved:
+            newrelic.agent.add_custom_parameter('enrollment_snapshot.queries_saved', queries_saved)
+            log.debug(u"Enrollment snapshots saved %d queries on %s", queries_saved, request.path)
+        return response
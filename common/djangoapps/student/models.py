@@ -22,6 +22,7 @@ from urllib import urlencode
 import uuid
 
 import analytics
+import crum
 
 from config_models.models import ConfigurationModel
 from django.utils.translation import ugettext_lazy as _
@@ -46,6 +47,7 @@ from opaque_keys.edx.locations import SlashSeparatedCourseKey
 from simple_history.models import HistoricalRecords
 from track import contexts
 from xmodule_django.models import CourseKeyField, NoneToEmptyManager
+import request_cache
 
 from lms.djangoapps.badges.utils import badges_enabled
 from certificates.models import GeneratedCertificate
@@ -1292,6 +1294,109 @@ class CourseEnrollment(models.Model):
 
         return enrollment
 
+    @classmethod
+    def bulk_enroll(cls, users, course_key, mode=None):
+        """
+        Enroll users in a course, as enroll() does for each of them without
+        check_access, but creating and updating all their enrollments with a
+        fixed number of queries. This saves immediately.
+
+        Returns a dict mapping the id of each user to their CourseEnrollment,
+        and the list of the enrollments which were created or activated.
+
+        `users` is a list of saved Django User objects.
+
+        `course_key` is our usual course_id string (e.g. "edX/Test101/2013_Fall)
+
+        `mode` is the enrollment mode of the users who are not already actively
+               enrolled, the default course mode if None. Users who are already
+               actively enrolled keep their mode.
+
+        No signals or events are sent, so that nothing is sent for enrollments
+        which are rolled back: once the enrollments are committed, the activated
+        ones must be passed to send_bulk_enroll_signals.
+
+        It is expected that this method is called from a method which has already
+        verified the user authentication and access.
+        """
+        if mode is None:
+            mode = _default_course_mode(unicode(course_key))
+        users_by_id = {user.id: user for user in users}
+        old_enrollments = {
+            enrollment.user_id: enrollment
+            for enrollment in cls.objects.filter(course_id=course_key, user_id__in=users_by_id)
+        }
+        reactivated_ids = [
+            enrollment.id for enrollment in old_enrollments.itervalues() if not enrollment.is_active
+        ]
+
+        with transaction.atomic():
+            cls.objects.bulk_create([
+                cls(user=user, course_id=course_key, mode=mode, is_active=True)
+                for user_id, user in users_by_id.iteritems()
+                if user_id not in old_enrollments
+            ])
+            if reactivated_ids:
+                cls.objects.filter(id__in=reactivated_ids).update(is_active=True, mode=mode)
+
+        enrollments = {}
+        activated = []
+        for enrollment in cls.objects.filter(course_id=course_key, user_id__in=users_by_id):
+            enrollment.user = users_by_id[enrollment.user_id]
+            enrollments[enrollment.user_id] = enrollment
+            old_enrollment = old_enrollments.get(enrollment.user_id)
+            if old_enrollment is None or not old_enrollment.is_active:
+                # As set by the pre_save receiver of verified_track_content.
+                enrollment._old_mode = old_enrollment.mode if old_enrollment else None  # pylint: disable=protected-access
+                activated.append(enrollment)
+
+        return enrollments, activated
+
+    @classmethod
+    def send_bulk_enroll_signals(cls, enrollments):
+        """
+        Sends the post_save signal of each of the enrollments created or
+        activated by bulk_enroll, as if it had been saved by itself, so that
+        its receivers (history, forum roles, caches...) keep working, and
+        emits the same events as enroll().
+
+        This must be called once the enrollments are committed. A failure
+        to notify one enrollment is logged, and doesn't stop the others from
+        being notified.
+        """
+        enrollment_counts = defaultdict(int)
+        for enrollment in enrollments:
+            old_mode = enrollment._old_mode  # pylint: disable=protected-access
+            try:
+                models.signals.post_save.send(
+                    sender=cls,
+                    instance=enrollment,
+                    created=old_mode is None,
+                    update_fields=None,
+                    raw=False,
+                    using=enrollment._state.db,  # pylint: disable=protected-access
+                )
+                enrollment.emit_event(EVENT_NAME_ENROLLMENT_ACTIVATED)
+                if enrollment.mode != (old_mode or CourseMode.DEFAULT_MODE_SLUG):
+                    enrollment.emit_event(EVENT_NAME_ENROLLMENT_MODE_CHANGED)
+                if badges_enabled():
+                    from lms.djangoapps.badges.events.course_meta import award_enrollment_badge
+                    award_enrollment_badge(enrollment.user)
+            except Exception:  # pylint: disable=broad-except
+                log.exception(
+                    u"Error while notifying the enrollment of user %s in %s", enrollment.user_id, enrollment.course_id
+                )
+            enrollment_counts[(enrollment.course_id, enrollment.mode)] += 1
+
+        for (course_key, mode), count in enrollment_counts.iteritems():
+            dog_stats_api.increment(
+                "common.student.enrollment",
+                count,
+                tags=[u"org:{}".format(course_key.org),
+                      u"offering:{}".format(course_key.offering),
+                      u"mode:{}".format(mode)]
+            )
+
     @classmethod
     def enroll_by_email(cls, email, course_id, mode=None, ignore_errors=True):
         """
@@ -1391,6 +1496,11 @@ class CourseEnrollment(models.Model):
         if not user.is_authenticated():
             return False
 
+        snapshot = EnrollmentSnapshot.get(user)
+        if snapshot is not None:
+            record = snapshot.get_enrollment(course_key)
+            return record is not None and record.is_active
+
         try:
             record = cls.objects.get(user=user, course_id=course_key)
             return record.is_active
@@ -1437,6 +1547,11 @@ class CourseEnrollment(models.Model):
             and is_active is whether the enrollment is active.
         Returns (None, None) if the courseenrollment record does not exist.
         """
+        snapshot = EnrollmentSnapshot.get(user)
+        if snapshot is not None:
+            record = snapshot.get_enrollment(course_id)
+            return (record.mode, record.is_active) if record is not None else (None, None)
+
         try:
             record = cls.objects.get(user=user, course_id=course_id)
             return (record.mode, record.is_active)
@@ -1566,7 +1681,11 @@ class CourseEnrollment(models.Model):
         Returns: bool
 
         """
-        enrollment = cls.get_enrollment(user, course_key)
+        snapshot = EnrollmentSnapshot.get(user)
+        if snapshot is not None:
+            enrollment = snapshot.get_enrollment(course_key)
+        else:
+            enrollment = cls.get_enrollment(user, course_key)
         return (
             enrollment is not None and
             enrollment.is_active and
@@ -1596,6 +1715,160 @@ def invalidate_enrollment_mode_cache(sender, instance, **kwargs):  # pylint: dis
         unicode(instance.course_id)
     )
     cache.delete(cache_key)
+    EnrollmentSnapshot.invalidate(instance.user_id)
+
+
+class EnrollmentSnapshot(object):
+    """
+    All the CourseEnrollments of a user, loaded with one query and kept for the
+    rest of the current request, so that the enrollment checks made while
+    handling the request need no further queries.
+
+    The snapshot also keeps, each loaded with one query the first time it is
+    needed, the CourseModes of the courses the user is enrolled in, answering
+    CourseMode.modes_for_course, and the user's CourseAccessRoles, answering
+    the checks of student.roles.
+
+    Snapshots are only used while handling a request and when the
+    ENABLE_ENROLLMENT_SNAPSHOT feature is enabled. A snapshot is dropped
+    whenever one of the user's enrollments is saved or deleted, and forgets
+    its roles or modes when one of them is saved or deleted. The number of
+    queries saved by the snapshots of a request is reported at its end by
+    EnrollmentSnapshotMiddleware.
+    """
+    REQUEST_CACHE_NAME = u"student.enrollment_snapshot"
+    STATS_REQUEST_CACHE_NAME = u"student.enrollment_snapshot.stats"
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self._enrollments = {
+            enrollment.course_id: enrollment
+            for enrollment in CourseEnrollment.objects.filter(user_id=user_id)
+        }
+        self._course_modes = None
+        self._role_cache = None
+        self.query_count = 1
+        self.lookup_count = 0
+
+    @property
+    def queries_saved(self):
+        """
+        The number of queries saved so far by the snapshot, i.e. the number of
+        lookups it answered less the queries used to load it.
+        """
+        return max(self.lookup_count - self.query_count, 0)
+
+    def get_enrollment(self, course_key):
+        """
+        Returns the user's CourseEnrollment in the course, or None.
+        """
+        self.lookup_count += 1
+        return self._enrollments.get(course_key)
+
+    def get_course_modes(self, course_key):
+        """
+        Returns the list of all the `Mode`s of the course, including the
+        expired and credit ones.
+
+        The modes of all the courses the user is enrolled in are loaded
+        together, the first time the modes of a course are needed.
+        """
+        if self._course_modes is None:
+            self._course_modes = self._load_course_modes(set(self._enrollments) | {course_key})
+        elif course_key not in self._course_modes:
+            self._course_modes.update(self._load_course_modes([course_key]))
+        self.lookup_count += 1
+        return self._course_modes[course_key]
+
+    def _load_course_modes(self, course_keys):
+        """
+        Returns a dict mapping each of the courses to the list of its `Mode`s.
+        """
+        self.query_count += 1
+        course_modes = {course_key: [] for course_key in course_keys}
+        for course_mode in CourseMode.objects.filter(course_id__in=course_keys):
+            course_modes[course_mode.course_id].append(course_mode.to_tuple())
+        return course_modes
+
+    def get_role_cache(self):
+        """
+        Returns the RoleCache of the user's CourseAccessRoles.
+        """
+        if self._role_cache is None:
+            from student.roles import RoleCache
+            self.query_count += 1
+            self._role_cache = RoleCache(self.user_id)
+        self.lookup_count += 1
+        return self._role_cache
+
+    @classmethod
+    def get(cls, user):
+        """
+        Returns the snapshot of the user's enrollments for the current request,
+        or None if snapshots are not in use.
+        """
+        if not settings.FEATURES.get('ENABLE_ENROLLMENT_SNAPSHOT', False):
+            return None
+        if user is None or user.id is None or crum.get_current_request() is None:
+            return None
+
+        snapshots = request_cache.get_cache(cls.REQUEST_CACHE_NAME)
+        if user.id not in snapshots:
+            snapshots[user.id] = cls(user.id)
+        return snapshots[user.id]
+
+    @classmethod
+    def get_for_current_user(cls):
+        """
+        Returns the snapshot of the enrollments of the user of the current
+        request, or None if snapshots are not in use.
+        """
+        return cls.get(crum.get_current_user())
+
+    @classmethod
+    def invalidate(cls, user_id):
+        """
+        Drops the snapshot of the user's enrollments, if any.
+        """
+        snapshot = request_cache.get_cache(cls.REQUEST_CACHE_NAME).pop(user_id, None)
+        if snapshot is not None:
+            stats = request_cache.get_cache(cls.STATS_REQUEST_CACHE_NAME)
+            stats['queries_saved'] = stats.get('queries_saved', 0) + snapshot.queries_saved
+
+    @classmethod
+    def invalidate_course_modes(cls):
+        """
+        Forgets the course modes of all the snapshots.
+        """
+        for snapshot in request_cache.get_cache(cls.REQUEST_CACHE_NAME).itervalues():
+            snapshot._course_modes = None  # pylint: disable=protected-access
+
+    @classmethod
+    def invalidate_roles(cls, user_id):
+        """
+        Forgets the roles of the snapshot of the user, if any.
+        """
+        snapshot = request_cache.get_cache(cls.REQUEST_CACHE_NAME).get(user_id)
+        if snapshot is not None:
+            snapshot._role_cache = None  # pylint: disable=protected-access
+
+    @classmethod
+    def get_queries_saved(cls):
+        """
+        Returns the number of queries saved by the snapshots of the current
+        request, including the ones which were dropped.
+        """
+        stats = request_cache.get_cache(cls.STATS_REQUEST_CACHE_NAME)
+        return stats.get('queries_saved', 0) + sum(
+            snapshot.queries_saved for snapshot in request_cache.get_cache(cls.REQUEST_CACHE_NAME).itervalues()
+        )
+
+
+@receiver(models.signals.post_save, sender=CourseMode)
+@receiver(models.signals.post_delete, sender=CourseMode)
+def invalidate_snapshot_course_modes(sender, **kwargs):  # pylint: disable=unused-argument
+    """Forget the course modes kept by the enrollment snapshots."""
+    EnrollmentSnapshot.invalidate_course_modes()
 
 
 class ManualEnrollmentAudit(models.Model):
@@ -1622,6 +1895,23 @@ class ManualEnrollmentAudit(models.Model):
             enrollment=enrollment
         )
 
+    @classmethod
+    def bulk_create_manual_enrollment_audits(cls, user, audits, reason):
+        """
+        saves the information of several student manual enrollments, given as
+        (email, state_transition, enrollment) tuples
+        """
+        cls.objects.bulk_create([
+            cls(
+                enrolled_by=user,
+                enrolled_email=email,
+                state_transition=state_transition,
+                reason=reason,
+                enrollment=enrollment
+            )
+            for email, state_transition, enrollment in audits
+        ])
+
     @classmethod
     def get_manual_enrollment_by_email(cls, email):
         """
@@ -1725,6 +2015,13 @@ class CourseAccessRole(models.Model):
         return "[CourseAccessRole] user: {}   role: {}   org: {}   course: {}".format(self.user.username, self.role, self.org, self.course_id)
 
 
+@receiver(models.signals.post_save, sender=CourseAccessRole)
+@receiver(models.signals.post_delete, sender=CourseAccessRole)
+def invalidate_snapshot_roles(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Forget the roles kept by the enrollment snapshot of the role's user."""
+    EnrollmentSnapshot.invalidate_roles(instance.user_id)
+
+
 #### Helper methods for use from python manage.py shell and other classes.
 
 
@@ -8,7 +8,7 @@ from abc import ABCMeta, abstractmethod
 from django.contrib.auth.models import User
 import logging
 
-from student.models import CourseAccessRole
+from student.models import CourseAccessRole, EnrollmentSnapshot
 from xmodule_django.models import CourseKeyField
 
 
@@ -55,6 +55,17 @@ class RoleCache(object):
         )
 
 
+def get_role_cache(user):
+    """
+    Return the RoleCache of the user, shared with the rest of the current
+    request through the user's EnrollmentSnapshot when snapshots are in use.
+    """
+    snapshot = EnrollmentSnapshot.get(user)
+    if snapshot is None:
+        return RoleCache(user)
+    return snapshot.get_role_cache()
+
+
 class AccessRole(object):
     """
     Object representing a role with particular access to a resource
@@ -141,7 +152,7 @@ class RoleBase(AccessRole):
         if not hasattr(user, '_roles'):
             # Cache a list of tuples identifying the particular roles that a user has
             # Stored as tuples, rather than django models, to make it cheaper to construct objects for comparison
-            user._roles = RoleCache(user)
+            user._roles = get_role_cache(user)
 
         return user._roles.has_role(self._role_name, self.course_key, self.org)
 
@@ -341,7 +352,7 @@ class UserBasedRole(object):
 
         # pylint: disable=protected-access
         if not hasattr(self.user, '_roles'):
-            self.user._roles = RoleCache(self.user)
+            self.user._roles = get_role_cache(self.user)
 
         return self.user._roles.has_role(self.role, course_key, course_key.org)
 
@@ -8,13 +8,17 @@ from nose.plugins.attrib import attr
 
 from django.conf import settings
 from django.core.urlresolvers import reverse
+from django.http import HttpResponse
+from django.test.client import RequestFactory
 from course_modes.models import CourseMode
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 from xmodule.modulestore.tests.factories import CourseFactory
 from util.testing import UrlResetMixin
 from embargo.test_utils import restrict_course
 from student.tests.factories import UserFactory, CourseModeFactory, CourseEnrollmentFactory
-from student.models import CourseEnrollment, CourseFullError
+from request_cache.middleware import RequestCache
+from student.middleware import EnrollmentSnapshotMiddleware
+from student.models import CourseEnrollment, CourseFullError, EnrollmentSnapshot
 from student.roles import (
     CourseInstructorRole,
     CourseStaffRole,
@@ -281,3 +285,132 @@ class EnrollmentTest(UrlResetMixin, SharedModuleStoreTestCase):
             params['email_opt_in'] = email_opt_in
 
         return self.client.post(reverse('change_enrollment'), params)
+
+
+@attr('shard_3')
+@patch.dict(settings.FEATURES, {'ENABLE_ENROLLMENT_SNAPSHOT': True})
+class EnrollmentSnapshotTest(SharedModuleStoreTestCase):
+    """
+    Test answering enrollment checks from the per-request enrollment snapshot.
+    """
+    @classmethod
+    def setUpClass(cls):
+        super(EnrollmentSnapshotTest, cls).setUpClass()
+        cls.course = CourseFactory.create()
+        cls.other_course = CourseFactory.create()
+
+    def setUp(self):
+        super(EnrollmentSnapshotTest, self).setUp()
+        self.user = UserFactory.create()
+        CourseEnrollmentFactory.create(user=self.user, course_id=self.course.id, mode=CourseMode.VERIFIED)
+        patcher = patch('student.models.crum.get_current_request', return_value=object())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        RequestCache.clear_request_cache()
+        self.addCleanup(RequestCache.clear_request_cache)
+
+    def test_one_query(self):
+        with self.assertNumQueries(1):
+            self.assertTrue(CourseEnrollment.is_enrolled(self.user, self.course.id))
+            self.assertFalse(CourseEnrollment.is_enrolled(self.user, self.other_course.id))
+            self.assertEqual(
+                CourseEnrollment.enrollment_mode_for_user(self.user, self.course.id),
+                (CourseMode.VERIFIED, True),
+            )
+            self.assertEqual(
+                CourseEnrollment.enrollment_mode_for_user(self.user, self.other_course.id),
+                (None, None),
+            )
+            self.assertTrue(CourseEnrollment.is_enrolled_as_verified(self.user, self.course.id))
+        self.assertEqual(EnrollmentSnapshot.get(self.user).queries_saved, 4)
+
+    def test_invalidated_on_change(self):
+        self.assertFalse(CourseEnrollment.is_enrolled(self.user, self.other_course.id))
+        CourseEnrollment.enroll(self.user, self.other_course.id)
+        self.assertTrue(CourseEnrollment.is_enrolled(self.user, self.other_course.id))
+        CourseEnrollment.unenroll(self.user, self.course.id)
+        self.assertFalse(CourseEnrollment.is_enrolled(self.user, self.course.id))
+
+    @patch.dict(settings.FEATURES, {'ENABLE_ENROLLMENT_SNAPSHOT': False})
+    def test_disabled(self):
+        self.assertIsNone(EnrollmentSnapshot.get(self.user))
+        self.assertTrue(CourseEnrollment.is_enrolled(self.user, self.course.id))
+
+    def test_course_modes(self):
+        CourseModeFactory.create(course_id=self.course.id, mode_slug=CourseMode.VERIFIED)
+        CourseModeFactory.create(course_id=self.course.id, mode_slug=CourseMode.AUDIT)
+        with patch('student.models.crum.get_current_user', return_value=self.user):
+            # The modes of the courses the user is enrolled in are loaded with the first ones needed
+            with self.assertNumQueries(2):
+                self.assertEqual(CourseMode.modes_for_course(self.other_course.id), [CourseMode.DEFAULT_MODE])
+                self.assertEqual(len(CourseMode.modes_for_course(self.course.id)), 2)
+                self.assertEqual(len(CourseMode.modes_for_course(self.course.id)), 2)
+            # The modes are loaded again once changed
+            CourseModeFactory.create(course_id=self.course.id, mode_slug=CourseMode.HONOR)
+            self.assertEqual(len(CourseMode.modes_for_course(self.course.id)), 3)
+
+    def test_roles(self):
+        CourseStaffRole(self.course.id).add_users(self.user)
+        RequestCache.clear_request_cache()
+        with self.assertNumQueries(2):
+            self.assertTrue(CourseStaffRole(self.course.id).has_user(self.user))
+            del self.user._roles  # pylint: disable=protected-access
+            self.assertFalse(CourseInstructorRole(self.course.id).has_user(self.user))
+        # The roles are loaded again once changed
+        CourseInstructorRole(self.course.id).add_users(self.user)
+        self.assertTrue(CourseInstructorRole(self.course.id).has_user(self.user))
+
+    @patch('student.middleware.newrelic.agent.add_custom_parameter')
+    def test_queries_saved_reported(self, mock_add_custom_parameter):
+        for __ in range(3):
+            CourseEnrollment.is_enrolled(self.user, self.course.id)
+        # The queries saved by invalidated snapshots are reported too
+        CourseEnrollmentFactory.create(user=self.user, course_id=self.other_course.id)
+        CourseEnrollment.is_enrolled(self.user, self.other_course.id)
+        CourseEnrollment.is_enrolled(self.user, self.other_course.id)
+
+        EnrollmentSnapshotMiddleware().process_response(RequestFactory().get('/'), HttpResponse())
+
+        mock_add_custom_parameter.assert_called_once_with('enrollment_snapshot.queries_saved', 3)
+
+
+@attr('shard_3')
+class BulkEnrollTest(SharedModuleStoreTestCase):
+    """
+    Test enrolling several users at once.
+    """
+    @classmethod
+    def setUpClass(cls):
+        super(BulkEnrollTest, cls).setUpClass()
+        cls.course = CourseFactory.create()
+
+    def setUp(self):
+        super(BulkEnrollTest, self).setUp()
+        self.users = [UserFactory.create() for __ in range(3)]
+        CourseEnrollment.enroll(self.users[0], self.course.id, mode=CourseMode.VERIFIED)
+        CourseEnrollment.enroll(self.users[1], self.course.id, mode=CourseMode.VERIFIED)
+        CourseEnrollment.unenroll(self.users[1], self.course.id)
+
+    @patch('student.models.CourseEnrollment.emit_event')
+    def test_bulk_enroll(self, mock_emit_event):
+        enrollments, activated = CourseEnrollment.bulk_enroll(self.users, self.course.id, mode=CourseMode.HONOR)
+        # Nothing is sent until the enrollments are committed
+        self.assertFalse(mock_emit_event.called)
+        self.assertEqual({enrollment.user_id for enrollment in activated}, {self.users[1].id, self.users[2].id})
+        CourseEnrollment.send_bulk_enroll_signals(activated)
+
+        self.assertEqual(set(enrollments), {user.id for user in self.users})
+        self.assertEqual(
+            [CourseEnrollment.enrollment_mode_for_user(user, self.course.id) for user in self.users],
+            [(CourseMode.VERIFIED, True), (CourseMode.HONOR, True), (CourseMode.HONOR, True)],
+        )
+        # The enrollment history is recorded as for single enrollments
+        self.assertEqual(enrollments[self.users[2].id].history.count(), 1)
+        # Only the users who were not enrolled are activated, and both changed mode
+        self.assertEqual(mock_emit_event.call_count, 4)
+
+    def test_bulk_enroll_again(self):
+        CourseEnrollment.bulk_enroll(self.users, self.course.id)
+        enrollments, activated = CourseEnrollment.bulk_enroll(self.users, self.course.id)
+        self.assertEqual(activated, [])
+        self.assertTrue(all(enrollment.is_active for enrollment in enrollments.values()))
@@ -25,3 +25,14 @@ class BaseBackend(object):
     def send(self, event):
         """Send event to tracker."""
         pass
+
+    def send_batch(self, events):
+        """
+        Send a list of events to tracker.
+
+        Backends which can store several events at once should override
+        this to do so. Unlike `send`, overrides should let errors propagate,
+        so that callers can account for the events which were lost.
+        """
+        for event in events:
+            self.send(event)
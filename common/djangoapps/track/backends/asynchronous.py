@@ -0,0 +1,204 @@
+"""
+Event tracker backend that sends events to other backends in batches,
+from a background thread.
+
+Events are put in a bounded in-process queue on the request thread. A
+flusher thread takes them off the queue and hands them over to the wrapped
+backends in batches, when either `batch_size` events are waiting or
+`flush_interval` seconds went by since the first of them was queued.
+
+The backends to wrap are configured like the tracker backends::
+
+  TRACKING_BACKENDS = {
+      'async_mongo': {
+          'ENGINE': 'track.backends.asynchronous.AsyncBackend',
+          'OPTIONS': {
+              'backends': {
+                  'mongo': {
+                      'ENGINE': 'track.backends.mongodb.MongoBackend',
+                      'OPTIONS': {...},
+                  },
+              },
+              'max_queue_size': 10000,
+              'batch_size': 100,
+              'flush_interval': 1.0,
+              'overflow_policy': 'drop',
+          }
+      }
+  }
+
+When the queue is full, the `drop` policy discards new events right away,
+while the `block` policy makes the request thread wait up to
+`block_timeout` seconds for room in the queue before discarding them.
+
+"""
+
+from __future__ import absolute_import
+
+import atexit
+import logging
+import os
+import threading
+import time
+from Queue import Queue, Empty, Full
+
+from dogapi import dog_stats_api
+from django.db import close_old_connections
+
+from track.backends import BaseBackend
+
+
+log = logging.getLogger(__name__)
+
+OVERFLOW_DROP = 'drop'
+OVERFLOW_BLOCK = 'block'
+
+
+class AsyncBackend(BaseBackend):
+    """Event tracker backend that sends events to other backends asynchronously, in batches"""
+
+    def __init__(self, backends=None, max_queue_size=10000, batch_size=100, flush_interval=1.0,
+                 overflow_policy=OVERFLOW_DROP, block_timeout=0.1, **kwargs):
+        """
+        :Parameters:
+
+          - `backends`: configuration of the backends to send the events to
+          - `max_queue_size`: maximum number of events waiting to be sent
+          - `batch_size`: maximum number of events sent to the backends at once
+          - `flush_interval`: maximum number of seconds an event waits for its
+            batch to fill up
+          - `overflow_policy`: what to do with events when the queue is full,
+            either 'drop' or 'block'
+          - `block_timeout`: number of seconds to wait for room in the queue
+            with the 'block' policy
+
+        """
+        super(AsyncBackend, self).__init__(**kwargs)
+
+        if overflow_policy not in (OVERFLOW_DROP, OVERFLOW_BLOCK):
+            raise ValueError('Invalid overflow policy {}'.format(overflow_policy))
+
+        # Imported here because the tracker instantiates its backends on import.
+        from track.tracker import _instantiate_backend_from_name  # pylint: disable=protected-access
+
+        self.backends = {
+            name: _instantiate_backend_from_name(values['ENGINE'], values.get('OPTIONS', {}))
+            for name, values in (backends or {}).iteritems()
+            if values
+        }
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+
+        self.queue = Queue(maxsize=max_queue_size)
+        self.dropped_count = 0
+        self.sent_count = 0
+        self.failed_count = 0
+
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._thread_pid = None
+        atexit.register(self.flush)
+
+    def send(self, event):
+        """Queue the event to be sent by the flusher thread."""
+        self._ensure_flusher_thread()
+        try:
+            if self.overflow_policy == OVERFLOW_BLOCK:
+                self.queue.put(event, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(event)
+        except Full:
+            self.dropped_count += 1
+            dog_stats_api.increment('track.async.dropped')
+
+    def _ensure_flusher_thread(self):
+        """
+        Start the flusher thread unless it's already running in this process.
+
+        Threads don't survive a fork, so pre-forking servers get a new
+        flusher thread in each worker.
+        """
+        if self._thread is not None and self._thread_pid == os.getpid() and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name='track-async-flusher')
+        self._thread.daemon = True
+        self._thread_pid = os.getpid()
+        self._thread.start()
+
+    def _run(self):
+        """Main loop of the flusher thread."""
+        while True:
+            batch = self._next_batch()
+            if batch:
+                # Backends may use the database, and no request cycle closes the
+                # connections of this thread: drop the ones which went stale
+                # while waiting for events, or which the batch left unusable.
+                close_old_connections()
+                try:
+                    self._send_batch(batch)
+                except Exception:  # pylint: disable=broad-except
+                    # Never let the flusher thread die.
+                    log.exception('Error sending batch of tracking events')
+                finally:
+                    close_old_connections()
+
+    def _next_batch(self):
+        """
+        Wait for the next batch of events: up to `batch_size` events, taken
+        within `flush_interval` seconds from the first one.
+        """
+        batch = [self.queue.get()]
+        deadline = time.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except Empty:
+                break
+        return batch
+
+    def _send_batch(self, batch):
+        """
+        Send a batch of events to every wrapped backend.
+
+        The events are counted as sent if every backend accepted them, and as
+        failed if any backend raised an error, as `send_batch` is expected to
+        do when it can't store the events.
+        """
+        dog_stats_api.gauge('track.async.queue_depth', self.queue.qsize())
+        succeeded = True
+        with self._flush_lock:
+            with dog_stats_api.timer('track.async.flush'):
+                for name, backend in self.backends.iteritems():
+                    with dog_stats_api.timer('track.async.flush.backend.{0}'.format(name)):
+                        try:
+                            backend.send_batch(batch)
+                        except Exception:  # pylint: disable=broad-except
+                            log.exception('Error sending tracking events to backend %s', name)
+                            dog_stats_api.increment('track.async.backend.{0}.failed'.format(name), len(batch))
+                            succeeded = False
+            if succeeded:
+                self.sent_count += len(batch)
+            else:
+                self.failed_count += len(batch)
+        if succeeded:
+            dog_stats_api.increment('track.async.sent', len(batch))
+        else:
+            dog_stats_api.increment('track.async.failed', len(batch))
+
+    def flush(self):
+        """Synchronously send all the events currently in the queue."""
+        while True:
+            batch = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except Empty:
+                    break
+            if not batch:
+                return
+            self._send_batch(batch)
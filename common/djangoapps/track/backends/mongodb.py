@@ -97,3 +97,14 @@ class MongoBackend(BaseBackend):
             # during the next event.
             msg = 'Error inserting to MongoDB event tracker backend'
             log.exception(msg)
+
+    def send_batch(self, events):
+        """
+        Insert the events in to the Mongo collection with a single bulk insert.
+
+        Errors are raised rather than logged, so that the caller knows the
+        batch was lost.
+        """
+        if not events:
+            return
+        self.collection.insert(events, manipulate=False, continue_on_error=True)
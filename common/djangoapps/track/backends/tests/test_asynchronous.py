@@ -0,0 +1,111 @@
+"""
+Tests for the asynchronous event tracker backend.
+"""
+from __future__ import absolute_import
+
+from django.test import TestCase
+from mock import patch
+
+from track.backends import BaseBackend
+from track.backends.asynchronous import AsyncBackend
+
+
+class InMemoryBackend(BaseBackend):
+    """A backend that keeps the batches it receives"""
+    def __init__(self, **kwargs):
+        super(InMemoryBackend, self).__init__(**kwargs)
+        self.batches = []
+
+    def send(self, event):
+        self.batches.append([event])
+
+    def send_batch(self, events):
+        self.batches.append(list(events))
+
+
+class FailingBackend(BaseBackend):
+    """A backend that fails to send any event"""
+    def send(self, event):
+        raise Exception('Failed to send event')
+
+
+BACKENDS = {
+    'memory': {
+        'ENGINE': 'track.backends.tests.test_asynchronous.InMemoryBackend',
+    }
+}
+
+
+class TestAsyncBackend(TestCase):
+    """
+    Tests for queueing events and sending them to the wrapped backends in batches.
+    """
+    def _make_backend(self, **kwargs):
+        backend = AsyncBackend(backends=BACKENDS, **kwargs)
+        # Don't start the flusher thread, the tests flush synchronously.
+        backend._ensure_flusher_thread = lambda: None  # pylint: disable=protected-access
+        return backend
+
+    def test_batches(self):
+        backend = self._make_backend(batch_size=2)
+        for index in range(5):
+            backend.send({'test': index})
+
+        backend.flush()
+
+        self.assertEqual(
+            backend.backends['memory'].batches,
+            [[{'test': 0}, {'test': 1}], [{'test': 2}, {'test': 3}], [{'test': 4}]]
+        )
+        self.assertEqual(backend.sent_count, 5)
+
+    def test_failed_batches(self):
+        backend = AsyncBackend(backends=dict(BACKENDS, failing={
+            'ENGINE': 'track.backends.tests.test_asynchronous.FailingBackend',
+        }), batch_size=2)
+        backend._ensure_flusher_thread = lambda: None  # pylint: disable=protected-access
+        for index in range(3):
+            backend.send({'test': index})
+
+        backend.flush()
+
+        # The other backends still get the events
+        self.assertEqual(backend.backends['memory'].batches, [[{'test': 0}, {'test': 1}], [{'test': 2}]])
+        self.assertEqual(backend.sent_count, 0)
+        self.assertEqual(backend.failed_count, 3)
+
+    def test_drop_when_full(self):
+        backend = self._make_backend(max_queue_size=2)
+        for index in range(3):
+            backend.send({'test': index})
+
+        backend.flush()
+
+        self.assertEqual(backend.backends['memory'].batches, [[{'test': 0}, {'test': 1}]])
+        self.assertEqual(backend.dropped_count, 1)
+
+    def test_block_when_full(self):
+        backend = self._make_backend(max_queue_size=1, overflow_policy='block', block_timeout=0.01)
+        backend.send({'test': 0})
+        backend.send({'test': 1})
+
+        self.assertEqual(backend.dropped_count, 1)
+
+    def test_invalid_overflow_policy(self):
+        with self.assertRaises(ValueError):
+            AsyncBackend(backends=BACKENDS, overflow_policy='invalid')
+
+    @patch('track.backends.asynchronous.close_old_connections')
+    def test_flusher_thread(self, mock_close_old_connections):
+        backend = AsyncBackend(backends=BACKENDS, batch_size=2, flush_interval=5)
+        backend.send({'test': 0})
+        backend.send({'test': 1})
+
+        for __ in range(100):
+            if backend.sent_count == 2:
+                break
+            backend._thread.join(0.01)  # pylint: disable=protected-access
+
+        self.assertEqual(backend.backends['memory'].batches, [[{'test': 0}, {'test': 1}]])
+        # The flusher thread closes its stale database connections around each batch.
+        self.assertTrue(mock_close_old_connections.called)
@@ -17,7 +17,7 @@ from xmodule.editing_module import EditingDescriptor
 from xmodule.edxnotes_utils import edxnotes
 from xmodule.html_checker import check_html
 from xmodule.stringify import stringify_children
-from xmodule.x_module import XModule, DEPRECATION_VSCOMPAT_EVENT
+from xmodule.x_module import XModule, DEPRECATION_VSCOMPAT_EVENT, STUDENT_VIEW
 from xmodule.xml_module import XmlDescriptor, name_to_pathname
 from xblock.core import XBlock
 from xblock.fields import Scope, String, Boolean, List
@@ -68,6 +68,16 @@ class HtmlBlock(object):
         scope=Scope.settings
     )
 
+    @property
+    def user_independent_views(self):
+        """
+        The views whose output can be shared between users. The student view
+        only depends on the user when the content uses %%USER_ID%% substitution.
+        """
+        if "%%USER_ID%%" in self.data:  # pylint: disable=no-member
+            return ()
+        return (STUDENT_VIEW,)
+
     @XBlock.supports("multi_device")
     def student_view(self, _context):
         """
@@ -22,6 +22,7 @@ from xblock.plugin import default_select
 from .exceptions import InvalidLocationError, InsufficientSpecificationError
 from xmodule.errortracker import make_error_tracker
 from xmodule.assetstore import AssetMetadata
+from xmodule.modulestore.structure_diff import StructureDiff
 from opaque_keys.edx.keys import CourseKey, UsageKey, AssetKey
 from opaque_keys.edx.locations import Location  # For import backwards compatibility
 from xblock.runtime import Mixologist
@@ -123,6 +124,8 @@ class BulkOpsRecord(object):
         self._active_count = 0
         self.has_publish_item = False
         self.has_library_updated_item = False
+        # the StructureDiffs (or None when unknown) of the publishes done during the bulk operation
+        self.structure_diffs = []
 
     @property
     def active(self):
@@ -319,8 +322,13 @@ class BulkOperationsMixin(object):
         """
         if self.signal_handler and bulk_ops_record.has_publish_item:
             # We remove the branch, because publishing always means copying from draft to published
-            self.signal_handler.send("course_published", course_key=course_id.for_branch(None))
+            self.signal_handler.send(
+                "course_published",
+                course_key=course_id.for_branch(None),
+                structure_diff=StructureDiff.combine(bulk_ops_record.structure_diffs),
+            )
             bulk_ops_record.has_publish_item = False
+            bulk_ops_record.structure_diffs = []
 
     def send_bulk_library_updated_signal(self, bulk_ops_record, library_id):
         """
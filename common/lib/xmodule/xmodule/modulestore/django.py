@@ -87,9 +87,13 @@ class SignalHandler(object):
     5. The thing that listens for the signal lives in process, but should do
        almost no work. Its main job is to kick off the celery task that will
        do the actual work.
+    6. course_published also sends a `structure_diff` with the blocks which were
+       added, removed and changed by the publish (see StructureDiff), or None
+       when the modulestore can't tell. A diff which is empty means nothing
+       in the published course changed.
     """
     pre_publish = django.dispatch.Signal(providing_args=["course_key"])
-    course_published = django.dispatch.Signal(providing_args=["course_key"])
+    course_published = django.dispatch.Signal(providing_args=["course_key", "structure_diff"])
     course_deleted = django.dispatch.Signal(providing_args=["course_key"])
     library_updated = django.dispatch.Signal(providing_args=["library_key"])
     item_deleted = django.dispatch.Signal(providing_args=["usage_key", "user_id"])
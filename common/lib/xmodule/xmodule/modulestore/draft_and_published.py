@@ -117,7 +117,7 @@ class ModuleStoreDraftAndPublished(BranchSettingMixin, BulkOperationsMixin):
         """
         raise NotImplementedError
 
-    def _flag_publish_event(self, course_key):
+    def _flag_publish_event(self, course_key, structure_diff=None):
         """
         Wrapper around calls to fire the course_published signal
         Unless we're nested in an active bulk operation, this simply fires the signal
@@ -125,14 +125,18 @@ class ModuleStoreDraftAndPublished(BranchSettingMixin, BulkOperationsMixin):
 
         Arguments:
             course_key - course_key to which the signal applies
+            structure_diff - the StructureDiff of the published branch, if known
         """
         if self.signal_handler:
             bulk_record = self._get_bulk_ops_record(course_key) if isinstance(self, BulkOperationsMixin) else None
             if bulk_record and bulk_record.active:
                 bulk_record.has_publish_item = True
+                bulk_record.structure_diffs.append(structure_diff)
             else:
                 # We remove the branch, because publishing always means copying from draft to published
-                self.signal_handler.send("course_published", course_key=course_key.for_branch(None))
+                self.signal_handler.send(
+                    "course_published", course_key=course_key.for_branch(None), structure_diff=structure_diff
+                )
 
 
 class UnsupportedRevisionError(ValueError):
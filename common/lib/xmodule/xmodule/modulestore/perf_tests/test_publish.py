@@ -0,0 +1,86 @@
+"""
+Performance test for publishing a small edit in a large split course.
+"""
+import unittest
+
+from nose.plugins.skip import SkipTest
+from xmodule.modulestore import ModuleStoreEnum
+from xmodule.modulestore.tests.utils import SPLIT_MODULESTORE_SETUP
+
+# The dependency below needs to be installed manually from the development.txt file, which doesn't
+# get installed during unit tests!
+try:
+    from code_block_timer import CodeBlockTimer
+except ImportError:
+    CodeBlockTimer = None
+
+# Number of children of each chapter, sequential and vertical: with 10 chapters,
+# the course has 10 + 100 + 1000 verticals + 2000 html blocks, about 3k blocks.
+BRANCHING = (10, 10, 10, 2)
+BLOCK_TYPES = ('chapter', 'sequential', 'vertical', 'html')
+
+# Number of times the one-unit edit is published.
+PUBLISH_COUNT = 10
+
+USER_ID = ModuleStoreEnum.UserID.test
+
+
+# Eventually, exclude this attribute from regular unittests while running *only* tests
+# with this attribute during regular performance tests.
+# @attr("perf_test")
+@unittest.skip
+class PublishUnitTest(unittest.TestCase):
+    """
+    This class exists to time publishing a single edited unit of a course with
+    about 3000 blocks in split.
+    """
+
+    # Use this attribute to skip this test on regular unittest CI runs.
+    perf_test = True
+
+    def _populate_course(self, store, course):
+        """
+        Adds the chapters, sequentials, verticals and html blocks to the course, and
+        returns the usage keys of the last vertical and of its first html block.
+        """
+        def descend(parent_location, depth):  # pylint: disable=missing-docstring
+            last = None
+            for index in range(BRANCHING[depth]):
+                child = store.create_child(
+                    USER_ID, parent_location, BLOCK_TYPES[depth],
+                    fields={'display_name': u'{} {}'.format(BLOCK_TYPES[depth], index)},
+                )
+                if depth + 1 < len(BLOCK_TYPES):
+                    last = descend(child.location, depth + 1)
+                elif last is None:
+                    last = (parent_location, child.location)
+            return last
+
+        with store.bulk_operations(course.id, emit_signals=False):
+            return descend(course.location, 0)
+
+    def test_publish_one_unit(self):
+        """
+        Generate timings for publishing a one-unit edit.
+        """
+        if CodeBlockTimer is None:
+            raise SkipTest("CodeBlockTimer undefined.")
+
+        with SPLIT_MODULESTORE_SETUP.build() as (__, store):
+            with store.branch_setting(ModuleStoreEnum.Branch.draft_preferred):
+                course = store.create_course('org', 'course', 'run', USER_ID)
+                vertical_location, html_location = self._populate_course(store, course)
+
+                with CodeBlockTimer("PublishUnit:initial_publish"):
+                    store.publish(course.location, USER_ID)
+
+                for index in range(PUBLISH_COUNT):
+                    html = store.get_item(html_location)
+                    html.data = u'<p>Edit {}</p>'.format(index)
+                    store.update_item(html, USER_ID)
+
+                    with CodeBlockTimer("PublishUnit:publish_edited_unit"):
+                        store.publish(vertical_location, USER_ID)
+
+                with CodeBlockTimer("PublishUnit:republish_unchanged_course"):
+                    store.publish(course.location, USER_ID)
@@ -85,38 +85,83 @@ def path_to_location(modulestore, usage_key, full_path=False):
         if full_path:
             return path
 
-        n = len(path)
-        course_id = path[0].course_key
-        # pull out the location names
-        chapter = path[1].name if n > 1 else None
-        section = path[2].name if n > 2 else None
-        vertical = path[3].name if n > 3 else None
-        # Figure out the position
-        position = None
-
-        # This block of code will find the position of a module within a nested tree
-        # of modules. If a problem is on tab 2 of a sequence that's on tab 3 of a
-        # sequence, the resulting position is 3_2. However, no positional modules
-        # (e.g. sequential and videosequence) currently deal with this form of
-        # representing nested positions. This needs to happen before jumping to a
-        # module nested in more than one positional module will work.
-        if n > 3:
-            position_list = []
-            for path_index in range(2, n - 1):
-                category = path[path_index].block_type
-                if category == 'sequential' or category == 'videosequence':
-                    section_desc = modulestore.get_item(path[path_index])
-                    # this calls get_children rather than just children b/c old mongo includes private children
-                    # in children but not in get_children
-                    child_locs = [c.location for c in section_desc.get_children()]
-                    # positions are 1-indexed, and should be strings to be consistent with
-                    # url parsing.
-                    position_list.append(str(child_locs.index(path[path_index + 1]) + 1))
-            position = "_".join(position_list)
+        def child_position(parent, child):
+            """
+            Returns the 1-based position of child among the children of parent.
+            """
+            section_desc = modulestore.get_item(parent)
+            # this calls get_children rather than just children b/c old mongo includes private children
+            # in children but not in get_children
+            child_locs = [c.location for c in section_desc.get_children()]
+            return child_locs.index(child) + 1
+
+        return location_from_path(path, child_position)
+
+
+def location_from_path(path, child_position):
+    """
+    Returns the location tuple returned by path_to_location for a full path.
+
+    Args:
+        path: the list of usage keys from the course to the target location.
+        child_position: a function taking the usage keys of a block and of one of its
+            children and returning the 1-based position of the child among the children
+            of the block.
+
+    Returns:
+        a tuple (course_id, chapter, section, vertical, position, final_target_id)
+    """
+    n = len(path)
+    course_id = path[0].course_key
+    # pull out the location names
+    chapter = path[1].name if n > 1 else None
+    section = path[2].name if n > 2 else None
+    vertical = path[3].name if n > 3 else None
+    # Figure out the position
+    position = None
+
+    # This block of code will find the position of a module within a nested tree
+    # of modules. If a problem is on tab 2 of a sequence that's on tab 3 of a
+    # sequence, the resulting position is 3_2. However, no positional modules
+    # (e.g. sequential and videosequence) currently deal with this form of
+    # representing nested positions. This needs to happen before jumping to a
+    # module nested in more than one positional module will work.
+    if n > 3:
+        position_list = []
+        for path_index in range(2, n - 1):
+            category = path[path_index].block_type
+            if category == 'sequential' or category == 'videosequence':
+                # positions are 1-indexed, and should be strings to be consistent with
+                # url parsing.
+                position_list.append(str(child_position(path[path_index], path[path_index + 1])))
+        position = "_".join(position_list)
 
     return (course_id, chapter, section, vertical, position, path[-1])
 
 
+def paths_to_locations(modulestore, usage_keys, full_path=False):
+    """
+    Bulk version of path_to_location, which only enters one bulk operation per course.
+
+    Returns:
+        a dict mapping each of the given usage keys to its result from path_to_location.
+        Usage keys which don't exist or have no path are left out.
+    """
+    usage_keys_by_course = {}
+    for usage_key in usage_keys:
+        usage_keys_by_course.setdefault(usage_key.course_key, []).append(usage_key)
+
+    locations = {}
+    for course_key, course_usage_keys in usage_keys_by_course.iteritems():
+        with modulestore.bulk_operations(course_key):
+            for usage_key in course_usage_keys:
+                try:
+                    locations[usage_key] = path_to_location(modulestore, usage_key, full_path)
+                except (ItemNotFoundError, NoPathToItem):
+                    LOGGER.info(u'No path to location %s', usage_key)
+    return locations
+
+
 def navigation_index(position):
     """
     Get the navigation index from the position argument (where the position argument was recieved from a call to
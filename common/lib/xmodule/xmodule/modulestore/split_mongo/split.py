@@ -84,6 +84,8 @@ from ..exceptions import ItemNotFoundError
 from .caching_descriptor_system import CachingDescriptorSystem
 from xmodule.modulestore.split_mongo.mongo_connection import MongoConnection, DuplicateKeyError
 from xmodule.modulestore.split_mongo import BlockKey, CourseEnvelope
+from xmodule.modulestore.split_mongo.structure_index import StructureIndex
+from xmodule.modulestore.structure_diff import StructureDiff
 from xmodule.modulestore.store_utilities import DETACHED_XBLOCK_TYPES
 from xmodule.error_module import ErrorDescriptor
 from collections import defaultdict
@@ -814,8 +816,31 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                 del self.request_cache.data.setdefault('course_cache', {})[course_version_guid]
             except KeyError:
                 pass
+            self.request_cache.data.setdefault('structure_index_cache', {}).pop(course_version_guid, None)
         else:
             self.request_cache.data['course_cache'] = {}
+            self.request_cache.data['structure_index_cache'] = {}
+
+    def _get_structure_index(self, course):
+        """
+        Returns the StructureIndex of the structure of the given course entry, reusing the
+        one built earlier in this request for the same structure version.
+        :param course: a CourseEnvelope
+        """
+        structure = course.structure
+        bulk_write_record = self._get_bulk_ops_record(course.course_key)
+        if bulk_write_record.active and structure['_id'] not in bulk_write_record.structures_in_db:
+            # the structure is still being built, so it may change underneath the index
+            return StructureIndex(structure)
+
+        if self.request_cache is None:
+            return StructureIndex(structure)
+
+        index_cache = self.request_cache.data.setdefault('structure_index_cache', {})
+        index = index_cache.get(structure['_id'])
+        if index is None:
+            index = index_cache[structure['_id']] = StructureIndex(structure)
+        return index
 
     def _lookup_course(self, course_key, head_validation=True):
         """
@@ -1175,18 +1200,12 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
 
         def _block_matches_all(block_data):
             """
-            Check that the block matches all the criteria
+            Check that the block matches all the criteria which don't require loading any additional data
             """
-            # do the checks which don't require loading any additional data
-            if (  # pylint: disable=bad-continuation
+            return (
                 self._block_matches(block_data, qualifiers) and
                 self._block_matches(block_data.fields, settings)
-            ):
-                if content:
-                    definition_block = self.get_definition(course_locator, block_data.definition)
-                    return self._block_matches(definition_block['fields'], content)
-                else:
-                    return True
+            )
 
         if settings is None:
             settings = {}
@@ -1200,6 +1219,8 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                 if block_id.id in block_name and _block_matches_all(block):
                     block_ids.append(block_id)
 
+            if content:
+                block_ids = self._filter_blocks_by_content(course_locator, course, block_ids, content)
             return self._load_items(course, block_ids, **kwargs)
 
         if 'category' in qualifiers:
@@ -1217,8 +1238,13 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             path_cache = {}
             parents_cache = self.build_block_key_to_parents_mapping(course.structure)
 
-        for block_id, value in course.structure['blocks'].iteritems():
-            if _block_matches_all(value):
+        blocks = course.structure['blocks']
+        candidates = self._get_structure_index(course).candidates(qualifiers.get('block_type'), settings)
+        if candidates is None:
+            candidates = blocks.iterkeys()
+
+        for block_id in candidates:
+            if _block_matches_all(blocks[block_id]):
                 if not include_orphans:
                     if (  # pylint: disable=bad-continuation
                         block_id.type in DETACHED_XBLOCK_TYPES or
@@ -1228,11 +1254,32 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                 else:
                     items.append(block_id)
 
+        if content:
+            items = self._filter_blocks_by_content(course_locator, course, items, content)
+
         if len(items) > 0:
             return self._load_items(course, items, depth=0, **kwargs)
         else:
             return []
 
+    def _filter_blocks_by_content(self, course_key, course, block_keys, content):
+        """
+        Returns the keys of the given blocks whose definition matches the content criteria,
+        fetching all the definitions at once.
+        """
+        blocks = course.structure['blocks']
+        definitions = {
+            definition['_id']: definition
+            for definition in self.get_definitions(
+                course_key, [blocks[block_key].definition for block_key in block_keys]
+            )
+        }
+        return [
+            block_key for block_key in block_keys
+            if blocks[block_key].definition in definitions and
+            self._block_matches(definitions[blocks[block_key].definition]['fields'], content)
+        ]
+
     def build_block_key_to_parents_mapping(self, structure):
         """
         Given a structure, builds block_key to parents mapping for all block keys in structure
@@ -2303,10 +2350,14 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         :param blacklist: a list of usage keys to not change in the destination: i.e., don't add
         if not there, don't update if there.
 
+        Returns:
+            StructureDiff: the blocks added to, removed from and changed in the destination.
+
         Raises:
             ItemNotFoundError: if it cannot find the course. if the request is to publish a
                 subtree but the ancestors up to and including the course root are not published.
         """
+        structure_diff = StructureDiff()
         # get the destination's index, and source and destination structures.
         with self.bulk_operations(source_course):
             source_structure = self._lookup_course(source_course).structure
@@ -2347,13 +2398,15 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                         # in the course export. Continue and only throw an exception if *no* parents are found.
                         if parent in destination_blocks:
                             parent_found = True
-                            orphans.update(
-                                self._sync_children(
-                                    source_structure['blocks'][parent],
-                                    destination_blocks[parent],
-                                    BlockKey.from_usage_key(subtree_root)
-                                )
+                            parent_children = list(destination_blocks[parent].fields['children'])
+                            parent_orphans = self._sync_children(
+                                source_structure['blocks'][parent],
+                                destination_blocks[parent],
+                                BlockKey.from_usage_key(subtree_root)
                             )
+                            orphans.update(parent_orphans)
+                            if destination_blocks[parent].fields['children'] != parent_children:
+                                structure_diff.change_block(parent, [Scope.children])
                     if len(parents) and not parent_found:
                         raise ItemNotFoundError(parents)
                 # update/create the subtree and its children in destination (skipping blacklist)
@@ -2363,18 +2416,21 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                         BlockKey.from_usage_key(subtree_root),
                         source_structure['blocks'],
                         destination_blocks,
-                        blacklist
+                        blacklist,
+                        structure_diff
                     )
                 )
             # remove any remaining orphans
             for orphan in orphans:
                 # orphans will include moved as well as deleted xblocks. Only delete the deleted ones.
-                self._delete_if_true_orphan(orphan, destination_structure)
+                self._delete_if_true_orphan(orphan, destination_structure, structure_diff)
 
             # update the db
             self.update_structure(destination_course, destination_structure)
             self._update_head(destination_course, index_entry, destination_course.branch, destination_structure['_id'])
 
+        return structure_diff
+
     @contract(source_keys="list(BlockUsageLocator)", dest_usage=BlockUsageLocator)
     def copy_from_template(self, source_keys, dest_usage, user_id, head_validation=True):
         """
@@ -3138,16 +3194,25 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         destination_blocks="dict(BlockKey: *)",
         blacklist="list(BlockKey) | str",
     )
-    def _copy_subdag(self, user_id, destination_version, block_key, source_blocks, destination_blocks, blacklist):
+    def _copy_subdag(
+            self, user_id, destination_version, block_key, source_blocks, destination_blocks, blacklist,
+            structure_diff=None
+    ):
         """
         Update destination_blocks for the sub-dag rooted at block_key to be like the one in
         source_blocks excluding blacklist.
 
+        Added blocks, and blocks changed since they were last copied, are recorded in
+        structure_diff, if given.
+
         Return any newly discovered orphans (as a set)
         """
         orphans = set()
         destination_block = destination_blocks.get(block_key)
         new_block = source_blocks[block_key]
+        # If the block we are copying from was itself a copy, then just
+        # reference the original source, rather than the copy.
+        source_version = new_block.edit_info.source_version or new_block.edit_info.update_version
         if destination_block:
             # reorder children to correspond to whatever order holds for source.
             # remove any which source no longer claims (put into orphans)
@@ -3165,15 +3230,25 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                 for index, child in enumerate(source_children):
                     if child not in blacklist:
                         destination_reordered[index] = child
+            destination_children = destination_reordered.compact_list()
+            if structure_diff is not None and (
+                    destination_block.edit_info.source_version != source_version or
+                    destination_children != existing_children
+            ):
+                structure_diff.change_block(
+                    block_key,
+                    self._changed_scopes(destination_block, new_block, destination_children)
+                )
             # the history of the published leaps between publications and only points to
             # previously published versions.
             previous_version = destination_block.edit_info.update_version
             destination_block = copy.deepcopy(new_block)
-            destination_block.fields['children'] = destination_reordered.compact_list()
+            destination_block.fields['children'] = destination_children
             destination_block.edit_info.previous_version = previous_version
             destination_block.edit_info.update_version = destination_version
             destination_block.edit_info.edited_by = user_id
             destination_block.edit_info.edited_on = datetime.datetime.now(UTC)
+            destination_block.edit_info.source_version = source_version
         else:
             destination_block = self._new_block(
                 user_id, new_block.block_type,
@@ -3187,24 +3262,38 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             for key, val in new_block.edit_info.to_storable().iteritems():
                 if getattr(destination_block.edit_info, key) is None:
                     setattr(destination_block.edit_info, key, val)
-
-        # If the block we are copying from was itself a copy, then just
-        # reference the original source, rather than the copy.
-        destination_block.edit_info.source_version = (
-            new_block.edit_info.source_version or new_block.edit_info.update_version
-        )
+            destination_block.edit_info.source_version = source_version
+            if structure_diff is not None:
+                structure_diff.add_block(block_key)
 
         if blacklist != EXCLUDE_ALL:
             for child in destination_block.fields.get('children', []):
                 if child not in blacklist:
                     orphans.update(
                         self._copy_subdag(
-                            user_id, destination_version, BlockKey(*child), source_blocks, destination_blocks, blacklist
+                            user_id, destination_version, BlockKey(*child), source_blocks, destination_blocks,
+                            blacklist, structure_diff
                         )
                     )
         destination_blocks[block_key] = destination_block
         return orphans
 
+    @staticmethod
+    def _changed_scopes(old_block, new_block, new_children):
+        """
+        Returns the scopes of the fields which differ between the two versions of a block.
+        """
+        scopes = set()
+        if old_block.definition != new_block.definition:
+            scopes.add(Scope.content)
+        if old_block.fields.get('children', []) != new_children:
+            scopes.add(Scope.children)
+        old_settings = {name: value for name, value in old_block.fields.iteritems() if name != 'children'}
+        new_settings = {name: value for name, value in new_block.fields.iteritems() if name != 'children'}
+        if old_settings != new_settings or old_block.defaults != new_block.defaults:
+            scopes.add(Scope.settings)
+        return scopes
+
     @contract(blacklist='list(BlockKey) | str')
     def _filter_blacklist(self, fields, blacklist):
         """
@@ -3218,14 +3307,17 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         return fields
 
     @contract(orphan=BlockKey)
-    def _delete_if_true_orphan(self, orphan, structure):
+    def _delete_if_true_orphan(self, orphan, structure, structure_diff=None):
         """
         Delete the orphan and any of its descendants which no longer have parents.
+        Deleted blocks are recorded in structure_diff, if given.
         """
         if len(self._get_parents_from_structure(orphan, structure)) == 0:
             orphan_data = structure['blocks'].pop(orphan)
+            if structure_diff is not None:
+                structure_diff.remove_block(orphan)
             for child in orphan_data.fields.get('children', []):
-                self._delete_if_true_orphan(BlockKey(*child), structure)
+                self._delete_if_true_orphan(BlockKey(*child), structure, structure_diff)
 
     @contract(returns=BlockData)
     def _new_block(self, user_id, category, block_fields, definition_id, new_id, raw=False,
@@ -0,0 +1,111 @@
+"""
+Secondary indexes over the blocks of a split structure, used to narrow down
+the blocks which ``get_items`` has to check against its criteria.
+
+A structure version never changes once it has been saved, so an index built
+for a given version can be kept as long as the structure itself.
+"""
+import re
+from collections import defaultdict, Hashable
+
+
+class StructureIndex(object):
+    """
+    Maps block types and the values of settings fields to the keys of the
+    blocks of a structure which have them.
+
+    The index by block type is built right away; the index of a settings
+    field is only built the first time that field is queried. Lookups
+    return candidates only: callers must still check each candidate against
+    the full criteria.
+    """
+    def __init__(self, structure):
+        self.blocks = structure['blocks']
+        self.by_type = defaultdict(list)
+        for block_key in self.blocks:
+            self.by_type[block_key.type].append(block_key)
+        # field name -> (dict(value, list of block keys), list of keys of blocks whose value can't be indexed)
+        self._by_setting = {}
+
+    @staticmethod
+    def is_indexable(criteria):
+        """
+        Whether blocks matching the given criteria can be found from the index,
+        which only holds plain values.
+        """
+        if isinstance(criteria, dict):
+            return criteria.keys() == ['$in'] and all(
+                StructureIndex._is_plain_value(value) for value in criteria['$in']
+            )
+        return StructureIndex._is_plain_value(criteria)
+
+    @staticmethod
+    def _is_plain_value(criteria):
+        """
+        Whether the criteria is a value which is matched by equality.
+        """
+        return (
+            isinstance(criteria, Hashable) and
+            not isinstance(criteria, dict) and
+            not callable(criteria) and
+            not isinstance(criteria, re._pattern_type)  # pylint: disable=protected-access
+        )
+
+    def _lookup(self, index, criteria):
+        """
+        Returns the set of block keys of the given value -> block keys index
+        which may match the given criteria.
+        """
+        values = criteria['$in'] if isinstance(criteria, dict) else [criteria]
+        block_keys = set()
+        for value in values:
+            block_keys.update(index.get(value, ()))
+        return block_keys
+
+    def _setting_index(self, field_name):
+        """
+        Returns the index of the given settings field, building it if needed.
+        """
+        if field_name not in self._by_setting:
+            by_value = defaultdict(list)
+            unindexed = []
+            for block_key, block_data in self.blocks.iteritems():
+                if field_name not in block_data.fields:
+                    # blocks which don't set the field only match $exists criteria, which aren't indexed
+                    continue
+                value = block_data.fields[field_name]
+                # list values match when any of their elements does
+                values = value if isinstance(value, list) else [value]
+                if all(isinstance(element, Hashable) for element in values):
+                    for element in values:
+                        by_value[element].append(block_key)
+                else:
+                    unindexed.append(block_key)
+            self._by_setting[field_name] = (by_value, unindexed)
+        return self._by_setting[field_name]
+
+    def candidates(self, block_type=None, settings=None):
+        """
+        Returns the keys of the blocks which may be of the given block type and
+        match the given settings criteria, or None if the index can't narrow
+        them down.
+
+        Arguments:
+            block_type: criteria on the type of the blocks
+            settings (dict): criteria on the settings fields of the blocks
+        """
+        candidates = None
+        if block_type is not None and self.is_indexable(block_type):
+            candidates = self._lookup(self.by_type, block_type)
+
+        for field_name, criteria in (settings or {}).iteritems():
+            if not self.is_indexable(criteria):
+                continue
+            by_value, unindexed = self._setting_index(field_name)
+            field_candidates = self._lookup(by_value, criteria)
+            field_candidates.update(unindexed)
+            candidates = field_candidates if candidates is None else candidates & field_candidates
+            if not candidates:
+                break
+
+        return candidates
@@ -0,0 +1,106 @@
+"""
+A compact description of what a publish changed in the published branch of a
+course, sent along with the course_published signal so that listeners can
+limit their work to the blocks which changed.
+"""
+from collections import defaultdict
+
+from xblock.fields import Scope
+
+
+class StructureDiff(object):
+    """
+    The block keys added to, removed from and changed in a course structure.
+
+    Changed blocks are mapped to the set of scopes of the fields which
+    changed: Scope.content for the definition, Scope.settings for the
+    settings fields and Scope.children for the list of children.
+    """
+    ALL_SCOPES = frozenset([Scope.content, Scope.settings, Scope.children])
+
+    def __init__(self):
+        self.added = set()
+        self.removed = set()
+        self.changed = defaultdict(set)
+
+    def __nonzero__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def __repr__(self):
+        return u'StructureDiff(added={}, removed={}, changed={})'.format(
+            sorted(self.added), sorted(self.removed), dict(self.changed)
+        )
+
+    def add_block(self, block_key):
+        """
+        Records that the block was added.
+        """
+        if block_key in self.removed:
+            # removed, then added back by a later publish
+            self.removed.discard(block_key)
+            self.changed[block_key].update(self.ALL_SCOPES)
+        else:
+            self.added.add(block_key)
+
+    def remove_block(self, block_key):
+        """
+        Records that the block was removed.
+        """
+        self.changed.pop(block_key, None)
+        if block_key in self.added:
+            self.added.discard(block_key)
+        else:
+            self.removed.add(block_key)
+
+    def change_block(self, block_key, scopes):
+        """
+        Records that fields of the given scopes changed in the block.
+        """
+        if scopes and block_key not in self.added:
+            self.changed[block_key].update(scopes)
+
+    def update(self, other):
+        """
+        Adds the changes of a later diff of the same course to this one.
+        """
+        for block_key in other.removed:
+            self.remove_block(block_key)
+        for block_key in other.added:
+            self.add_block(block_key)
+        for block_key, scopes in other.changed.iteritems():
+            self.change_block(block_key, scopes)
+
+    def block_keys(self):
+        """
+        Returns the set of keys of all the blocks which were added, removed or changed.
+        """
+        return self.added | self.removed | set(self.changed)
+
+    def includes_block_type(self, block_type):
+        """
+        Returns whether any block of the given type was added, removed or changed.
+        """
+        return any(block_key.type == block_type for block_key in self.block_keys())
+
+    def includes_changes(self, scopes):
+        """
+        Returns whether any block was added or removed, or had fields of any
+        of the given scopes changed.
+        """
+        return bool(
+            self.added or self.removed or
+            any(changed_scopes.intersection(scopes) for changed_scopes in self.changed.itervalues())
+        )
+
+    @classmethod
+    def combine(cls, diffs):
+        """
+        Returns a single diff for a sequence of diffs of the same course, in
+        the order they happened, or None if any of them is None (unknown).
+        """
+        combined = cls()
+        for diff in diffs:
+            if diff is None:
+                return None
+            combined.update(diff)
+        return combined
@@ -16,7 +16,7 @@ from nose.plugins.attrib import attr
 from django.core.cache import caches, InvalidCacheBackendError
 
 from openedx.core.lib import tempdir
-from xblock.fields import Reference, ReferenceList, ReferenceValueDict
+from xblock.fields import Reference, ReferenceList, ReferenceValueDict, Scope
 from xmodule.course_module import CourseDescriptor
 from xmodule.modulestore import ModuleStoreEnum
 from xmodule.modulestore.exceptions import (
@@ -1210,6 +1210,14 @@ class SplitModuleItemTests(SplitModuleTest):
         self.assertEqual(len(matches), 1)
         matches = modulestore().get_items(locator, settings={'group_access': {'$exists': False}})
         self.assertEqual(len(matches), 6)
+        matches = modulestore().get_items(locator, qualifiers={'category': {'$in': ['chapter', 'garbage']}})
+        self.assertEqual(len(matches), 3)
+        matches = modulestore().get_items(
+            locator,
+            qualifiers={'category': 'chapter'},
+            settings={'display_name': 'Hercules'},
+        )
+        self.assertEqual(len(matches), 1)
 
     def test_get_parents(self):
         '''
@@ -2084,6 +2092,42 @@ class TestPublish(SplitModuleTest):
         pub_module = modulestore().get_item(new_module.location.map_into_course(dest_course))
         self._check_course(source_course, dest_course, expected, unexpected)
 
+    @patch('xmodule.tabs.CourseTab.from_json', side_effect=mock_tab_from_json)
+    def test_publish_diff(self, _from_json):
+        """
+        Test the structure diffs returned by publishing
+        """
+        source_course = CourseLocator(org='testx', course='GreekHero', run="run", branch=BRANCH_NAME_DRAFT)
+        dest_course = CourseLocator(org='testx', course='GreekHero', run="run", branch=BRANCH_NAME_PUBLISHED)
+        head = source_course.make_usage_key('course', "head12345")
+        chapter1 = source_course.make_usage_key('chapter', 'chapter1')
+        chapter2 = source_course.make_usage_key('chapter', 'chapter2')
+        chapter3 = source_course.make_usage_key('chapter', 'chapter3')
+        structure_diff = modulestore().copy(self.user_id, source_course, dest_course, [head], [chapter2, chapter3])
+        self.assertEqual(structure_diff.added, {BlockKey.from_usage_key(head), BlockKey.from_usage_key(chapter1)})
+        self.assertFalse(structure_diff.removed)
+        self.assertFalse(structure_diff.changed)
+
+        # publishing again changes nothing, but still restamps the published blocks
+        published_on = modulestore().get_item(chapter1.map_into_course(dest_course)).edited_on
+        structure_diff = modulestore().copy(self.user_id, source_course, dest_course, [head], [chapter2, chapter3])
+        self.assertFalse(structure_diff)
+        self.assertGreater(modulestore().get_item(chapter1.map_into_course(dest_course)).edited_on, published_on)
+
+        new_module = modulestore().create_child(
+            self.user_id, chapter1, "sequential",
+            fields={'display_name': 'new sequential'},
+        )
+        structure_diff = modulestore().copy(self.user_id, source_course, dest_course, [new_module.location], None)
+        self.assertEqual(structure_diff.added, {BlockKey.from_usage_key(new_module.location)})
+        self.assertEqual(dict(structure_diff.changed), {BlockKey.from_usage_key(chapter1): {Scope.children}})
+
+        chapter = modulestore().get_item(chapter1)
+        chapter.display_name = 'renamed chapter'
+        modulestore().update_item(chapter, self.user_id)
+        structure_diff = modulestore().copy(self.user_id, source_course, dest_course, [chapter1], None)
+        self.assertEqual(dict(structure_diff.changed), {BlockKey.from_usage_key(chapter1): {Scope.settings}})
+
     def test_exceptions(self):
         """
         Test the exceptions which preclude successful publication
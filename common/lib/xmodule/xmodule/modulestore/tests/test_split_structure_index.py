@@ -0,0 +1,51 @@
+"""
+Tests of the secondary indexes over split structures.
+"""
+import re
+import unittest
+
+from xmodule.modulestore import BlockData
+from xmodule.modulestore.split_mongo import BlockKey
+from xmodule.modulestore.split_mongo.structure_index import StructureIndex
+
+
+class TestStructureIndex(unittest.TestCase):
+    """
+    Tests of StructureIndex.
+    """
+    def setUp(self):
+        super(TestStructureIndex, self).setUp()
+        self.chapter = BlockKey('chapter', 'chapter1')
+        self.video = BlockKey('video', 'video1')
+        self.problem = BlockKey('problem', 'problem1')
+        self.other_problem = BlockKey('problem', 'problem2')
+        self.index = StructureIndex({
+            'blocks': {
+                self.chapter: BlockData(block_type='chapter', fields={'children': [self.video, self.problem]}),
+                self.video: BlockData(block_type='video', fields={'display_name': 'Intro'}),
+                self.problem: BlockData(block_type='problem', fields={'display_name': 'Quiz', 'weight': 1}),
+                self.other_problem: BlockData(block_type='problem', fields={'group_access': {1: [2]}}),
+            }
+        })
+
+    def test_by_type(self):
+        self.assertEqual(self.index.candidates('problem'), {self.problem, self.other_problem})
+        self.assertEqual(self.index.candidates({'$in': ['video', 'chapter']}), {self.video, self.chapter})
+        self.assertEqual(self.index.candidates('garbage'), set())
+
+    def test_by_setting(self):
+        self.assertEqual(self.index.candidates(settings={'display_name': 'Quiz'}), {self.problem})
+        self.assertEqual(self.index.candidates('video', {'display_name': 'Quiz'}), set())
+
+    def test_list_values(self):
+        self.assertEqual(self.index.candidates(settings={'children': self.video}), {self.chapter})
+
+    def test_unindexed_values_are_candidates(self):
+        self.assertEqual(self.index.candidates(settings={'group_access': 'anything'}), {self.other_problem})
+
+    def test_not_indexable(self):
+        self.assertIsNone(self.index.candidates())
+        self.assertIsNone(self.index.candidates(re.compile('prob')))
+        self.assertIsNone(self.index.candidates(settings={'weight': lambda weight: weight > 0}))
+        self.assertIsNone(self.index.candidates(settings={'group_access': {'$exists': True}}))
+        self.assertIsNone(self.index.candidates(settings={'display_name': {'$nin': ['Quiz']}}))
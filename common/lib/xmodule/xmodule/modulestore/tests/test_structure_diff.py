@@ -0,0 +1,69 @@
+"""
+Tests of StructureDiff.
+"""
+import unittest
+
+from xblock.fields import Scope
+
+from xmodule.modulestore.split_mongo import BlockKey
+from xmodule.modulestore.structure_diff import StructureDiff
+
+
+class TestStructureDiff(unittest.TestCase):
+    """
+    Tests of recording and combining structure diffs.
+    """
+    def setUp(self):
+        super(TestStructureDiff, self).setUp()
+        self.chapter = BlockKey('chapter', 'chapter1')
+        self.html = BlockKey('html', 'html1')
+
+    def test_empty(self):
+        self.assertFalse(StructureDiff())
+
+    def test_change_added_block(self):
+        diff = StructureDiff()
+        diff.add_block(self.html)
+        diff.change_block(self.html, [Scope.settings])
+        self.assertEqual(diff.added, {self.html})
+        self.assertFalse(diff.changed)
+
+    def test_remove_added_block(self):
+        diff = StructureDiff()
+        diff.add_block(self.html)
+        diff.remove_block(self.html)
+        self.assertFalse(diff)
+
+    def test_add_removed_block(self):
+        diff = StructureDiff()
+        diff.remove_block(self.html)
+        diff.add_block(self.html)
+        self.assertEqual(dict(diff.changed), {self.html: StructureDiff.ALL_SCOPES})
+        self.assertFalse(diff.added)
+        self.assertFalse(diff.removed)
+
+    def test_includes_changes(self):
+        diff = StructureDiff()
+        diff.change_block(self.html, [Scope.content])
+        self.assertTrue(diff.includes_changes([Scope.content]))
+        self.assertFalse(diff.includes_changes([Scope.settings, Scope.children]))
+        diff.remove_block(self.html)
+        self.assertTrue(diff.includes_changes([Scope.settings]))
+
+    def test_combine(self):
+        first = StructureDiff()
+        first.change_block(self.chapter, [Scope.children])
+        first.add_block(self.html)
+        second = StructureDiff()
+        second.change_block(self.chapter, [Scope.settings])
+        second.remove_block(self.html)
+
+        combined = StructureDiff.combine([first, second])
+        self.assertEqual(dict(combined.changed), {self.chapter: {Scope.children, Scope.settings}})
+        self.assertFalse(combined.added)
+        self.assertFalse(combined.removed)
+        self.assertTrue(combined.includes_block_type('chapter'))
+        self.assertFalse(combined.includes_block_type('html'))
+
+    def test_combine_unknown(self):
+        self.assertIsNone(StructureDiff.combine([StructureDiff(), None]))
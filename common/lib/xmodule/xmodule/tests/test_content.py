@@ -208,6 +208,29 @@ class ContentTest(unittest.TestCase):
 
         self.assertEqual(total_length, last_byte - first_byte + 1)
 
+    def test_static_content_stream_stream_data_in_range_chunk_size(self):
+        """
+        Test StaticContentStream stream_data_in_range function with a custom
+        chunk size, asserts that no chunk exceeds it and that we get exactly
+        the requested bytes
+        """
+        data = SAMPLE_STRING
+        item = FakeGridFsItem(data)
+        static_content_stream = StaticContentStream('loc', 'name', 'type', item, length=item.length)
+
+        chunks = list(static_content_stream.stream_data_in_range(100, 1500, chunk_size=256))
+
+        self.assertTrue(all(len(chunk) <= 256 for chunk in chunks))
+        self.assertEqual(''.join(chunks), data[100:1501])
+
+    def test_static_content_stream_data_in_range(self):
+        """
+        Test StaticContent stream_data_in_range function, asserts that we get
+        the requested bytes of in-memory content
+        """
+        static_content = StaticContent('loc', 'name', 'type', SAMPLE_STRING)
+        self.assertEqual(''.join(static_content.stream_data_in_range(100, 1500)), SAMPLE_STRING[100:1501])
+
     def test_static_content_write_js(self):
         """
         Test that only one filename starts with 000.
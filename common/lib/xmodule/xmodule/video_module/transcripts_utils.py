@@ -11,6 +11,8 @@ from pysrt import SubRipTime, SubRipItem, SubRipFile
 from lxml import etree
 from HTMLParser import HTMLParser
 
+from django.core.cache import cache
+
 from xmodule.exceptions import NotFoundError
 from xmodule.contentstore.content import StaticContent
 from xmodule.contentstore.django import contentstore
@@ -20,6 +22,10 @@ from .bumper_utils import get_bumper_settings
 
 log = logging.getLogger(__name__)
 
+# Number of seconds for which transcripts converted from one format to
+# another are cached, keyed by the digest of their source asset.
+CONVERTED_TRANSCRIPT_CACHE_TIMEOUT = 60 * 60 * 24
+
 
 class TranscriptException(Exception):  # pylint: disable=missing-docstring
     pass
@@ -213,25 +219,25 @@ def generate_subs_from_source(speed_subs, subs_type, subs_filedata, item, langua
     _ = item.runtime.service(item, "i18n").ugettext
     if subs_type.lower() != 'srt':
         raise TranscriptsGenerationException(_("We support only SubRip (*.srt) transcripts format."))
+    sub_starts = []
+    sub_ends = []
+    sub_texts = []
+
     try:
-        srt_subs_obj = SubRipFile.from_string(subs_filedata)
+        # Stream the items rather than building a SubRipFile of them, as
+        # only their times and text are kept.
+        for sub in SubRipFile.stream(subs_filedata.splitlines(True)):
+            sub_starts.append(sub.start.ordinal)
+            sub_ends.append(sub.end.ordinal)
+            sub_texts.append(sub.text.replace('\n', ' '))
     except Exception as ex:
         msg = _("Something wrong with SubRip transcripts file during parsing. Inner message is {error_message}").format(
             error_message=ex.message
         )
         raise TranscriptsGenerationException(msg)
-    if not srt_subs_obj:
+    if not sub_starts:
         raise TranscriptsGenerationException(_("Something wrong with SubRip transcripts file during parsing."))
 
-    sub_starts = []
-    sub_ends = []
-    sub_texts = []
-
-    for sub in srt_subs_obj:
-        sub_starts.append(sub.start.ordinal)
-        sub_ends.append(sub.end.ordinal)
-        sub_texts.append(sub.text.replace('\n', ' '))
-
     subs = {
         'start': sub_starts,
         'end': sub_ends,
@@ -256,14 +262,13 @@ def generate_srt_from_sjson(sjson_subs, speed):
     :returns: "srt" subs.
     """
 
-    output = ''
-
     equal_len = len(sjson_subs['start']) == len(sjson_subs['end']) == len(sjson_subs['text'])
     if not equal_len:
-        return output
+        return ''
 
     sjson_speed_1 = generate_subs(speed, 1, sjson_subs)
 
+    output = []
     for i in range(len(sjson_speed_1['start'])):
         item = SubRipItem(
             index=i,
@@ -271,9 +276,9 @@ def generate_srt_from_sjson(sjson_subs, speed):
             end=SubRipTime(milliseconds=sjson_speed_1['end'][i]),
             text=sjson_speed_1['text'][i]
         )
-        output += (unicode(item))
-        output += '\n'
-    return output
+        output.append(unicode(item))
+        output.append('\n')
+    return ''.join(output)
 
 
 def copy_or_rename_transcript(new_name, old_name, item, delete_old=False, user=None):
@@ -332,6 +337,7 @@ def manage_video_subtitles_save(item, user, old_metadata=None, generate_translat
     b) For all SRT files in`item.transcripts` regenerate new SJSON files.
         (To avoid confusing situation if you attempt to correct a translation by uploading
         a new version of the SRT file with same name).
+        SJSON files which were generated after their SRT file was uploaded are kept.
     """
 
     _ = item.runtime.service(item, "i18n").ugettext
@@ -374,12 +380,15 @@ def manage_video_subtitles_save(item, user, old_metadata=None, generate_translat
                     remove_subs_from_store(video_id, item, lang)
 
         reraised_message = ''
+        result_subs_dict = {speed: subs_id for subs_id, speed in youtube_speed_dict(item).iteritems()}
         for lang in new_langs:  # 3b
+            if not sjson_outdated(item, item.transcripts[lang], result_subs_dict.values(), lang):
+                continue
             try:
                 generate_sjson_for_all_speeds(
                     item,
                     item.transcripts[lang],
-                    {speed: subs_id for subs_id, speed in youtube_speed_dict(item).iteritems()},
+                    result_subs_dict,
                     lang,
                 )
             except TranscriptException as ex:
@@ -411,6 +420,37 @@ def subs_filename(subs_id, lang='en'):
         return u'{0}_subs_{1}.srt.sjson'.format(lang, subs_id)
 
 
+def sjson_outdated(item, user_filename, subs_ids, lang):
+    """
+    Returns whether the sjson transcripts of `subs_ids` in `lang` need to be
+    generated from the uploaded `user_filename` transcripts, i.e. whether
+    any of them is missing or was generated before `user_filename` was
+    uploaded. Only the metadata of the assets is read.
+
+    `item` is module object.
+    """
+    try:
+        srt_transcripts = contentstore().find(
+            Transcript.asset_location(item.location, user_filename), as_stream=True
+        )
+    except NotFoundError:
+        # Generating reports the missing transcripts.
+        return True
+    srt_transcripts.close()
+
+    for subs_id in subs_ids:
+        try:
+            sjson_transcripts = contentstore().find(
+                Transcript.asset_location(item.location, subs_filename(subs_id, lang)), as_stream=True
+            )
+        except NotFoundError:
+            return True
+        sjson_transcripts.close()
+        if sjson_transcripts.last_modified_at < srt_transcripts.last_modified_at:
+            return True
+    return False
+
+
 def generate_sjson_for_all_speeds(item, user_filename, result_subs_dict, lang):
     """
     Generates sjson from srt for given lang.
@@ -494,7 +534,7 @@ class Transcript(object):
         if input_format == 'srt':
 
             if output_format == 'txt':
-                text = SubRipFile.from_string(content.decode('utf8')).text
+                text = '\n'.join(sub.text for sub in SubRipFile.stream(content.decode('utf8').splitlines(True)))
                 return HTMLParser().unescape(text)
 
             elif output_format == 'sjson':
@@ -509,6 +549,25 @@ class Transcript(object):
             elif output_format == 'srt':
                 return generate_srt_from_sjson(json.loads(content), speed=1.0)
 
+    @staticmethod
+    def convert_asset(asset, input_format, output_format):
+        """
+        Convert the transcript content of the `asset` StaticContent from
+        `input_format` to `output_format`.
+
+        Conversions are cached by the digest of the asset's content, so a
+        transcript is only converted again once it is changed.
+        """
+        if input_format == output_format or not asset.content_digest:
+            return Transcript.convert(asset.data, input_format, output_format)
+
+        cache_key = u'transcripts.converted.{}.{}.{}'.format(asset.content_digest, input_format, output_format)
+        content = cache.get(cache_key)
+        if content is None:
+            content = Transcript.convert(asset.data, input_format, output_format)
+            cache.set(cache_key, content, CONVERTED_TRANSCRIPT_CACHE_TIMEOUT)
+        return content
+
     @staticmethod
     def asset(location, subs_id, lang='en', filename=None):
         """
@@ -632,13 +691,13 @@ class VideoTranscriptsMixin(object):
                 log.debug("No subtitles for 'en' language")
                 raise ValueError
 
-            data = Transcript.asset(self.location, transcript_name, lang).data
+            asset = Transcript.asset(self.location, transcript_name, lang)
             filename = u'{}.{}'.format(transcript_name, transcript_format)
-            content = Transcript.convert(data, 'sjson', transcript_format)
+            content = Transcript.convert_asset(asset, 'sjson', transcript_format)
         else:
-            data = Transcript.asset(self.location, None, None, other_lang[lang]).data
+            asset = Transcript.asset(self.location, None, None, other_lang[lang])
             filename = u'{}.{}'.format(os.path.splitext(other_lang[lang])[0], transcript_format)
-            content = Transcript.convert(data, 'srt', transcript_format)
+            content = Transcript.convert_asset(asset, 'srt', transcript_format)
 
         if not content:
             log.debug('no subtitles produced in get_transcript')
@@ -3,6 +3,8 @@ Models for bulk email
 """
 import logging
 import markupsafe
+import re
+from string import Formatter
 
 from django.conf import settings
 from django.contrib.auth.models import User
@@ -247,6 +249,121 @@ class Optout(models.Model):
 # the location where the email message body is to be inserted.
 COURSE_EMAIL_MESSAGE_BODY_TAG = '{{message_body}}'
 
+# Context keys whose values differ between the recipients of an email.
+RECIPIENT_CONTEXT_KEYS = frozenset(['name', 'email', 'user_id'])
+
+
+def _escape_format_string(value):
+    """
+    Escape the braces in `value` so that it formats to itself.
+    """
+    return value.replace('{', '{{').replace('}', '}}')
+
+
+class CompiledEmailTemplate(object):
+    """
+    A template and message body with the context values common to all the
+    recipients of an email already rendered, so that only the recipient values
+    need to be filled in for each recipient.
+
+    The template is compiled line by line: lines which only use common values
+    are rendered and wrapped once, and the others are reduced to a format string
+    with only the recipient fields left in them.
+    """
+    def __init__(self, format_string, message_body, context, recipient_keys=RECIPIENT_CONTEXT_KEYS, escape=False):
+        self.message_body = message_body
+        self.context = self._escape_context(context) if escape else dict(context)
+        self.recipient_keys = frozenset(recipient_keys)
+        self.escape = escape
+
+        # Note that the body tag in the template will have been "formatted" by
+        # the time it is replaced, so we need to do the same to the tag being
+        # searched for.
+        self.message_body_tag = COURSE_EMAIL_MESSAGE_BODY_TAG.format()
+
+        # Substitution of %%-encoded keywords in the message body needs the user.
+        self.static_body = '%%' not in message_body
+        self.lines = []
+        self.body_line = None
+        for line in format_string.split('\n'):
+            self.lines.append(self._compile_line(line))
+
+    @staticmethod
+    def _escape_context(context):
+        """
+        Returns a copy of the context with its string values HTML-escaped.
+        """
+        return {
+            key: markupsafe.escape(value) if isinstance(value, basestring) else value
+            for key, value in context.iteritems()
+        }
+
+    def _compile_line(self, line):
+        """
+        Returns the rendered and wrapped line if it does not depend on the recipient,
+        or else a format string for the line with only the recipient fields left in it.
+        """
+        formatter = Formatter()
+        text = []
+        reduced = []
+        is_static = True
+        for literal_text, field_name, format_spec, conversion in formatter.parse(line):
+            text.append(literal_text)
+            reduced.append(_escape_format_string(literal_text))
+            if field_name is None:
+                continue
+            field = u'{{{}{}{}}}'.format(
+                field_name,
+                u'!' + conversion if conversion else u'',
+                u':' + format_spec if format_spec else u'',
+            )
+            if re.match(r'[^.[]*', field_name).group() in self.recipient_keys:
+                is_static = False
+                reduced.append(field)
+            else:
+                value = field.format(**self.context)
+                text.append(value)
+                reduced.append(_escape_format_string(value))
+
+        text = u''.join(text)
+        has_body = self.body_line is None and self.message_body_tag in text
+        if has_body:
+            self.body_line = len(self.lines)
+            is_static = is_static and self.static_body
+
+        if not is_static:
+            return None, u''.join(reduced)
+        if has_body:
+            text = text.replace(self.message_body_tag, self.message_body, 1)
+        return wrap_message(text), None
+
+    def render(self, recipient_context):
+        """
+        Returns the message for the recipient with the given context values.
+
+        Output is returned as a unicode string.  It is not encoded as utf-8.
+        """
+        if self.escape:
+            recipient_context = self._escape_context(recipient_context)
+        context = self.context
+        if recipient_context:
+            context = dict(context)
+            context.update(recipient_context)
+
+        lines = []
+        for index, (text, line_format) in enumerate(self.lines):
+            if line_format is not None:
+                text = line_format.format(**context)
+                if index == self.body_line:
+                    message_body = self.message_body
+                    # Substitute all %%-encoded keywords in the message body
+                    if not self.static_body and 'user_id' in context and 'course_id' in context:
+                        message_body = substitute_keywords_with_data(message_body, context)
+                    text = text.replace(self.message_body_tag, message_body, 1)
+                text = wrap_message(text)
+            lines.append(text)
+        return u'\n'.join(lines)
+
 
 class CourseEmailTemplate(models.Model):
     """
@@ -295,20 +412,7 @@ class CourseEmailTemplate(models.Model):
         of settings.DEFAULT_CHARSET to encode the message.
         """
 
-        # Substitute all %%-encoded keywords in the message body
-        if 'user_id' in context and 'course_id' in context:
-            message_body = substitute_keywords_with_data(message_body, context)
-
-        result = format_string.format(**context)
-
-        # Note that the body tag in the template will now have been
-        # "formatted", so we need to do the same to the tag being
-        # searched for.
-        message_body_tag = COURSE_EMAIL_MESSAGE_BODY_TAG.format()
-        result = result.replace(message_body_tag, message_body, 1)
-
-        # finally, return the result, after wrapping long lines and without converting to an encoded byte array.
-        return wrap_message(result)
+        return CompiledEmailTemplate(format_string, message_body, context, recipient_keys=()).render({})
 
     def render_plaintext(self, plaintext, context):
         """
@@ -332,6 +436,25 @@ class CourseEmailTemplate(models.Model):
                 context[key] = markupsafe.escape(value)
         return CourseEmailTemplate._render(self.html_template, htmltext, context)
 
+    def compile_plaintext(self, plaintext, context):
+        """
+        Compile plain text message for all the recipients of an email.
+
+        Returns a CompiledEmailTemplate of the stored plain template and the plain text
+        body (`plaintext`), with the values common to all recipients in `context` rendered.
+        """
+        return CompiledEmailTemplate(self.plain_template, plaintext, context)
+
+    def compile_htmltext(self, htmltext, context):
+        """
+        Compile HTML text message for all the recipients of an email.
+
+        Returns a CompiledEmailTemplate of the stored HTML template and the HTML text
+        body (`htmltext`), with the values common to all recipients in `context` rendered.
+        String values of the context and of the recipient contexts are HTML-escaped.
+        """
+        return CompiledEmailTemplate(self.html_template, htmltext, context, escape=True)
+
 
 class CourseAuthorization(models.Model):
     """
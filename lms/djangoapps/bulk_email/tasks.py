@@ -181,7 +181,9 @@ def perform_delegate_email_batches(entry_id, course_id, task_input, action_name)
     combined_set = User.objects.none()
     for qset in recipient_qsets:
         combined_set |= qset
-    combined_set = combined_set.distinct()
+    # Recipients who opted out of email from the course are excluded here, so that
+    # subtasks are neither created nor sized for them.
+    combined_set = combined_set.exclude(optout__course_id=course_id).distinct()
     recipient_fields = ['profile__name', 'email']
 
     log.info(u"Task %s: Preparing to queue subtasks for sending emails for course %s, email %s",
@@ -467,6 +469,8 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
         raise
 
     # Exclude optouts (if not a retry):
+    # Optouts are already excluded from the recipients query, so this only catches
+    # recipients who opted out after the subtasks were queued.
     # Note that we don't have to do the optout logic at all if this is a retry,
     # because we have presumably already performed the optout logic on the first
     # attempt.  Anyone on the to_list on a retry has already passed the filter
@@ -491,6 +495,12 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
         # Define context values to use in all course emails:
         email_context = {'name': '', 'email': ''}
         email_context.update(global_email_context)
+        email_context['course_id'] = course_email.course_id
+
+        # Render the templates once with the values common to all recipients, so that
+        # only the recipient values are filled in for each email below.
+        plaintext_template = course_email_template.compile_plaintext(course_email.text_message, email_context)
+        html_template = course_email_template.compile_htmltext(course_email.html_message, email_context)
 
         while to_list:
             # Update context with user-specific values from the user at the end of the list.
@@ -501,14 +511,15 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
             recipient_num += 1
             current_recipient = to_list[-1]
             email = current_recipient['email']
-            email_context['email'] = email
-            email_context['name'] = current_recipient['profile__name']
-            email_context['user_id'] = current_recipient['pk']
-            email_context['course_id'] = course_email.course_id
+            recipient_context = {
+                'email': email,
+                'name': current_recipient['profile__name'],
+                'user_id': current_recipient['pk'],
+            }
 
             # Construct message content using templates and context:
-            plaintext_msg = course_email_template.render_plaintext(course_email.text_message, email_context)
-            html_msg = course_email_template.render_htmltext(course_email.html_message, email_context)
+            plaintext_msg = plaintext_template.render(recipient_context)
+            html_msg = html_template.render(recipient_context)
 
             # Create email:
             email_msg = EmailMultiAlternatives(
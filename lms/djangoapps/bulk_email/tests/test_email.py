@@ -442,6 +442,34 @@ class TestEmailSendFromDashboardMockedHtmlToText(EmailSendFromDashboardTestCase)
                                 [s.email for s in added_users if s not in optouts])
         self.assertItemsEqual(outbox_contents, should_send_contents)
 
+    @override_settings(
+        BULK_EMAIL_EMAILS_PER_TASK=3,
+        EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+    )
+    def test_personalized_message_send_to_all(self):
+        """
+        Test that each recipient gets the message rendered with their own values,
+        through the in-memory email backend.
+        """
+        test_email = {
+            'action': 'Send email',
+            'send_to': '["myself", "staff", "learners"]',
+            'subject': 'test subject for all',
+            'message': 'Dear %%USER_FULLNAME%%, this is a message for all'
+        }
+        response = self.client.post(self.send_mail_url, test_email)
+        self.assertEquals(json.loads(response.content), self.success_content)
+
+        recipients = [self.instructor] + self.staff + self.students
+        self.assertEquals(len(mail.outbox), len(recipients))
+        messages = {message.to[0]: message for message in mail.outbox}
+        for recipient in recipients:
+            message = messages[recipient.email]
+            html_message = message.alternatives[0][0]
+            self.assertIn(u'Dear {},'.format(escape(recipient.profile.name)), html_message)
+            self.assertIn(recipient.email, html_message)
+            self.assertIn(recipient.email, message.body)
+
 
 @attr('shard_1')
 @skipIf(os.environ.get("TRAVIS") == 'true', "Skip this test in Travis CI.")
@@ -190,6 +190,38 @@ class CourseEmailTemplateTest(TestCase):
         self.assertIn(context['course_title'], message)
         self.assertIn(context['name'], message)
 
+    def test_compile_matches_render(self):
+        template = CourseEmailTemplate.get_template()
+        context = self._add_xss_fields(self._get_sample_html_context())
+        body = "Dear %%USER_FULLNAME%%, thanks for enrolling in %%COURSE_DISPLAY_NAME%%."
+        plain_template = template.compile_plaintext(body, context)
+        html_template = template.compile_htmltext(body, context)
+        for name, email in [("<b>First</b>", "first@test.com"), ("Second {name}", "second@test.com")]:
+            recipient_context = {'name': name, 'email': email, 'user_id': 12345}
+            full_context = dict(context, **recipient_context)
+            self.assertEqual(
+                plain_template.render(recipient_context),
+                template.render_plaintext(body, dict(full_context)),
+            )
+            self.assertEqual(
+                html_template.render(recipient_context),
+                template.render_htmltext(body, dict(full_context)),
+            )
+
+    def test_compile_without_context(self):
+        template = CourseEmailTemplate.get_template()
+        context = self._get_sample_html_context()
+        del context['course_title']
+        with self.assertRaises(KeyError):
+            template.compile_htmltext("My new html text.", context)
+
+    def test_render_compiled_without_recipient(self):
+        template = CourseEmailTemplate.get_template()
+        context = self._get_sample_plain_context()
+        compiled = template.compile_plaintext("My new plain text.", context)
+        with self.assertRaises(KeyError):
+            compiled.render({'name': 'Name'})
+
 
 @attr('shard_1')
 class CourseAuthorizationTest(TestCase):
@@ -33,6 +33,7 @@ from django.core.management import call_command
 from xmodule.modulestore.tests.factories import CourseFactory
 
 from bulk_email.models import CourseEmail, Optout, SEND_TO_MYSELF, SEND_TO_STAFF, SEND_TO_LEARNERS
+from bulk_email.tasks import _filter_optouts_from_recipients
 
 from instructor_task.tasks import send_bulk_course_email
 from instructor_task.subtasks import update_subtask_status, SubtaskStatus
@@ -239,12 +240,31 @@ class TestBulkEmailInstructorTask(InstructorTaskCourseTestCase):
         expected_succeeds = num_emails - expected_skipped
         for index in range(0, num_emails, 4):
             Optout.objects.create(user=students[index], course_id=self.course.id)
-        # mark some students as opting out
+        # students who opted out are excluded from the recipients, and not counted as skipped
         with patch('bulk_email.tasks.get_connection', autospec=True) as get_conn:
             get_conn.return_value.send_messages.side_effect = cycle([None])
-            self._test_run_with_task(
-                send_bulk_course_email, 'emailed', num_emails, expected_succeeds, skipped=expected_skipped
-            )
+            self._test_run_with_task(send_bulk_course_email, 'emailed', expected_succeeds, expected_succeeds)
+
+    def test_skipped_optout_after_queueing(self):
+        # Select number of emails to fit into a single subtask.
+        num_emails = settings.BULK_EMAIL_EMAILS_PER_TASK
+        # We also send email to the instructor:
+        students = self._create_students(num_emails - 1)
+        expected_skipped = 2
+        expected_succeeds = num_emails - expected_skipped
+
+        def optout_and_filter(to_list, course_id):
+            """Have two students opt out once their subtask was queued."""
+            for student in students[:expected_skipped]:
+                Optout.objects.create(user=student, course_id=course_id)
+            return _filter_optouts_from_recipients(to_list, course_id)
+
+        with patch('bulk_email.tasks.get_connection', autospec=True) as get_conn:
+            get_conn.return_value.send_messages.side_effect = cycle([None])
+            with patch('bulk_email.tasks._filter_optouts_from_recipients', side_effect=optout_and_filter):
+                self._test_run_with_task(
+                    send_bulk_course_email, 'emailed', num_emails, expected_succeeds, skipped=expected_skipped
+                )
 
     def _test_email_address_failures(self, exception):
         """Test that celery handles bad address errors by failing and not retrying."""
@@ -4,8 +4,15 @@ by the individual custom courses feature.
 """
 import json
 import logging
+import threading
+from functools import partial
+from uuid import uuid4
 
+from celery.signals import task_postrun
+from django.core.cache import cache
+from django.core.signals import request_finished
 from django.db import transaction
+from django.dispatch import receiver
 
 import request_cache
 
@@ -18,6 +25,23 @@ from lms.djangoapps.ccx.models import CcxFieldOverride, CustomCourseForEdX
 
 log = logging.getLogger(__name__)
 
+# Number of seconds for which a version of the overrides snapshot of a CCX is
+# cached. A new version is made whenever the overrides of the CCX change.
+OVERRIDES_SNAPSHOT_CACHE_TIMEOUT = 24 * 60 * 60
+
+
+class _PendingInvalidations(threading.local):
+    """
+    The ids of the CCXs whose overrides snapshot must be invalidated again
+    once the transaction of the current thread is committed.
+    """
+    def __init__(self):
+        super(_PendingInvalidations, self).__init__()
+        self.ccx_ids = set()
+
+
+_PENDING_INVALIDATIONS = _PendingInvalidations()
+
 
 class CustomCoursesForEdxOverrideProvider(FieldOverrideProvider):
     """
@@ -87,7 +111,7 @@ def get_override_for_ccx(ccx, block, name, default=None):
 
     clean_ccx_key = _clean_ccx_key(block.location)
 
-    block_overrides = overrides.get(clean_ccx_key, {})
+    block_overrides = overrides.for_block(clean_ccx_key)
     if name in block_overrides:
         try:
             return block.fields[name].from_json(block_overrides[name])
@@ -112,31 +136,171 @@ def _clean_ccx_key(block_location):
     return clean_key.version_agnostic().for_branch(None)
 
 
+class CcxOverrides(object):
+    """
+    The field overrides of a CCX, as loaded for the current request.
+
+    The overrides are kept in the snapshot form in which they are cached
+    across requests: a dictionary mapping the location of each overridden
+    block to a dictionary of field name to (override id, serialized value).
+    The values are only deserialized for the blocks which are accessed.
+    """
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self._blocks = {}
+
+    def for_block(self, clean_ccx_key):
+        """
+        Returns a dictionary mapping the overridden field names of the block to
+        their values, and each field name suffixed by "_id" to the id of its
+        CcxFieldOverride.
+        """
+        if clean_ccx_key not in self._blocks:
+            block_overrides = {}
+            for field, (override_id, value) in self.snapshot.get(unicode(clean_ccx_key), {}).iteritems():
+                block_overrides[field] = json.loads(value)
+                block_overrides[field + "_id"] = override_id
+            self._blocks[clean_ccx_key] = block_overrides
+        return self._blocks[clean_ccx_key]
+
+    def get_serialized(self, clean_ccx_key, name):
+        """
+        Returns the (override id, serialized value) of the field of the block,
+        or (None, None) if it is not overridden.
+        """
+        return self.snapshot.get(unicode(clean_ccx_key), {}).get(name, (None, None))
+
+    def set(self, clean_ccx_key, name, override_id, serialized_value):
+        """
+        Records the override of the field of the block.
+        """
+        self.snapshot.setdefault(unicode(clean_ccx_key), {})[name] = (override_id, serialized_value)
+        self._blocks.pop(clean_ccx_key, None)
+
+    def remove(self, clean_ccx_key, name):
+        """
+        Records that the field of the block is no longer overridden.
+        """
+        self.snapshot.get(unicode(clean_ccx_key), {}).pop(name, None)
+        self._blocks.pop(clean_ccx_key, None)
+
+
+def _snapshot_version_cache_key(ccx_id):
+    """
+    Returns the cache key of the current version of the overrides snapshot of
+    the ccx with the given id.
+    """
+    return u'ccx.overrides.version.{}'.format(ccx_id)
+
+
+def _get_snapshot_version(ccx):
+    """
+    Returns the current version of the overrides snapshot of the ccx.
+    """
+    version_cache_key = _snapshot_version_cache_key(ccx.id)
+    version = cache.get(version_cache_key)
+    if version is None:
+        cache.add(version_cache_key, uuid4().hex, None)
+        version = cache.get(version_cache_key)
+    return version
+
+
+def _change_snapshot_version(ccx_id):
+    """
+    Changes the version of the overrides snapshot of the ccx with the given id.
+    """
+    cache.set(_snapshot_version_cache_key(ccx_id), uuid4().hex, None)
+
+
+def _invalidate_overrides_snapshot(ccx):
+    """
+    Changes the version of the overrides snapshot of the ccx, so that the
+    overrides are reloaded from the database by the following requests.
+
+    This must be called once the changes are committed, since concurrent
+    requests reading the overrides before would cache the previous ones
+    under the new version. When called inside a transaction, as in views
+    and tasks, the version is changed again once it is committed.
+    """
+    _change_snapshot_version(ccx.id)
+    if transaction.get_connection().in_atomic_block:
+        if hasattr(transaction, 'on_commit'):
+            transaction.on_commit(partial(_change_snapshot_version, ccx.id))
+        else:
+            # Django 1.8 has no commit hook, so the invalidation is kept
+            # until this thread is seen outside of any transaction.
+            _PENDING_INVALIDATIONS.ccx_ids.add(ccx.id)
+
+
+def _invalidate_pending_overrides_snapshots():
+    """
+    Changes again the versions of the overrides snapshots invalidated inside
+    the transactions of the current thread, which are now committed.
+    """
+    pending_ccx_ids, _PENDING_INVALIDATIONS.ccx_ids = _PENDING_INVALIDATIONS.ccx_ids, set()
+    for ccx_id in pending_ccx_ids:
+        _change_snapshot_version(ccx_id)
+
+
+@receiver(request_finished)
+def invalidate_pending_overrides_snapshots(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Changes again the versions of the overrides snapshots invalidated inside
+    the transactions of the request, now that they are committed.
+    """
+    _invalidate_pending_overrides_snapshots()
+
+
+@task_postrun.connect
+def invalidate_task_overrides_snapshots(**kwargs):  # pylint: disable=unused-argument
+    """
+    Changes again the versions of the overrides snapshots invalidated inside
+    the transactions of the celery task, now that they are committed.
+    """
+    _invalidate_pending_overrides_snapshots()
+
+
+def _load_overrides_snapshot(ccx):
+    """
+    Returns the snapshot of all of the overrides of the ccx, read from the
+    database.
+    """
+    snapshot = {}
+    query = CcxFieldOverride.objects.filter(ccx=ccx).values_list('id', 'location', 'field', 'value')
+    for override_id, location, field, value in query:
+        location = unicode(_clean_ccx_key(UsageKey.from_string(unicode(location))))
+        snapshot.setdefault(location, {})[field] = (override_id, value)
+    return snapshot
+
+
 def _get_overrides_for_ccx(ccx):
     """
-    Returns a dictionary mapping field name to overriden value for any
-    overrides set on this block for this CCX.
+    Returns the CcxOverrides of the ccx for the current request.
+
+    The overrides snapshot is cached across requests, under its current
+    version, so that it is only read from the database after it changes.
     """
     overrides_cache = request_cache.get_cache('ccx-overrides')
 
-    if ccx not in overrides_cache:
-        overrides = {}
-        query = CcxFieldOverride.objects.filter(
-            ccx=ccx,
-        )
-
-        for override in query:
-            block_overrides = overrides.setdefault(override.location, {})
-            block_overrides[override.field] = json.loads(override.value)
-            block_overrides[override.field + "_id"] = override.id
-            block_overrides[override.field + "_instance"] = override
+    if _PENDING_INVALIDATIONS.ccx_ids and not transaction.get_connection().in_atomic_block:
+        # The transactions which queued these invalidations have ended
+        # since, e.g. in management commands which neither finish a request
+        # nor run a task.
+        _invalidate_pending_overrides_snapshots()
 
-        overrides_cache[ccx] = overrides
+    if ccx not in overrides_cache:
+        version = _get_snapshot_version(ccx)
+        snapshot_cache_key = u'ccx.overrides.{}.{}'.format(ccx.id, version)
+        snapshot = cache.get(snapshot_cache_key) if version else None
+        if snapshot is None:
+            snapshot = _load_overrides_snapshot(ccx)
+            if version:
+                cache.set(snapshot_cache_key, snapshot, OVERRIDES_SNAPSHOT_CACHE_TIMEOUT)
+        overrides_cache[ccx] = CcxOverrides(snapshot)
 
     return overrides_cache[ccx]
 
 
-@transaction.atomic
 def override_field_for_ccx(ccx, block, name, value):
     """
     Overrides a field for the `ccx`.  `block` and `name` specify the block
@@ -146,31 +310,76 @@ def override_field_for_ccx(ccx, block, name, value):
     field = block.fields[name]
     value_json = field.to_json(value)
     serialized_value = json.dumps(value_json)
-    override_has_changes = False
     clean_ccx_key = _clean_ccx_key(block.location)
 
-    override = get_override_for_ccx(ccx, block, name + "_instance")
-    if override:
-        override_has_changes = serialized_value != override.value
+    with transaction.atomic():
+        override_has_changes = False
+        created = False
+        overrides = _get_overrides_for_ccx(ccx)
 
-    if not override:
-        override, created = CcxFieldOverride.objects.get_or_create(
-            ccx=ccx,
-            location=block.location,
-            field=name,
-            defaults={'value': serialized_value},
-        )
-        if created:
-            _get_overrides_for_ccx(ccx).setdefault(clean_ccx_key, {})[name + "_id"] = override.id
+        override_id, current_value = overrides.get_serialized(clean_ccx_key, name)
+        if override_id:
+            override_has_changes = serialized_value != current_value
         else:
-            override_has_changes = serialized_value != override.value
+            override, created = CcxFieldOverride.objects.get_or_create(
+                ccx=ccx,
+                location=block.location,
+                field=name,
+                defaults={'value': serialized_value},
+            )
+            override_id = override.id
+            if not created:
+                override_has_changes = serialized_value != override.value
+
+        if override_has_changes:
+            CcxFieldOverride.objects.filter(id=override_id).update(value=serialized_value)
 
-    if override_has_changes:
-        override.value = serialized_value
-        override.save()
+        overrides.set(clean_ccx_key, name, override_id, serialized_value)
 
-    _get_overrides_for_ccx(ccx).setdefault(clean_ccx_key, {})[name] = value_json
-    _get_overrides_for_ccx(ccx).setdefault(clean_ccx_key, {})[name + "_instance"] = override
+    # Now that the change is committed.
+    if created or override_has_changes:
+        _invalidate_overrides_snapshot(ccx)
+
+
+def bulk_override_fields_for_ccx(ccx, block_field_values):
+    """
+    Overrides many fields for the `ccx` at once.  `block_field_values` is an
+    iterable of (block, name, value) tuples, as taken by
+    override_field_for_ccx.
+
+    The new overrides are created with a single query, and the overrides
+    snapshot of the ccx is invalidated once.
+    """
+    with transaction.atomic():
+        overrides = CcxOverrides(_load_overrides_snapshot(ccx))
+        new_overrides = {}
+        has_changes = False
+        for block, name, value in block_field_values:
+            serialized_value = json.dumps(block.fields[name].to_json(value))
+            clean_ccx_key = _clean_ccx_key(block.location)
+            override_id, current_value = overrides.get_serialized(clean_ccx_key, name)
+            if not override_id:
+                new_overrides[(clean_ccx_key, name)] = CcxFieldOverride(
+                    ccx=ccx,
+                    location=block.location,
+                    field=name,
+                    value=serialized_value,
+                )
+            elif serialized_value != current_value:
+                CcxFieldOverride.objects.filter(id=override_id).update(value=serialized_value)
+                overrides.set(clean_ccx_key, name, override_id, serialized_value)
+                has_changes = True
+
+        if new_overrides:
+            CcxFieldOverride.objects.bulk_create(new_overrides.values())
+            # The ids of the created overrides are only known after reading them back
+            overrides = CcxOverrides(_load_overrides_snapshot(ccx))
+            has_changes = True
+
+    request_cache.get_cache('ccx-overrides')[ccx] = overrides
+    # Now that the changes are committed.
+    if has_changes:
+        _invalidate_overrides_snapshot(ccx)
 
 
 def clear_override_for_ccx(ccx, block, name):
@@ -187,6 +396,7 @@ def clear_override_for_ccx(ccx, block, name):
             field=name).delete()
 
         clear_ccx_field_info_from_ccx_map(ccx, block, name)
+        _invalidate_overrides_snapshot(ccx)
 
     except CcxFieldOverride.DoesNotExist:
         pass
@@ -196,14 +406,7 @@ def clear_ccx_field_info_from_ccx_map(ccx, block, name):  # pylint: disable=inva
     """
     Remove field information from ccx overrides mapping dictionary
     """
-    try:
-        clean_ccx_key = _clean_ccx_key(block.location)
-        ccx_override_map = _get_overrides_for_ccx(ccx).setdefault(clean_ccx_key, {})
-        ccx_override_map.pop(name)
-        ccx_override_map.pop(name + "_id")
-        ccx_override_map.pop(name + "_instance")
-    except KeyError:
-        pass
+    _get_overrides_for_ccx(ccx).remove(_clean_ccx_key(block.location), name)
 
 
 def bulk_delete_ccx_override_fields(ccx, ids):
@@ -214,3 +417,4 @@ def bulk_delete_ccx_override_fields(ccx, ids):
     ids = list(set(ids))
     if ids:
         CcxFieldOverride.objects.filter(ccx=ccx, id__in=ids).delete()
+        _invalidate_overrides_snapshot(ccx)
@@ -11,6 +11,8 @@ from ccx_keys.locator import CCXLocator
 from courseware.courses import get_course_by_id
 from courseware.field_overrides import OverrideFieldData
 from courseware.testutils import FieldOverrideTestMixin
+from celery.signals import task_postrun
+from django.core.signals import request_finished
 from django.test.utils import override_settings
 from lms.djangoapps.courseware.tests.test_field_overrides import inject_field_overrides
 from request_cache.middleware import RequestCache
@@ -21,7 +23,12 @@ from xmodule.modulestore.tests.django_utils import (
 from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
 
 from lms.djangoapps.ccx.models import CustomCourseForEdX
-from lms.djangoapps.ccx.overrides import override_field_for_ccx
+from lms.djangoapps.ccx.overrides import (
+    _get_snapshot_version,
+    bulk_override_fields_for_ccx,
+    get_override_for_ccx,
+    override_field_for_ccx,
+)
 
 from lms.djangoapps.ccx.tests.utils import flatten, iter_blocks
 
@@ -109,7 +116,7 @@ class TestFieldOverrides(FieldOverrideTestMixin, SharedModuleStoreTestCase):
         ccx_start = datetime.datetime(2014, 12, 25, 00, 00, tzinfo=pytz.UTC)
         chapter = self.ccx_course.get_children()[0]
         # One outer SAVEPOINT/RELEASE SAVEPOINT pair around everything caused by the
-        # transaction.atomic decorator wrapping override_field_for_ccx.
+        # transaction.atomic block in override_field_for_ccx.
         # One SELECT and one INSERT.
         # One inner SAVEPOINT/RELEASE SAVEPOINT pair around the INSERT caused by the
         # transaction.atomic down in Django's get_or_create()/_create_object_from_params().
@@ -144,13 +151,78 @@ class TestFieldOverrides(FieldOverrideTestMixin, SharedModuleStoreTestCase):
         ccx_start = datetime.datetime(2014, 12, 25, 00, 00, tzinfo=pytz.UTC)
         chapter = self.ccx_course.get_children()[0]
         # One outer SAVEPOINT/RELEASE SAVEPOINT pair around everything caused by the
-        # transaction.atomic decorator wrapping override_field_for_ccx.
+        # transaction.atomic block in override_field_for_ccx.
         # One SELECT and one INSERT.
         # One inner SAVEPOINT/RELEASE SAVEPOINT pair around the INSERT caused by the
         # transaction.atomic down in Django's get_or_create()/_create_object_from_params().
         with self.assertNumQueries(6):
             override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
 
+    def test_override_reloaded_in_next_request(self):
+        """
+        Test that overrides are read back from the snapshot in a new request.
+        """
+        ccx_start = datetime.datetime(2014, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        chapter = self.ccx_course.get_children()[0]
+        override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
+        RequestCache.clear_request_cache()
+        self.assertEquals(get_override_for_ccx(self.ccx, chapter, 'start'), ccx_start)
+
+    def test_snapshot_invalidated_again_after_request(self):
+        """
+        Test that the snapshot version changed inside a transaction is changed
+        again once the request is finished, after the transaction is committed.
+        """
+        ccx_start = datetime.datetime(2014, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        chapter = self.ccx_course.get_children()[0]
+        override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
+        version = _get_snapshot_version(self.ccx)
+        request_finished.send(sender=None)
+        self.assertNotEqual(_get_snapshot_version(self.ccx), version)
+
+    def test_snapshot_invalidated_again_after_task(self):
+        """
+        Test that the snapshot version changed inside a transaction is changed
+        again once a celery task is finished.
+        """
+        ccx_start = datetime.datetime(2014, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        chapter = self.ccx_course.get_children()[0]
+        override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
+        version = _get_snapshot_version(self.ccx)
+        task_postrun.send(sender=None)
+        new_version = _get_snapshot_version(self.ccx)
+        self.assertNotEqual(new_version, version)
+        # The pending invalidations were drained.
+        task_postrun.send(sender=None)
+        self.assertEqual(_get_snapshot_version(self.ccx), new_version)
+
+    def test_bulk_override(self):
+        """
+        Test that overriding many fields at once creates and updates overrides.
+        """
+        ccx_start = datetime.datetime(2014, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        new_ccx_start = datetime.datetime(2015, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        ccx_due = datetime.datetime(2016, 1, 1, 00, 00, tzinfo=pytz.UTC)
+        chapter = self.ccx_course.get_children()[0]
+        sequential = chapter.get_children()[0]
+        override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
+
+        # One SELECT of the existing overrides, one UPDATE, one INSERT of the new
+        # overrides, one SELECT of the overrides after the INSERT, and one
+        # SAVEPOINT/RELEASE SAVEPOINT pair from transaction.atomic.
+        with self.assertNumQueries(6):
+            bulk_override_fields_for_ccx(self.ccx, [
+                (chapter, 'start', new_ccx_start),
+                (sequential, 'start', ccx_start),
+                (sequential, 'due', ccx_due),
+            ])
+
+        self.assertEquals(get_override_for_ccx(self.ccx, chapter, 'start'), new_ccx_start)
+        self.assertEquals(get_override_for_ccx(self.ccx, sequential, 'start'), ccx_start)
+        self.assertEquals(get_override_for_ccx(self.ccx, sequential, 'due'), ccx_due)
+        RequestCache.clear_request_cache()
+        self.assertEquals(get_override_for_ccx(self.ccx, sequential, 'due'), ccx_due)
+
     def test_override_is_inherited(self):
         """
         Test that sequentials inherit overridden start date from chapter.
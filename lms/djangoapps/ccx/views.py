@@ -49,7 +49,7 @@ from lms.djangoapps.ccx.models import CustomCourseForEdX
 from lms.djangoapps.ccx.overrides import (
     get_override_for_ccx,
     override_field_for_ccx,
-    clear_override_for_ccx,
+    bulk_override_fields_for_ccx,
     clear_ccx_field_info_from_ccx_map,
     bulk_delete_ccx_override_fields,
 )
@@ -265,14 +265,16 @@ def save_ccx(request, course, ccx=None):
     if not ccx:
         raise Http404
 
-    def override_fields(parent, data, graded, earliest=None, ccx_ids_to_delete=None):
+    def override_fields(parent, data, graded, earliest=None, ccx_ids_to_delete=None, field_overrides=None):
         """
-        Recursively apply CCX schedule data to CCX by overriding the
-        `visible_to_staff_only`, `start` and `due` fields for units in the
-        course.
+        Recursively collect the CCX schedule data to apply to the CCX by
+        overriding the `visible_to_staff_only`, `start` and `due` fields for
+        units in the course.
         """
         if ccx_ids_to_delete is None:
             ccx_ids_to_delete = []
+        if field_overrides is None:
+            field_overrides = []
         blocks = {
             str(child.location): child
             for child in parent.get_children()}
@@ -280,15 +282,16 @@ def save_ccx(request, course, ccx=None):
         for unit in data:
             block = blocks[unit['location']]
             if unit['hidden']:  # start changes by labster
-                override_field_for_ccx(ccx, block, 'visible_to_staff_only', unit['hidden'])
+                field_overrides.append((block, 'visible_to_staff_only', unit['hidden']))
             else:
-                clear_override_for_ccx(ccx, block, 'visible_to_staff_only')  # end changes by labster
+                ccx_ids_to_delete.append(get_override_for_ccx(ccx, block, 'visible_to_staff_only_id'))
+                clear_ccx_field_info_from_ccx_map(ccx, block, 'visible_to_staff_only')  # end changes by labster
 
             start = parse_date(unit['start'])
             if start:
                 if not earliest or start < earliest:
                     earliest = start
-                override_field_for_ccx(ccx, block, 'start', start)
+                field_overrides.append((block, 'start', start))
             else:
                 ccx_ids_to_delete.append(get_override_for_ccx(ccx, block, 'start_id'))
                 clear_ccx_field_info_from_ccx_map(ccx, block, 'start')
@@ -297,7 +300,7 @@ def save_ccx(request, course, ccx=None):
             if 'due' in unit:  # checking that the key (due) exist in dict (unit).
                 due = parse_date(unit['due'])
                 if due:
-                    override_field_for_ccx(ccx, block, 'due', due)
+                    field_overrides.append((block, 'due', due))
                 else:
                     ccx_ids_to_delete.append(get_override_for_ccx(ccx, block, 'due_id'))
                     clear_ccx_field_info_from_ccx_map(ccx, block, 'due')
@@ -315,20 +318,21 @@ def save_ccx(request, course, ccx=None):
                 for component in block.get_children():
                     # override start and due date of problem (Copy dates of vertical into problems)
                     if start:
-                        override_field_for_ccx(ccx, component, 'start', start)
+                        field_overrides.append((component, 'start', start))
 
                     if due:
-                        override_field_for_ccx(ccx, component, 'due', due)
+                        field_overrides.append((component, 'due', due))
 
             if children:
-                override_fields(block, children, graded, earliest, ccx_ids_to_delete)
-        return earliest, ccx_ids_to_delete
+                override_fields(block, children, graded, earliest, ccx_ids_to_delete, field_overrides)
+        return earliest, ccx_ids_to_delete, field_overrides
 
     graded = {}
-    earliest, ccx_ids_to_delete = override_fields(course, json.loads(request.body), graded, [])
+    earliest, ccx_ids_to_delete, field_overrides = override_fields(course, json.loads(request.body), graded, [])
     bulk_delete_ccx_override_fields(ccx, ccx_ids_to_delete)
     if earliest:
-        override_field_for_ccx(ccx, course, 'start', earliest)
+        field_overrides.append((course, 'start', earliest))
+    bulk_override_fields_for_ccx(ccx, field_overrides)
 
     # Attempt to automatically adjust grading policy
     changed = False
@@ -13,6 +13,7 @@ from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import CourseKey
 
 from branding import api as branding_api
+from courseware.models import chunks
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from xmodule.modulestore.django import modulestore
 from xmodule_django.models import CourseKeyField
@@ -29,12 +30,15 @@ from certificates.models import (
     GeneratedCertificate,
     certificate_status_for_student,
 )
-from certificates.queue import XQueueCertInterface
+from certificates.queue import CertificateRecords, XQueueCertInterface
 
 
 log = logging.getLogger("edx.certificate")
 MODES = GeneratedCertificate.MODES
 
+# Number of students whose records are fetched together when generating certificates in bulk.
+GENERATE_CERTIFICATES_BATCH_SIZE = 100
+
 
 def is_passing_status(cert_status):
     """
@@ -152,12 +156,61 @@ def generate_user_certificates(student, course_key, course=None, insecure=False,
     if insecure:
         xqueue.use_https = False
     generate_pdf = not has_html_certificates_enabled(course_key, course)
+    return _add_user_certificate(
+        xqueue, student, course_key, course, generate_pdf, generation_mode, forced_grade=forced_grade
+    )
+
+
+def generate_certificates_for_students(students, course_key, course=None, generation_mode='batch',
+                                       batch_size=GENERATE_CERTIFICATES_BATCH_SIZE):
+    """
+    Add the add-cert requests of the given students into the xqueue.
+
+    This is the bulk version of `generate_user_certificates`: the records of
+    the students are read in batches of `batch_size` students, certificate
+    records are created in bulk for the students who do not have one, and all
+    the requests are sent over the same XQueue session.
+
+    Args:
+        students (iterable of User)
+        course_key (CourseKey)
+
+    Keyword Arguments:
+        course (Course): Optionally provide the course object; if not provided
+            it will be loaded.
+        generation_mode - who has requested certificate generation.
+        batch_size - the number of students whose records are read together.
+
+    Yields:
+        (student, status) for each student, where status is the certificate
+        status or None if no certificate could be requested for the student.
+    """
+    if course is None:
+        course = modulestore().get_course(course_key, depth=0)
+    xqueue = XQueueCertInterface()
+    generate_pdf = not has_html_certificates_enabled(course_key, course)
+    for batch in chunks(students, batch_size):
+        records = CertificateRecords(course_key, batch)
+        for student in batch:
+            yield student, _add_user_certificate(
+                xqueue, student, course_key, course, generate_pdf, generation_mode, records=records
+            )
+
+
+def _add_user_certificate(xqueue, student, course_key, course, generate_pdf, generation_mode,
+                          forced_grade=None, records=None):
+    """
+    Add the add-cert request of the student into the xqueue, emit the
+    `edx.certificate.created` event if the student passed, and return the
+    certificate status.
+    """
     cert = xqueue.add_cert(
         student,
         course_key,
         course=course,
         generate_pdf=generate_pdf,
-        forced_grade=forced_grade
+        forced_grade=forced_grade,
+        records=records,
     )
     # If cert_status is not present in certificate valid_statuses (for example unverified) then
     # add_cert returns None and raises AttributeError while accesing cert attributes.
@@ -9,6 +9,7 @@ from uuid import uuid4
 from django.test.client import RequestFactory
 from django.conf import settings
 from django.core.urlresolvers import reverse
+from django.db import IntegrityError, transaction
 from requests.auth import HTTPBasicAuth
 
 from courseware import grades
@@ -50,6 +51,79 @@ class XQueueAddToQueueError(Exception):
         )
 
 
+class CertificateRecords(object):
+    """
+    The records which XQueueCertInterface.add_cert reads for each student,
+    fetched for a batch of students of a course with one query per model.
+
+    Certificate records are created up front for the students who do not have
+    one yet, so that add_cert only has to update them.
+    """
+
+    def __init__(self, course_id, students):
+        self.course_id = course_id
+        user_ids = [student.id for student in students]
+
+        self.certificates = {
+            cert.user_id: cert
+            for cert in GeneratedCertificate.objects.filter(course_id=course_id, user_id__in=user_ids)
+        }
+        missing_user_ids = [user_id for user_id in user_ids if user_id not in self.certificates]
+        if missing_user_ids:
+            try:
+                with transaction.atomic():
+                    GeneratedCertificate.objects.bulk_create(
+                        GeneratedCertificate(user_id=user_id, course_id=course_id) for user_id in missing_user_ids
+                    )
+            except IntegrityError:
+                # Some of the records were created concurrently; add_cert
+                # falls back to get_or_create for those that are still missing.
+                LOGGER.info(u"Could not create all certificate records in bulk for course '%s'.", unicode(course_id))
+            # Fetch the created records, since bulk_create does not set their ids.
+            self.certificates.update({
+                cert.user_id: cert
+                for cert in GeneratedCertificate.objects.filter(course_id=course_id, user_id__in=missing_user_ids)
+            })
+
+        self.profiles = {profile.user_id: profile for profile in UserProfile.objects.filter(user_id__in=user_ids)}
+        self.whitelisted_user_ids = set(CertificateWhitelist.objects.filter(
+            course_id=course_id, whitelist=True, user_id__in=user_ids
+        ).values_list('user_id', flat=True))
+        self.enrollment_modes = dict(CourseEnrollment.objects.filter(
+            course_id=course_id, user_id__in=user_ids
+        ).values_list('user_id', 'mode'))
+        self._course_mode_slugs = None
+
+    def certificate_status(self, student):
+        """
+        Returns the certificate status of the student, as certificate_status_for_student does.
+        """
+        cert = self.certificates.get(student.id)
+        if cert is None:
+            return certificate_status_for_student(student, self.course_id)['status']
+        if cert.mode == 'audit':
+            if self._course_mode_slugs is None:
+                self._course_mode_slugs = [mode.slug for mode in CourseMode.modes_for_course(self.course_id)]
+            if 'honor' not in self._course_mode_slugs:
+                return status.auditing
+        return cert.status
+
+    def profile(self, student):
+        """
+        Returns the profile of the student.
+        """
+        return self.profiles.get(student.id) or UserProfile.objects.get(user=student)
+
+    def certificate(self, student):
+        """
+        Returns the certificate record of the student.
+        """
+        cert = self.certificates.get(student.id)
+        if cert is None:
+            cert, __ = GeneratedCertificate.objects.get_or_create(user=student, course_id=self.course_id)  # pylint: disable=no-member
+        return cert
+
+
 class XQueueCertInterface(object):
     """
     XQueueCertificateInterface provides an
@@ -184,7 +258,8 @@ class XQueueCertInterface(object):
         raise NotImplementedError
 
     # pylint: disable=too-many-statements
-    def add_cert(self, student, course_id, course=None, forced_grade=None, template_file=None, generate_pdf=True):
+    def add_cert(self, student, course_id, course=None, forced_grade=None, template_file=None, generate_pdf=True,
+                 records=None):
         """
         Request a new certificate for a student.
 
@@ -195,6 +270,8 @@ class XQueueCertInterface(object):
                          the certificate request. If this is given, grading
                          will be skipped.
           generate_pdf - Boolean should a message be sent in queue to generate certificate PDF
+          records - CertificateRecords of a batch of students including this one,
+                    to read the student's records from instead of querying them
 
         Will change the certificate status to 'generating' or
         `downloadable` in case of web view certificates.
@@ -226,7 +303,10 @@ class XQueueCertInterface(object):
             status.audit_notpassing,
         ]
 
-        cert_status = certificate_status_for_student(student, course_id)['status']
+        if records is None:
+            cert_status = certificate_status_for_student(student, course_id)['status']
+        else:
+            cert_status = records.certificate_status(student)
         cert = None
 
         if cert_status not in valid_statuses:
@@ -249,16 +329,25 @@ class XQueueCertInterface(object):
         if course is None:
             course = modulestore().get_course(course_id, depth=0)
 
-        profile = UserProfile.objects.get(user=student)
+        if records is None:
+            profile = UserProfile.objects.get(user=student)
+        else:
+            profile = records.profile(student)
         profile_name = profile.name
 
         # Needed for access control in grading.
         self.request.user = student
         self.request.session = {}
 
-        is_whitelisted = self.whitelist.filter(user=student, course_id=course_id, whitelist=True).exists()
+        if records is None:
+            is_whitelisted = self.whitelist.filter(user=student, course_id=course_id, whitelist=True).exists()
+        else:
+            is_whitelisted = student.id in records.whitelisted_user_ids
         grade = grades.grade(student, course)
-        enrollment_mode, __ = CourseEnrollment.enrollment_mode_for_user(student, course_id)
+        if records is None:
+            enrollment_mode, __ = CourseEnrollment.enrollment_mode_for_user(student, course_id)
+        else:
+            enrollment_mode = records.enrollment_modes.get(student.id)
         mode_is_verified = enrollment_mode in GeneratedCertificate.VERIFIED_CERTS_MODES
         user_is_verified = SoftwareSecurePhotoVerification.user_is_verified(student)
         cert_mode = enrollment_mode
@@ -299,7 +388,10 @@ class XQueueCertInterface(object):
             mode_is_verified
         )
 
-        cert, created = GeneratedCertificate.objects.get_or_create(user=student, course_id=course_id)  # pylint: disable=no-member
+        if records is None:
+            cert, __ = GeneratedCertificate.objects.get_or_create(user=student, course_id=course_id)  # pylint: disable=no-member
+        else:
+            cert = records.certificate(student)
 
         cert.mode = cert_mode
         cert.user = student
@@ -374,7 +466,11 @@ class XQueueCertInterface(object):
         # Check to see whether the student is on the the embargoed
         # country restricted list. If so, they should not receive a
         # certificate -- set their status to restricted and log it.
-        if self.restricted.filter(user=student).exists():
+        if records is None:
+            is_restricted = self.restricted.filter(user=student).exists()
+        else:
+            is_restricted = not profile.allow_certificate
+        if is_restricted:
             cert.status = status.restricted
             cert.save()
 
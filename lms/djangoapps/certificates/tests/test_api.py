@@ -494,6 +494,49 @@ class GenerateUserCertificatesTest(EventTestMixin, WebCertificateTestMixin, Modu
         cert = GeneratedCertificate.eligible_certificates.get(user=self.student, course_id=self.course.id)
         self.assertEqual(cert.status, CertificateStatuses.downloadable)
 
+    def test_generate_certificates_for_students(self):
+        students = [self.student] + [UserFactory.create() for __ in range(2)]
+        for student in students[1:]:
+            CourseEnrollment.enroll(student, self.course.id, mode='honor')
+        GeneratedCertificateFactory.create(
+            user=students[1],
+            course_id=self.course.id,
+            status=CertificateStatuses.notpassing,
+            mode='honor'
+        )
+
+        with self._mock_passing_grade():
+            with self._mock_queue() as mock_send_to_queue:
+                with patch('capa.xqueue_interface.requests.Session') as mock_session:
+                    results = list(certs_api.generate_certificates_for_students(
+                        students, self.course.id, batch_size=2
+                    ))
+
+        self.assertEqual(results, [(student, CertificateStatuses.generating) for student in students])
+        # All the requests are sent to the queue over the same session
+        self.assertEqual(mock_session.call_count, 1)
+        self.assertEqual(mock_send_to_queue.call_count, len(students))
+        for student in students:
+            cert = GeneratedCertificate.eligible_certificates.get(user=student, course_id=self.course.id)
+            self.assertEqual(cert.status, CertificateStatuses.generating)
+            self.assertEqual(cert.grade, '0.75')
+            self.assert_event_emitted(
+                'edx.certificate.created',
+                user_id=student.id,
+                course_id=unicode(self.course.id),
+                certificate_url=certs_api.get_certificate_url(student.id, self.course.id),
+                certificate_id=cert.verify_uuid,
+                enrollment_mode=cert.mode,
+                generation_mode='batch'
+            )
+
+    def test_generate_certificates_for_students_not_passing(self):
+        with self._mock_queue() as mock_send_to_queue:
+            results = list(certs_api.generate_certificates_for_students([self.student], self.course.id))
+
+        self.assertEqual(results, [(self.student, CertificateStatuses.notpassing)])
+        self.assertFalse(mock_send_to_queue.called)
+
     @patch.dict(settings.FEATURES, {'CERTIFICATES_HTML_VIEW': False})
     def test_cert_url_empty_with_invalid_certificate(self):
         """
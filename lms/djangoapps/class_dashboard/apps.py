@@ -0,0 +1,15 @@
+"""
+Django AppConfig module for the class_dashboard app
+"""
+from django.apps import AppConfig
+
+
+class ClassDashboardConfig(AppConfig):
+    """
+    Django AppConfig class for the class_dashboard app
+    """
+    name = 'class_dashboard'
+
+    def ready(self):
+        # Import signals to wire up the signal handlers contained within
+        from class_dashboard import signals  # pylint: disable=unused-variable
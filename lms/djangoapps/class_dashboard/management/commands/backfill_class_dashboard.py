@@ -0,0 +1,74 @@
+"""
+Command to recompute the class_dashboard aggregates from the student modules.
+"""
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey
+
+from courseware.models import StudentModule
+from class_dashboard.models import ProblemGradeCount, SequentialOpenCount
+
+
+log = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Example usage:
+        $ ./manage.py lms backfill_class_dashboard --all --settings=devstack
+        $ ./manage.py lms backfill_class_dashboard 'edX/DemoX/Demo_Course' --settings=devstack
+    """
+    args = '<course_id course_id ...>'
+    help = (
+        'Recomputes the problem grade and subsection open counts of the Metrics tab of the '
+        'instructor dashboard for one or more courses. Run it when enabling the '
+        'ENABLE_CLASS_DASHBOARD_COUNTS feature, since the counts are only maintained while it is enabled.'
+    )
+
+    def add_arguments(self, parser):
+        """
+        Entry point for subclassed commands to add custom arguments.
+        """
+        parser.add_argument(
+            '--all',
+            help='Recompute the counts of all the courses with student modules.',
+            action='store_true',
+            default=False,
+        )
+
+    def handle(self, *args, **options):
+
+        if options.get('all'):
+            course_keys = StudentModule.objects.filter(
+                module_type__in=['problem', 'sequential'],
+            ).values_list('course_id', flat=True).distinct()
+        else:
+            if len(args) < 1:
+                raise CommandError('At least one course or --all must be specified.')
+            try:
+                course_keys = [CourseKey.from_string(arg) for arg in args]
+            except InvalidKeyError:
+                raise CommandError('Invalid key specified.')
+
+        for course_key in course_keys:
+            log.info('Recomputing class dashboard counts for %s.', unicode(course_key))
+            backfill_course(course_key)
+
+        log.info('Finished recomputing class dashboard counts.')
+
+
+@transaction.atomic
+def backfill_course(course_key):
+    """
+    Replaces the class dashboard counts of the course with ones computed from
+    its student modules.
+    """
+    for model in (ProblemGradeCount, SequentialOpenCount):
+        model.objects.filter(course_id=course_key).delete()
+        model.objects.bulk_create([
+            model(course_id=course_key, **row)
+            for row in model.count_student_modules(course_key)
+        ])
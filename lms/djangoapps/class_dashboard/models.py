@@ -0,0 +1,111 @@
+"""
+Counts of student module data for the Metrics tab of the instructor dashboard.
+
+While the ENABLE_CLASS_DASHBOARD_COUNTS feature is enabled, these are kept up to
+date by the handlers in class_dashboard.signals, and the dashboard reads them
+instead of aggregating the StudentModule table of the whole course on every
+load. The backfill_class_dashboard management command recomputes them from
+StudentModule, and should be run when the feature is enabled.
+"""
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F
+
+from courseware.models import StudentModule
+from xmodule_django.models import CourseKeyField, LocationKeyField
+
+
+def counts_enabled():
+    """
+    Returns whether the counts are maintained and read by the dashboard.
+    """
+    return settings.FEATURES.get('ENABLE_CLASS_DASHBOARD_COUNTS', False)
+
+
+class BlockCountModel(models.Model):
+    """
+    Base class for counts of student modules, kept per course and block.
+    """
+    course_id = CourseKeyField(max_length=255, db_index=True)
+    module_state_key = LocationKeyField(max_length=255, db_column='module_id')
+    count = models.IntegerField(default=0)
+
+    class Meta(object):
+        abstract = True
+
+    # Names of the fields which, with course_id and module_state_key, identify a count.
+    KEY_FIELDS = ()
+
+    @classmethod
+    def add(cls, course_id, module_state_key, delta=1, **kwargs):
+        """
+        Adds `delta` to the count of the row for the given block and other key
+        fields, creating the row if needed.
+        """
+        rows = cls.objects.filter(course_id=course_id, module_state_key=module_state_key, **kwargs)
+        if rows.update(count=F('count') + delta) or delta < 0:
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(course_id=course_id, module_state_key=module_state_key, count=delta, **kwargs)
+        except IntegrityError:
+            # The row was created concurrently.
+            rows.update(count=F('count') + delta)
+
+    @classmethod
+    def count_student_modules(cls, course_id):
+        """
+        Returns the counts of the course computed from StudentModule, as a
+        values queryset of module_state_key, the other key fields and count.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def get_counts(cls, course_id):
+        """
+        Returns the counts of the course, in the format of count_student_modules.
+        """
+        if not counts_enabled():
+            return cls.count_student_modules(course_id)
+        return cls.objects.filter(
+            course_id__exact=course_id,
+            count__gt=0,
+        ).values('module_state_key', *cls.KEY_FIELDS + ('count',))
+
+
+class ProblemGradeCount(BlockCountModel):
+    """
+    The number of students with a given grade and max_grade on a problem.
+    """
+    grade = models.FloatField()
+    max_grade = models.FloatField(null=True, blank=True)
+
+    KEY_FIELDS = ('grade', 'max_grade')
+
+    class Meta(object):
+        app_label = "class_dashboard"
+        unique_together = (('course_id', 'module_state_key', 'grade', 'max_grade'),)
+
+    @classmethod
+    def count_student_modules(cls, course_id):
+        return StudentModule.objects.filter(
+            course_id__exact=course_id,
+            grade__isnull=False,
+            module_type__exact="problem",
+        ).values('module_state_key', 'grade', 'max_grade').annotate(count=Count('grade'))
+
+
+class SequentialOpenCount(BlockCountModel):
+    """
+    The number of students who opened a subsection.
+    """
+    class Meta(object):
+        app_label = "class_dashboard"
+        unique_together = (('course_id', 'module_state_key'),)
+
+    @classmethod
+    def count_student_modules(cls, course_id):
+        return StudentModule.objects.filter(
+            course_id__exact=course_id,
+            module_type__exact="sequential",
+        ).values('module_state_key').annotate(count=Count('module_state_key'))
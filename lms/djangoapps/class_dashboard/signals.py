@@ -0,0 +1,70 @@
+"""
+Signal handlers which keep the class_dashboard aggregates up to date as student
+modules are created, graded and deleted.
+"""
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from courseware.models import StudentModule
+from class_dashboard.models import ProblemGradeCount, SequentialOpenCount, counts_enabled
+
+# Attribute of StudentModule instances holding the (grade, max_grade) last read from or written to the database.
+SAVED_GRADE_ATTR = '_class_dashboard_saved_grade'
+
+
+def _add_to_grade_count(student_module, grade, delta):
+    """
+    Adds `delta` to the count of students with the given (grade, max_grade) on
+    the problem of the student module.
+    """
+    grade, max_grade = grade
+    if grade is not None:
+        ProblemGradeCount.add(
+            student_module.course_id, student_module.module_state_key, delta, grade=grade, max_grade=max_grade
+        )
+
+
+@receiver(post_init, sender=StudentModule)
+def remember_saved_grade(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Remembers the grade of a student module as it was loaded, so that the
+    count of its previous grade can be decremented when it changes.
+    """
+    setattr(instance, SAVED_GRADE_ATTR, (instance.grade, instance.max_grade))
+
+
+@receiver(post_save, sender=StudentModule)
+def update_counts_on_save(sender, instance, created, **kwargs):  # pylint: disable=unused-argument
+    """
+    Counts a new subsection opening or problem grade, or moves a student from
+    the count of their previous grade on a problem to their new grade.
+    """
+    if not counts_enabled():
+        return
+
+    grade = (instance.grade, instance.max_grade)
+    if created:
+        if instance.module_type == 'sequential':
+            SequentialOpenCount.add(instance.course_id, instance.module_state_key)
+        elif instance.module_type == 'problem':
+            _add_to_grade_count(instance, grade, 1)
+    elif instance.module_type == 'problem':
+        saved_grade = getattr(instance, SAVED_GRADE_ATTR, grade)
+        if saved_grade != grade:
+            _add_to_grade_count(instance, saved_grade, -1)
+            _add_to_grade_count(instance, grade, 1)
+    setattr(instance, SAVED_GRADE_ATTR, grade)
+
+
+@receiver(post_delete, sender=StudentModule)
+def update_counts_on_delete(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Removes a deleted student module from the counts.
+    """
+    if not counts_enabled():
+        return
+
+    if instance.module_type == 'sequential':
+        SequentialOpenCount.add(instance.course_id, instance.module_state_key, -1)
+    elif instance.module_type == 'problem':
+        _add_to_grade_count(instance, getattr(instance, SAVED_GRADE_ATTR, (instance.grade, instance.max_grade)), -1)
@@ -4,6 +4,7 @@ Tests for class dashboard (Metrics tab in instructor dashboard)
 
 import json
 
+from django.conf import settings
 from django.core.urlresolvers import reverse
 from django.test.client import RequestFactory
 from mock import patch
@@ -323,3 +324,15 @@ class TestGetProblemGradeDistribution(SharedModuleStoreTestCase):
         """
         ret_val = bool(has_instructor_access_for_class(self.instructor, self.course.id))
         self.assertEquals(ret_val, True)
+
+
+@attr('shard_1')
+class TestGetProblemGradeDistributionCounts(TestGetProblemGradeDistribution):
+    """
+    Runs the same tests with the dashboard reading the maintained counts.
+    """
+    def setUp(self):
+        patcher = patch.dict(settings.FEATURES, {'ENABLE_CLASS_DASHBOARD_COUNTS': True})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super(TestGetProblemGradeDistributionCounts, self).setUp()
@@ -0,0 +1,112 @@
+"""
+Tests for the maintenance of the class dashboard counts.
+"""
+from django.conf import settings
+from django.test import TestCase
+from mock import patch
+from nose.plugins.attrib import attr
+
+from courseware.models import StudentModule
+from courseware.tests.factories import StudentModuleFactory
+from opaque_keys.edx.locations import SlashSeparatedCourseKey
+
+from class_dashboard.management.commands.backfill_class_dashboard import backfill_course
+from class_dashboard.models import ProblemGradeCount, SequentialOpenCount
+
+
+@attr('shard_1')
+@patch.dict(settings.FEATURES, {'ENABLE_CLASS_DASHBOARD_COUNTS': True})
+class TestClassDashboardCounts(TestCase):
+    """
+    Tests that the counts follow the student modules.
+    """
+    def setUp(self):
+        super(TestClassDashboardCounts, self).setUp()
+        self.course_id = SlashSeparatedCourseKey("MITx", "999", "Robot_Super_Course")
+        self.problem = self.course_id.make_usage_key('problem', 'problem1')
+        self.sequential = self.course_id.make_usage_key('sequential', 'sequential1')
+
+    def _grade_counts(self):
+        """
+        Returns the non-zero counts of the course's problem grades.
+        """
+        return {
+            (row.module_state_key, row.grade, row.max_grade): row.count
+            for row in ProblemGradeCount.objects.filter(course_id=self.course_id, count__gt=0)
+        }
+
+    def _open_counts(self):
+        """
+        Returns the non-zero counts of the course's subsection openings.
+        """
+        return {
+            row.module_state_key: row.count
+            for row in SequentialOpenCount.objects.filter(course_id=self.course_id, count__gt=0)
+        }
+
+    def _create_problem_module(self, grade, max_grade=2):
+        """
+        Creates a graded student module of the problem.
+        """
+        return StudentModuleFactory.create(
+            course_id=self.course_id, module_state_key=self.problem, grade=grade, max_grade=max_grade
+        )
+
+    def test_create(self):
+        self._create_problem_module(1)
+        self._create_problem_module(1)
+        self._create_problem_module(None)
+        StudentModuleFactory.create(
+            course_id=self.course_id, module_state_key=self.sequential, module_type='sequential'
+        )
+        self.assertEqual(self._grade_counts(), {(self.problem, 1, 2): 2})
+        self.assertEqual(self._open_counts(), {self.sequential: 1})
+
+    def test_change_grade(self):
+        self._create_problem_module(1)
+        module = self._create_problem_module(None)
+
+        # The saved grade of a module read from the database is known too
+        module = StudentModule.objects.get(id=module.id)
+        module.grade = 1
+        module.save()
+        self.assertEqual(self._grade_counts(), {(self.problem, 1, 2): 2})
+
+        module.grade = 2
+        module.save()
+        self.assertEqual(self._grade_counts(), {(self.problem, 1, 2): 1, (self.problem, 2, 2): 1})
+
+        module.state = '{}'
+        module.save()
+        self.assertEqual(self._grade_counts(), {(self.problem, 1, 2): 1, (self.problem, 2, 2): 1})
+
+    def test_delete(self):
+        module = self._create_problem_module(1)
+        sequential_module = StudentModuleFactory.create(
+            course_id=self.course_id, module_state_key=self.sequential, module_type='sequential'
+        )
+        module.delete()
+        sequential_module.delete()
+        self.assertEqual(self._grade_counts(), {})
+        self.assertEqual(self._open_counts(), {})
+
+    @patch.dict(settings.FEATURES, {'ENABLE_CLASS_DASHBOARD_COUNTS': False})
+    def test_disabled(self):
+        self._create_problem_module(1)
+        self.assertEqual(self._grade_counts(), {})
+
+    def test_backfill(self):
+        with patch.dict(settings.FEATURES, {'ENABLE_CLASS_DASHBOARD_COUNTS': False}):
+            self._create_problem_module(1)
+            self._create_problem_module(2)
+            StudentModuleFactory.create(
+                course_id=self.course_id, module_state_key=self.sequential, module_type='sequential'
+            )
+
+        backfill_course(self.course_id)
+        self.assertEqual(self._grade_counts(), {(self.problem, 1, 2): 1, (self.problem, 2, 2): 1})
+        self.assertEqual(self._open_counts(), {self.sequential: 1})
+
+        # Backfilling again does not count the modules twice
+        backfill_course(self.course_id)
+        self.assertEqual(self._grade_counts(), {(self.problem, 1, 2): 1, (self.problem, 2, 2): 1})
@@ -2,16 +2,106 @@
 Serializers for Course Blocks related return objects.
 """
 from django.conf import settings
+from django.utils.http import RFC3986_SUBDELIMS, urlquote
 from rest_framework import serializers
 from rest_framework.reverse import reverse
 
 from .transformers import SUPPORTED_FIELDS
 
 
+def _quote_url_part(value):
+    """
+    Quotes the value as reverse quotes the values of URL parameters.
+    """
+    return urlquote(value, safe=RFC3986_SUBDELIMS + str('/~:@'))
+
+
+class BlockURLBuilder(object):
+    """
+    Builds the URLs of a view for the blocks of a course, reversing the URL
+    only once and substituting the usage key of each block into it.
+    """
+    def __init__(self, view_name, get_kwargs, request):
+        """
+        Arguments:
+            view_name (str) - Name of the view to reverse.
+
+            get_kwargs ((block_key)->dict) - Returns the kwargs for
+                reversing the URL of the given block.
+
+            request (HttpRequest) - Request for building absolute URLs.
+        """
+        self.view_name = view_name
+        self.get_kwargs = get_kwargs
+        self.request = request
+        self._course_key = None
+        self._template = None
+
+    def reverse(self, block_key):
+        """
+        Returns the URL for the given block.
+        """
+        if self._template is not None and block_key.course_key == self._course_key:
+            prefix, suffix = self._template
+            return prefix + _quote_url_part(unicode(block_key)) + suffix
+
+        url = reverse(self.view_name, kwargs=self.get_kwargs(block_key), request=self.request)
+        if self._template is None and isinstance(url, basestring):
+            prefix, found, suffix = url.rpartition(_quote_url_part(unicode(block_key)))
+            if found:
+                self._course_key = block_key.course_key
+                self._template = (prefix, suffix)
+        return url
+
+
 class BlockSerializer(serializers.Serializer):  # pylint: disable=abstract-method
     """
     Serializer for single course block
     """
+    def __init__(self, *args, **kwargs):
+        super(BlockSerializer, self).__init__(*args, **kwargs)
+        self._requested_supported_fields = None
+        self._url_builders = None
+
+    def _get_requested_supported_fields(self):
+        """
+        Returns the supported fields which are requested, computed once for
+        all the blocks serialized by this serializer.
+        """
+        if self._requested_supported_fields is None:
+            self._requested_supported_fields = [
+                supported_field for supported_field in SUPPORTED_FIELDS
+                if supported_field.requested_field_name in self.context['requested_fields']
+            ]
+        return self._requested_supported_fields
+
+    def _get_url_builders(self):
+        """
+        Returns the (field name, BlockURLBuilder) pairs for the URLs of the
+        blocks, created once for all the blocks serialized by this serializer.
+        """
+        if self._url_builders is None:
+            request = self.context['request']
+            self._url_builders = [
+                ('lms_web_url', BlockURLBuilder(
+                    'jump_to',
+                    lambda block_key: {'course_id': unicode(block_key.course_key), 'location': unicode(block_key)},
+                    request,
+                )),
+                ('student_view_url', BlockURLBuilder(
+                    'courseware.views.views.render_xblock',
+                    lambda block_key: {'usage_key_string': unicode(block_key)},
+                    request,
+                )),
+            ]
+            if settings.FEATURES.get("ENABLE_LTI_PROVIDER") and 'lti_url' in self.context['requested_fields']:
+                self._url_builders.append(('lti_url', BlockURLBuilder(
+                    'lti_provider_launch',
+                    lambda block_key: {'course_id': unicode(block_key.course_key), 'usage_id': unicode(block_key)},
+                    request,
+                )))
+        return self._url_builders
+
     def _get_field(self, block_key, transformer, field_name, default):
         """
         Get the field value requested.  The field may be an XBlock field, a
@@ -35,39 +125,21 @@ class BlockSerializer(serializers.Serializer):  # pylint: disable=abstract-metho
         Return a serializable representation of the requested block
         """
         # create response data dict for basic fields
-        data = {
-            'id': unicode(block_key),
-            'lms_web_url': reverse(
-                'jump_to',
-                kwargs={'course_id': unicode(block_key.course_key), 'location': unicode(block_key)},
-                request=self.context['request'],
-            ),
-            'student_view_url': reverse(
-                'courseware.views.views.render_xblock',
-                kwargs={'usage_key_string': unicode(block_key)},
-                request=self.context['request'],
-            ),
-        }
-
-        if settings.FEATURES.get("ENABLE_LTI_PROVIDER") and 'lti_url' in self.context['requested_fields']:
-            data['lti_url'] = reverse(
-                'lti_provider_launch',
-                kwargs={'course_id': unicode(block_key.course_key), 'usage_id': unicode(block_key)},
-                request=self.context['request'],
-            )
+        data = {'id': unicode(block_key)}
+        for field_name, url_builder in self._get_url_builders():
+            data[field_name] = url_builder.reverse(block_key)
 
         # add additional requested fields that are supported by the various transformers
-        for supported_field in SUPPORTED_FIELDS:
-            if supported_field.requested_field_name in self.context['requested_fields']:
-                field_value = self._get_field(
-                    block_key,
-                    supported_field.transformer,
-                    supported_field.block_field_name,
-                    supported_field.default_value,
-                )
-                if field_value is not None:
-                    # only return fields that have data
-                    data[supported_field.serializer_field_name] = field_value
+        for supported_field in self._get_requested_supported_fields():
+            field_value = self._get_field(
+                block_key,
+                supported_field.transformer,
+                supported_field.block_field_name,
+                supported_field.default_value,
+            )
+            if field_value is not None:
+                # only return fields that have data
+                data[supported_field.serializer_field_name] = field_value
 
         if 'children' in self.context['requested_fields']:
             children = self.context['block_structure'].get_children(block_key)
@@ -89,7 +161,8 @@ class BlockDictSerializer(serializers.Serializer):  # pylint: disable=abstract-m
         """
         Serialize to a dictionary of blocks keyed by the block's usage_key.
         """
+        block_serializer = BlockSerializer(context=self.context)
         return {
-            unicode(block_key): BlockSerializer(block_key, context=self.context).data
+            unicode(block_key): block_serializer.to_representation(block_key)
             for block_key in structure
         }
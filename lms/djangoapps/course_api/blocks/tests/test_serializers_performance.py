@@ -0,0 +1,87 @@
+"""
+Performance test comparing serializing each course block with its own
+BlockSerializer, as BlockDictSerializer used to, with BlockDictSerializer.
+"""
+import unittest
+
+from django.test.client import RequestFactory
+from nose.plugins.skip import SkipTest
+
+from lms.djangoapps.course_blocks.api import get_course_blocks
+from openedx.core.lib.block_structure.transformers import BlockStructureTransformers
+from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
+from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
+
+from ..serializers import BlockSerializer, BlockDictSerializer
+from ..transformers.blocks_api import BlocksAPITransformer
+
+# The dependency below needs to be installed manually from the development.txt file, which doesn't
+# get installed during unit tests!
+try:
+    from code_block_timer import CodeBlockTimer
+except ImportError:
+    CodeBlockTimer = None
+
+# Number of children of each chapter, sequential and vertical: 10 chapters
+# with 100 sequentials, 1000 verticals and 3000 html blocks.
+BRANCHING = (10, 10, 10, 3)
+BLOCK_TYPES = ('chapter', 'sequential', 'vertical', 'html')
+
+REQUESTED_FIELDS = ['children', 'display_name', 'graded', 'format', 'type', 'block_counts']
+
+
+# Eventually, exclude this attribute from regular unittests while running *only* tests
+# with this attribute during regular performance tests.
+# @attr("perf_test")
+@unittest.skip
+class BlockSerializerPerformanceTest(ModuleStoreTestCase):
+    """
+    This class exists to time serializing the blocks of a course with about
+    4000 blocks.
+    """
+
+    # Use this attribute to skip this test on regular unittest CI runs.
+    perf_test = True
+
+    def _populate_course(self, parent_location, depth=0):
+        """
+        Adds the chapters, sequentials, verticals and html blocks to the course.
+        """
+        for index in range(BRANCHING[depth]):
+            child = ItemFactory.create(
+                parent_location=parent_location,
+                category=BLOCK_TYPES[depth],
+                display_name=u'{} {}'.format(BLOCK_TYPES[depth], index),
+            )
+            if depth + 1 < len(BLOCK_TYPES):
+                self._populate_course(child.location, depth + 1)
+
+    def test_serialize_blocks(self):
+        """
+        Generate timings for serializing the blocks of a course.
+        """
+        if CodeBlockTimer is None:
+            raise SkipTest("CodeBlockTimer undefined.")
+
+        course = CourseFactory.create()
+        with self.store.bulk_operations(course.id, emit_signals=False):
+            self._populate_course(course.location)
+
+        transformers = BlockStructureTransformers([BlocksAPITransformer(['html'], [])])
+        block_structure = get_course_blocks(None, course.location, transformers)
+        context = {
+            'request': RequestFactory().get('/'),
+            'block_structure': block_structure,
+            'requested_fields': REQUESTED_FIELDS,
+        }
+
+        with CodeBlockTimer("SerializeBlocks:serializer_per_block"):
+            per_block_data = {
+                unicode(block_key): BlockSerializer(block_key, context=context).data
+                for block_key in block_structure
+            }
+
+        with CodeBlockTimer("SerializeBlocks:block_dict_serializer"):
+            dict_data = BlockDictSerializer(block_structure, context=context, many=False).data
+
+        self.assertEqual(per_block_data, dict_data['blocks'])
@@ -181,6 +181,30 @@ class TestBlocksView(SharedModuleStoreTestCase):
             self.assertEquals(block_data['type'], block_key.block_type)
             self.assertEquals(block_data['display_name'], self.store.get_item(block_key).display_name or '')
 
+    def test_block_urls(self):
+        response = self.verify_response()
+        for block_key_string, block_data in response.data['blocks'].iteritems():
+            block_key = deserialize_usage_key(block_key_string, self.course_key)
+            self.assertEquals(
+                block_data['lms_web_url'],
+                'http://testserver' + reverse(
+                    'jump_to',
+                    kwargs={'course_id': unicode(self.course_key), 'location': unicode(block_key)},
+                ),
+            )
+            self.assertEquals(
+                block_data['student_view_url'],
+                'http://testserver' + reverse(
+                    'courseware.views.views.render_xblock',
+                    kwargs={'usage_key_string': unicode(block_key)},
+                ),
+            )
+
+    def test_gzip(self):
+        response = self.client.get(self.url, self.query_params, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(response['Content-Encoding'], 'gzip')
+
     def test_return_type_param(self):
         response = self.verify_response(params={'return_type': 'list'})
         self.verify_response_block_list(response)
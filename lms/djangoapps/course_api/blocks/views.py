@@ -3,6 +3,8 @@ CourseBlocks API views
 """
 from django.core.exceptions import ValidationError
 from django.http import Http404
+from django.utils.decorators import method_decorator
+from django.views.decorators.gzip import gzip_page
 from rest_framework.generics import ListAPIView
 from rest_framework.response import Response
 
@@ -172,6 +174,14 @@ class BlocksView(DeveloperErrorViewMixin, ListAPIView):
 
     """
 
+    @method_decorator(gzip_page)
+    def dispatch(self, request, *args, **kwargs):
+        """
+        Compresses the response when the client accepts gzip, since the
+        responses for large courses can be many megabytes of JSON.
+        """
+        return super(BlocksView, self).dispatch(request, *args, **kwargs)
+
     def list(self, request, usage_key_string):  # pylint: disable=arguments-differ
         """
         REST API endpoint for listing all the blocks information in the course,
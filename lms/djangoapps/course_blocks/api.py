@@ -2,12 +2,14 @@
 API entry point to the course_blocks app with top-level
 get_course_blocks function.
 """
+from django.conf import settings
 from django.core.cache import cache
 from openedx.core.djangoapps.content.block_structure.api import get_block_structure_manager
 from openedx.core.lib.block_structure.manager import BlockStructureManager
 from openedx.core.lib.block_structure.transformers import BlockStructureTransformers
 from xmodule.modulestore.django import modulestore
 
+from .filter_cache import CourseBlocksFilterCache
 from .transformers import (
     library_content,
     start_date,
@@ -61,6 +63,10 @@ def get_course_blocks(
         transformers = BlockStructureTransformers(COURSE_BLOCK_ACCESS_TRANSFORMERS)
     transformers.usage_info = CourseUsageInfo(starting_block_usage_key.course_key, user)
 
+    filter_cache_timeout = getattr(settings, 'COURSE_BLOCKS_FILTER_CACHE_TIMEOUT', 0)
+    if filter_cache_timeout:
+        transformers.filter_cache = CourseBlocksFilterCache(cache, filter_cache_timeout)
+
     return get_block_structure_manager(starting_block_usage_key.course_key).get_transformed(
         transformers,
         starting_block_usage_key,
@@ -0,0 +1,151 @@
+"""
+Per-user cache of the blocks which remain in a course block structure after
+the filters of the course block access transformers are applied, so that
+repeated calls to get_course_blocks for the same user skip the filtering.
+"""
+from bisect import bisect_right
+from datetime import datetime, timedelta
+import hashlib
+
+from django.conf import settings
+from pytz import UTC
+
+from lms.djangoapps.courseware.access_utils import in_preview_mode
+from lms.djangoapps.courseware.masquerade import get_course_masquerade
+from student.roles import CourseBetaTesterRole
+
+from .transformers.split_test import SplitTestTransformer
+from .transformers.start_date import StartDateTransformer
+from .transformers.user_partitions import UserPartitionTransformer, _get_user_partition_groups
+from .transformers.visibility import VisibilityTransformer
+
+
+# Transformers whose filters only depend on the collected block structure,
+# the user's staff access and partition groups, and the current date.
+CACHEABLE_TRANSFORMER_NAMES = frozenset([
+    SplitTestTransformer.name(),
+    StartDateTransformer.name(),
+    UserPartitionTransformer.name(),
+    VisibilityTransformer.name(),
+])
+
+
+class CourseBlocksFilterCache(object):
+    """
+    Cache of the block keys remaining after the filters of the course block
+    access transformers, to be set as the filter_cache of a
+    BlockStructureTransformers collection.
+
+    The cached block keys are keyed by the collected version of the block
+    structure, its root, the user, their staff access and partition groups,
+    and the date bucket the current time falls in, so that entries are
+    never used after any of these change. Date buckets are delimited by the
+    distinct start dates of the blocks, which are computed once per
+    collected version of the block structure and cached alongside.
+    """
+    def __init__(self, cache, timeout):
+        """
+        Arguments:
+            cache (django.core.cache.backends.base.BaseCache) - The cache
+                in which to store the block keys.
+
+            timeout (int) - Number of seconds for which to cache them.
+        """
+        self._cache = cache
+        self._timeout = timeout
+
+    def can_cache(self, transformer):
+        """
+        Returns whether the result of the given transformer's filters may
+        be cached.
+        """
+        return transformer.name() in CACHEABLE_TRANSFORMER_NAMES
+
+    def get_key(self, usage_info, transformers, block_structure):
+        """
+        Returns the cache key for the result of the given transformers'
+        filters on the block structure for usage_info, or None if it
+        can't be cached.
+        """
+        if block_structure.collected_version is None:
+            return None
+
+        user = usage_info.user
+        course_key = usage_info.course_key
+        if (
+                settings.FEATURES['DISABLE_START_DATES'] or
+                in_preview_mode() or
+                get_course_masquerade(user, course_key)
+        ):
+            return None
+
+        user_partitions = block_structure.get_transformer_data(UserPartitionTransformer, 'user_partitions')
+        user_groups = _get_user_partition_groups(course_key, user_partitions, user) if user_partitions else {}
+
+        start_dates, beta_start_dates = self._get_start_dates(block_structure)
+        is_beta_tester = (
+            start_dates != beta_start_dates and CourseBetaTesterRole(course_key).has_user(user)
+        )
+        if is_beta_tester:
+            start_dates = beta_start_dates
+        date_bucket = bisect_right(start_dates, datetime.now(UTC))
+
+        key_data = [
+            block_structure.collected_version,
+            unicode(block_structure.root_block_usage_key),
+            user.id,
+            usage_info.has_staff_access,
+            sorted(transformer.name() for transformer in transformers),
+            sorted((partition_id, group.id) for partition_id, group in user_groups.iteritems()),
+            is_beta_tester,
+            date_bucket,
+        ]
+        return u'course_blocks.filtered.{}'.format(hashlib.md5(repr(key_data)).hexdigest())
+
+    def get(self, key):
+        """
+        Returns the cached set of block keys for the given cache key, or None.
+        """
+        return self._cache.get(key)
+
+    def set(self, key, block_keys):
+        """
+        Caches the given set of block keys for the given cache key.
+        """
+        self._cache.set(key, block_keys, self._timeout)
+
+    def _get_start_dates(self, block_structure):
+        """
+        Returns the sorted distinct start dates of the blocks in the block
+        structure, for users and for beta testers, computed once per
+        collected version of the block structure.
+        """
+        key = u'course_blocks.start_dates.{}'.format(hashlib.md5(repr([
+            block_structure.collected_version,
+            unicode(block_structure.root_block_usage_key),
+        ])).hexdigest())
+        start_dates = self._cache.get(key)
+        if start_dates is None:
+            start_dates = self._collect_start_dates(block_structure)
+            self._cache.set(key, start_dates, self._timeout)
+        return start_dates
+
+    @staticmethod
+    def _collect_start_dates(block_structure):
+        """
+        Returns the sorted distinct start dates of the blocks in the block
+        structure, for users and for beta testers.
+        """
+        start_dates = set()
+        beta_start_dates = set()
+        for block_key in block_structure:
+            start = StartDateTransformer.get_merged_start_date(block_structure, block_key)
+            if not start:
+                continue
+            start_dates.add(start)
+            # See adjust_start_date.
+            days_early_for_beta = block_structure.get_xblock_field(block_key, 'days_early_for_beta')
+            if days_early_for_beta is not None:
+                start -= timedelta(days_early_for_beta)
+            beta_start_dates.add(start)
+        return sorted(start_dates), sorted(beta_start_dates)
@@ -0,0 +1,66 @@
+"""
+Tests for the course blocks filter cache.
+"""
+from django.test.utils import override_settings
+from mock import patch
+from nose.plugins.attrib import attr
+
+from ..api import get_course_blocks
+from ..filter_cache import CourseBlocksFilterCache
+from ..transformers.tests.helpers import BlockParentsMapTestCase, publish_course, update_block
+from ..transformers.visibility import VisibilityTransformer
+
+
+@attr('shard_3')
+@override_settings(COURSE_BLOCKS_FILTER_CACHE_TIMEOUT=300)
+class CourseBlocksFilterCacheTestCase(BlockParentsMapTestCase):
+    """
+    Tests for caching the results of the access transformers' filters.
+    """
+    TRANSFORMER_CLASS_TO_TEST = VisibilityTransformer
+
+    def setUp(self, **kwargs):
+        super(CourseBlocksFilterCacheTestCase, self).setUp(**kwargs)
+        self.set_staff_only_block(2, True)
+
+    def set_staff_only_block(self, block_index, visible_to_staff_only):
+        """
+        Updates whether the block is visible to staff only and publishes the course.
+        """
+        block = self.get_block(block_index)
+        block.visible_to_staff_only = visible_to_staff_only
+        update_block(block)
+        publish_course(self.course)
+
+    def get_block_indexes(self, user):
+        """
+        Returns the indexes of the blocks in the course blocks of the user.
+        """
+        block_structure = get_course_blocks(user, self.course.location, self.transformers)
+        return {index for index, block_key in enumerate(self.xblock_keys) if block_key in block_structure}
+
+    def test_filters_skipped_when_cached(self):
+        self.assertEqual(self.get_block_indexes(self.student), {0, 1, 3, 4, 6})
+
+        with patch.object(VisibilityTransformer, 'transform_block_filters') as mock_transform_block_filters:
+            self.assertEqual(self.get_block_indexes(self.student), {0, 1, 3, 4, 6})
+            self.assertFalse(mock_transform_block_filters.called)
+
+    def test_cached_per_user(self):
+        self.assertEqual(self.get_block_indexes(self.student), {0, 1, 3, 4, 6})
+        self.assertEqual(self.get_block_indexes(self.staff), {0, 1, 2, 3, 4, 5, 6})
+
+    def test_publish_invalidates(self):
+        self.assertEqual(self.get_block_indexes(self.student), {0, 1, 3, 4, 6})
+
+        self.set_staff_only_block(2, False)
+        self.assertEqual(self.get_block_indexes(self.student), {0, 1, 2, 3, 4, 5, 6})
+
+    def test_start_dates_collected_once(self):
+        collect_start_dates = CourseBlocksFilterCache._collect_start_dates  # pylint: disable=protected-access
+        with patch.object(
+            CourseBlocksFilterCache, '_collect_start_dates', wraps=collect_start_dates
+        ) as mock_collect_start_dates:
+            self.get_block_indexes(self.student)
+            self.get_block_indexes(self.staff)
+        self.assertEqual(mock_collect_start_dates.call_count, 1)
@@ -4,6 +4,7 @@ from __future__ import division
 import json
 import logging
 import random
+import time
 from collections import defaultdict
 
 import dogstats_wrapper as dog_stats_api
@@ -11,9 +12,10 @@ from course_blocks.api import get_course_blocks
 from courseware import courses
 from django.conf import settings
 from django.core.cache import cache
+from django.db.models import Max, Min
 from django.test.client import RequestFactory
 from opaque_keys import InvalidKeyError
-from opaque_keys.edx.keys import CourseKey
+from opaque_keys.edx.keys import CourseKey, UsageKey
 from opaque_keys.edx.locator import BlockUsageLocator
 from openedx.core.djangoapps.content.block_structure.api import get_course_in_cache
 from openedx.core.lib.cache_utils import memoized
@@ -170,7 +172,111 @@ def grading_context(course_structure):
     }
 
 
-def answer_distributions(course_key):
+# Number of StudentModule states read per query when computing answer distributions.
+ANSWER_DISTRIBUTION_BATCH_SIZE = 1000
+
+
+def _iter_submitted_problem_states(course_key, min_id=None, max_id=None, batch_size=ANSWER_DISTRIBUTION_BATCH_SIZE):
+    """
+    Yields lists of (id, student_id, module_state_key, state) of the problems
+    submitted for the course, with ids in [min_id, max_id), in order of id and
+    in lists of at most batch_size.
+
+    Only these fields are read, one batch per query, so that the memory used
+    does not grow with the number of states in the course.
+    """
+    queryset = StudentModule.all_submitted_problems_read_only(course_key).order_by('id')
+    if max_id is not None:
+        queryset = queryset.filter(id__lt=max_id)
+    if min_id is not None:
+        queryset = queryset.filter(id__gte=min_id)
+    while True:
+        batch = list(queryset.values_list('id', 'student_id', 'module_state_key', 'state')[:batch_size])
+        if batch:
+            yield batch
+        if len(batch) < batch_size:
+            return
+        queryset = queryset.filter(id__gt=batch[-1][0])
+
+
+def answer_distribution_id_ranges(course_key, count):
+    """
+    Returns up to `count` (min_id, max_id) ranges of StudentModule ids which
+    together cover the problems submitted for the course, so that the answer
+    counts of each range can be computed by a separate worker.
+    """
+    ids = StudentModule.all_submitted_problems_read_only(course_key).aggregate(Min('id'), Max('id'))
+    if ids['id__min'] is None:
+        return []
+    first_id, end_id = ids['id__min'], ids['id__max'] + 1
+    step = max(1, -(-(end_id - first_id) // count))
+    return [(min_id, min(min_id + step, end_id)) for min_id in xrange(first_id, end_id, step)]
+
+
+def answer_counts(course_key, min_id=None, max_id=None, batch_size=ANSWER_DISTRIBUTION_BATCH_SIZE):
+    """
+    Given a course_key, return the counts of the answers submitted to its
+    problems by the StudentModule entries with ids in [min_id, max_id), in the
+    form of a dictionary mapping:
+
+      (problem module_state_key string, problem_id) -> {dict: answer -> count}
+
+    Counts for different id ranges may be computed separately, for instance
+    by different workers, and combined with merge_answer_counts.
+    """
+    counts = defaultdict(lambda: defaultdict(int))
+    start_time = time.time()
+    state_count = 0
+    for batch in _iter_submitted_problem_states(course_key, min_id, max_id, batch_size):
+        for module_id, student_id, module_state_key, state in batch:
+            try:
+                state_dict = json.loads(state) if state else {}
+                raw_answers = state_dict.get("student_answers", {})
+            except ValueError:
+                log.error(
+                    u"Answer Distribution: Could not parse module state for StudentModule id=%s, course=%s",
+                    module_id,
+                    course_key,
+                )
+                continue
+
+            # Each problem part has an ID that is derived from the
+            # module_state_key (with some suffix appended)
+            for problem_part_id, raw_answer in raw_answers.items():
+                # Convert whatever raw answers we have (numbers, unicode, None, etc.)
+                # to be unicode values. Note that if we get a string, it's always
+                # unicode and not str -- state comes from the json decoder, and that
+                # always returns unicode for strings.
+                counts[(module_state_key, problem_part_id)][unicode(raw_answer)] += 1
+
+        state_count += len(batch)
+        dog_stats_api.increment(
+            'lms.grades.answer_distributions.states', len(batch), tags=[u'course_id:{}'.format(course_key)]
+        )
+        log.debug(
+            u"Answer Distribution: read %d states for course %s, %.1f states per second",
+            state_count,
+            course_key,
+            state_count / max(time.time() - start_time, 0.001),
+        )
+
+    return counts
+
+
+def merge_answer_counts(partial_counts):
+    """
+    Combines the results of answer_counts for disjoint sets of StudentModule
+    entries into one.
+    """
+    counts = defaultdict(lambda: defaultdict(int))
+    for partial in partial_counts:
+        for key, answers in partial.iteritems():
+            for answer, count in answers.iteritems():
+                counts[key][answer] += count
+    return counts
+
+
+def answer_distributions(course_key, counts=None, batch_size=ANSWER_DISTRIBUTION_BATCH_SIZE):
     """
     Given a course_key, return answer distributions in the form of a dictionary
     mapping:
@@ -197,70 +303,44 @@ def answer_distributions(course_key):
     not be aware of problems that are not visible to the user being used to
     generate the report.
 
+    The entries are read in batches of batch_size. Alternatively, the counts
+    may be computed beforehand with answer_counts and merge_answer_counts, for
+    instance over the ranges of answer_distribution_id_ranges, and passed in
+    as `counts`.
+
     This method will try to use a read-replica database if one is available.
     """
-    # dict: { module.module_state_key : (url_name, display_name) }
-    state_keys_to_problem_info = {}  # For caching, used by url_and_display_name
-
-    def url_and_display_name(usage_key):
-        """
-        For a given usage_key, return the problem's url and display_name.
-        Handle modulestore access and caching. This method ignores permissions.
+    if counts is None:
+        counts = answer_counts(course_key, batch_size=batch_size)
 
-        Raises:
-            InvalidKeyError: if the usage_key does not parse
-            ItemNotFoundError: if there is no content that corresponds
-                to this usage_key.
-        """
-        problem_store = modulestore()
-        if usage_key not in state_keys_to_problem_info:
-            problem = problem_store.get_item(usage_key)
-            problem_info = (problem.url_name, problem.display_name_with_default_escaped)
-            state_keys_to_problem_info[usage_key] = problem_info
-
-        return state_keys_to_problem_info[usage_key]
-
-    # Iterate through all problems submitted for this course in no particular
-    # order, and build up our answer_counts dict that we will eventually return
-    answer_counts = defaultdict(lambda: defaultdict(int))
-    for module in StudentModule.all_submitted_problems_read_only(course_key):
-        try:
-            state_dict = json.loads(module.state) if module.state else {}
-            raw_answers = state_dict.get("student_answers", {})
-        except ValueError:
-            log.error(
-                u"Answer Distribution: Could not parse module state for StudentModule id=%s, course=%s",
-                module.id,
-                course_key,
-            )
-            continue
+    # dict: { module_state_key : (url_name, display_name) }, or None if not found
+    state_keys_to_problem_info = {}
+    problem_store = modulestore()
+    answer_distribution = defaultdict(lambda: defaultdict(int))
+    for (module_state_key, problem_part_id), answers in counts.iteritems():
+        if module_state_key not in state_keys_to_problem_info:
+            try:
+                usage_key = UsageKey.from_string(module_state_key).map_into_course(course_key)
+                problem = problem_store.get_item(usage_key)
+                problem_info = (problem.url_name, problem.display_name_with_default_escaped)
+            except (ItemNotFoundError, InvalidKeyError):
+                log.warning(
+                    u"Answer Distribution: Item %s referenced in StudentModule entries of course %s not "
+                    u"found; This can happen if a student answered a question that was later deleted from "
+                    u"the course. Its answers will be omitted from the answer distribution CSV.",
+                    module_state_key,
+                    course_key,
+                )
+                problem_info = None
+            state_keys_to_problem_info[module_state_key] = problem_info
 
-        try:
-            url, display_name = url_and_display_name(module.module_state_key.map_into_course(course_key))
-            # Each problem part has an ID that is derived from the
-            # module.module_state_key (with some suffix appended)
-            for problem_part_id, raw_answer in raw_answers.items():
-                # Convert whatever raw answers we have (numbers, unicode, None, etc.)
-                # to be unicode values. Note that if we get a string, it's always
-                # unicode and not str -- state comes from the json decoder, and that
-                # always returns unicode for strings.
-                answer = unicode(raw_answer)
-                answer_counts[(url, display_name, problem_part_id)][answer] += 1
-
-        except (ItemNotFoundError, InvalidKeyError):
-            msg = (
-                "Answer Distribution: Item {} referenced in StudentModule {} " +
-                "for user {} in course {} not found; " +
-                "This can happen if a student answered a question that " +
-                "was later deleted from the course. This answer will be " +
-                "omitted from the answer distribution CSV."
-            ).format(
-                module.module_state_key, module.id, module.student_id, course_key
-            )
-            log.warning(msg)
-            continue
+        problem_info = state_keys_to_problem_info[module_state_key]
+        if problem_info is not None:
+            url, display_name = problem_info
+            for answer, count in answers.iteritems():
+                answer_distribution[(url, display_name, problem_part_id)][answer] += count
 
-    return answer_counts
+    return answer_distribution
 
 
 def grade(student, course, keep_raw_scores=False, course_structure=None):
@@ -476,6 +556,79 @@ def get_weighted_scores(student, course):
     return _progress_summary(student, course)
 
 
+def get_weighted_scores_for_block(student, course, usage_key, course_structure=None):
+    """
+    Returns the aggregate weighted score of a student for a single block of the
+    course, as a tuple (earned, possible).
+
+    The result is the same as calling score_for_module(usage_key) on the
+    ProgressSummary returned by get_weighted_scores, but only the scores of the
+    blocks in the subtree of usage_key are loaded and computed.
+
+    Arguments:
+        student: A User object for the student to grade
+        course: A Descriptor containing the course to grade
+        usage_key: The location of the block to score, mapped into the course
+    """
+    if course_structure is None:
+        course_structure = get_course_blocks(student, course.location)
+    if usage_key not in course_structure:
+        return 0.0, 0.0
+
+    gated_content = set(gating_api.get_gated_content(course, student))
+    if _has_gated_ancestor(course_structure, usage_key, gated_content):
+        return 0.0, 0.0
+
+    subtree_keys = list(course_structure.post_order_traversal(
+        filter_func=lambda block_key: possibly_scored(block_key) and unicode(block_key) not in gated_content,
+        start_node=usage_key,
+    ))
+
+    with outer_atomic():
+        scores_client = ScoresClient.create_for_locations(course.id, student.id, subtree_keys)
+
+    # See the comment in _progress_summary about this import.
+    from submissions import api as sub_api  # installed from the edx-submissions repository
+    with outer_atomic():
+        submissions_scores = sub_api.get_scores(
+            unicode(course.id), anonymous_id_for_user(student, course.id)
+        )
+
+    locations_to_weighted_scores = {}
+    for block_key in subtree_keys:
+        block = course_structure[block_key]
+        (correct, total) = get_score(student, block, scores_client, submissions_scores)
+        if correct is None and total is None:
+            continue
+        locations_to_weighted_scores[block.location] = Score(
+            correct,
+            total,
+            getattr(block, 'graded', False),
+            block_metadata_utils.display_name_with_default_escaped(block),
+            block.location
+        )
+
+    progress = ProgressSummary([], locations_to_weighted_scores, course_structure.get_children)
+    return progress.score_for_module(usage_key)
+
+
+def _has_gated_ancestor(course_structure, usage_key, gated_content):
+    """
+    Returns whether the block, or any of its ancestors, is gated content.
+    """
+    to_visit = [usage_key]
+    visited = set()
+    while to_visit:
+        block_key = to_visit.pop()
+        if block_key in visited:
+            continue
+        if unicode(block_key) in gated_content:
+            return True
+        visited.add(block_key)
+        to_visit.extend(course_structure.get_parents(block_key))
+    return False
+
+
 def _progress_summary(student, course, course_structure=None):
     """
     Unwrapped version of "progress_summary".
@@ -691,6 +844,12 @@ def _get_mock_request(student):
     return request
 
 
+# Container blocks which are not scored themselves in get_module_score.
+MODULE_SCORE_IGNORED_CATEGORIES = frozenset([
+    'course', 'chapter', 'sequential', 'vertical', 'randomize', 'library_content'
+])
+
+
 def _calculate_score_for_modules(user_id, course, modules):
     """
     Calculates the cumulative score (percent) of the given modules
@@ -715,9 +874,8 @@ def _calculate_score_for_modules(user_id, course, modules):
 
     # Iterate over all of the exam modules to get score percentage of user for each of them
     module_percentages = []
-    ignore_categories = ['course', 'chapter', 'sequential', 'vertical', 'randomize', 'library_content']
     for index, module in enumerate(modules):
-        if module.category not in ignore_categories and (module.graded or module.has_score):
+        if module.category not in MODULE_SCORE_IGNORED_CATEGORIES and (module.graded or module.has_score):
             module_score = scores_client.get(locations[index])
             if module_score:
                 correct = module_score.correct or 0
@@ -760,3 +918,42 @@ def get_module_score(user, course, module):
         inner_get_module
     )
     return _calculate_score_for_modules(user.id, course, modules)
+
+
+def get_block_score(user, usage_key):
+    """
+    Calculates the cumulative score (percent) of the user for the block with
+    the given usage key, in the same way as get_module_score.
+
+    Unlike get_module_score, no XModules are instantiated: the descendants of
+    the block are taken from the cached course block structure, transformed
+    for the user, and their scores from the persisted StudentModule scores.
+
+    Arguments:
+        user (User): The user
+        usage_key (UsageKey): The location of the block, e.g. a subsection
+
+    Returns:
+        float: The cumulative score
+    """
+    block_structure = get_course_blocks(user, usage_key)
+    locations = [
+        block_key for block_key in block_structure.topological_traversal()
+        if block_key.block_type not in MODULE_SCORE_IGNORED_CATEGORIES and (
+            block_structure.get_xblock_field(block_key, 'graded') or
+            block_structure.get_xblock_field(block_key, 'has_score')
+        )
+    ]
+
+    scores_client = ScoresClient(usage_key.course_key, user.id)
+    scores_client.fetch_scores(locations)
+
+    block_percentages = []
+    for location in locations:
+        block_score = scores_client.get(location)
+        if block_score:
+            correct = block_score.correct or 0
+            total = block_score.total or 1
+            block_percentages.append(correct / total)
+
+    return sum(block_percentages) / float(len(block_percentages)) if block_percentages else 0
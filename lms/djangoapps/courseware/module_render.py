@@ -645,12 +645,17 @@ def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=to
             request_token=request_token,
         ))
 
+    # Build a separate list of the wrappers which only rewrite urls in the Fragment
+    # content. They don't depend on the user, so LmsModuleSystem applies them
+    # before block_wrappers and caches their output for user-independent views.
+    content_wrappers = []
+
     # TODO (cpennington): When modules are shared between courses, the static
     # prefix is going to have to be specific to the module, not the directory
     # that the xml was loaded from
 
     # Rewrite urls beginning in /static to point to course-specific content
-    block_wrappers.append(partial(
+    content_wrappers.append(partial(
         replace_static_urls,
         getattr(descriptor, 'data_dir', None),
         course_id=course_id,
@@ -659,14 +664,14 @@ def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=to
 
     # Allow URLs of the form '/course/' refer to the root of multicourse directory
     #   hierarchy of this course
-    block_wrappers.append(partial(replace_course_urls, course_id))
+    content_wrappers.append(partial(replace_course_urls, course_id))
 
     # this will rewrite intra-courseware links (/jump_to_id/<id>). This format
     # is an improvement over the /course/... format for studio authored courses,
     # because it is agnostic to course-hierarchy.
     # NOTE: module_id is empty string here. The 'module_id' will get assigned in the replacement
     # function, we just need to specify something to get the reverse() to work.
-    block_wrappers.append(partial(
+    content_wrappers.append(partial(
         replace_jump_to_id_urls,
         course_id,
         reverse('jump_to_id', kwargs={'course_id': course_id.to_deprecated_string(), 'module_id': ''}),
@@ -748,6 +753,8 @@ def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=to
         # TODO: When we merge the descriptor and module systems, we can stop reaching into the mixologist (cpennington)
         mixins=descriptor.runtime.mixologist._mixins,  # pylint: disable=protected-access
         wrappers=block_wrappers,
+        content_wrappers=content_wrappers,
+        static_asset_path=static_asset_path or descriptor.static_asset_path,
         get_real_user=user_by_anonymous_id,
         services={
             'fs': FSService(),
@@ -14,7 +14,10 @@ from courseware.grades import (
     grade,
     iterate_grades_for,
     ProgressSummary,
-    get_module_score
+    get_block_score,
+    get_module_score,
+    get_weighted_scores,
+    get_weighted_scores_for_block,
 )
 from courseware.module_render import get_module
 from courseware.model_data import FieldDataCache, set_score
@@ -425,6 +428,25 @@ class TestGetModuleScore(LoginEnrollmentTestCase, SharedModuleStoreTestCase):
             score = get_module_score(self.request.user, self.course, self.seq1)
         self.assertEqual(score, .5)
 
+    def test_get_block_score(self):
+        self.assertEqual(get_block_score(self.request.user, self.seq1.location), 0)
+
+        answer_problem(self.course, self.request, self.problem1)
+        answer_problem(self.course, self.request, self.problem2, 0)
+
+        score = get_block_score(self.request.user, self.seq1.location)
+        self.assertEqual(score, get_module_score(self.request.user, self.course, self.seq1))
+        self.assertEqual(score, .5)
+
+    def test_weighted_scores_for_block(self):
+        answer_problem(self.course, self.request, self.problem1)
+        progress = get_weighted_scores(self.request.user, self.course)
+        for block in (self.course, self.seq1, self.vert1, self.problem1, self.problem2, self.vert2):
+            self.assertEqual(
+                get_weighted_scores_for_block(self.request.user, self.course, block.location),
+                progress.score_for_module(block.location),
+            )
+
     def test_get_module_score_with_empty_score(self):
         """
         Test test_get_module_score_with_empty_score
@@ -1144,6 +1144,24 @@ class TestAnswerDistributions(TestSubmittingProblems):
                 }
             )
 
+    def test_batches_and_ranges(self):
+        # Reading the states in small batches, or counting id ranges
+        # separately and merging the counts, gives the same distribution.
+        self.submit_question_answer('p1', {'2_1': u'Correct'})
+        self.submit_question_answer('p2', {'2_1': u'Incorrect'})
+        self.submit_question_answer('p3', {'2_1': u'Correct'})
+        distributions = grades.answer_distributions(self.course.id)
+
+        self.assertEqual(grades.answer_distributions(self.course.id, batch_size=1), distributions)
+
+        id_ranges = grades.answer_distribution_id_ranges(self.course.id, 2)
+        self.assertEqual(len(id_ranges), 2)
+        counts = grades.merge_answer_counts(
+            grades.answer_counts(self.course.id, min_id, max_id, batch_size=1)
+            for min_id, max_id in id_ranges
+        )
+        self.assertEqual(grades.answer_distributions(self.course.id, counts=counts), distributions)
+
 
 @attr('shard_1')
 class TestConditionalContent(TestSubmittingProblems):
@@ -2,9 +2,9 @@
 Module to define url helpers functions
 """
 from urllib import urlencode
-from xmodule.modulestore.search import path_to_location, navigation_index
-from xmodule.modulestore.django import modulestore
+from xmodule.modulestore.search import navigation_index
 from django.core.urlresolvers import reverse
+from openedx.core.djangoapps.content.block_structure.paths import get_path_to_location
 
 
 def get_redirect_url(course_key, usage_key):
@@ -24,7 +24,7 @@ def get_redirect_url(course_key, usage_key):
     (
         course_key, chapter, section, vertical_unused,
         position, final_target_id
-    ) = path_to_location(modulestore(), usage_key)
+    ) = get_path_to_location(usage_key)
 
     # choose the appropriate view (and provide the necessary args) based on the
     # args provided by the redirect.
@@ -161,13 +161,24 @@ def get_cached_discussion_key(course, discussion_id):
     map is cached but does not contain discussion_id, returns None. If the discussion id map is not cached for course,
     raises a DiscussionIdMapIsNotCached exception.
     """
+    return _get_cached_discussion_id_map(course).get(discussion_id)
+
+
+def _get_cached_discussion_id_map(course):
+    """
+    Returns the cached mapping of discussion ids to the usage keys of discussion xblocks for course. If it is not
+    cached, raises a DiscussionIdMapIsNotCached exception.
+    """
     try:
-        cached_mapping = CourseStructure.objects.get(course_id=course.id).discussion_id_map
-        if not cached_mapping:
-            raise DiscussionIdMapIsNotCached()
-        return cached_mapping.get(discussion_id)
+        # The course structure itself is not needed, so it isn't loaded and decompressed.
+        cached_mapping = CourseStructure.objects.only(
+            'course_id', 'discussion_id_map_json'
+        ).get(course_id=course.id).discussion_id_map
     except CourseStructure.DoesNotExist:
         raise DiscussionIdMapIsNotCached()
+    if not cached_mapping:
+        raise DiscussionIdMapIsNotCached()
+    return cached_mapping
 
 
 def get_cached_discussion_id_map(course, discussion_ids, user):
@@ -175,10 +186,13 @@ def get_cached_discussion_id_map(course, discussion_ids, user):
     Returns a dict mapping discussion_ids to respective discussion xblock metadata if it is cached and visible to the
     user. If not, returns the result of get_discussion_id_map
     """
+    if not discussion_ids:
+        return {}
     try:
+        cached_mapping = _get_cached_discussion_id_map(course)
         entries = []
         for discussion_id in discussion_ids:
-            key = get_cached_discussion_key(course, discussion_id)
+            key = cached_mapping.get(discussion_id)
             if not key:
                 continue
             xblock = modulestore().get_item(key)
@@ -14,6 +14,7 @@ from edxnotes.helpers import (
     is_feature_enabled,
 )
 from edxmako.shortcuts import render_to_string
+import request_cache
 
 
 def edxnotes(cls):
@@ -54,5 +55,28 @@ def edxnotes(cls):
                 },
             })
 
+    original_user_independent_views = getattr(cls, 'user_independent_views', ())
+
+    @property
+    def user_independent_views(self):
+        """
+        Annotatable content embeds a per-user token, so it can't be shared
+        between users when notes are enabled.
+        """
+        if settings.FEATURES.get("ENABLE_EDXNOTES"):
+            # Only look the course up once per request, rather than for every
+            # rendered component.
+            notes_enabled = request_cache.get_cache('edxnotes.is_feature_enabled')
+            course_id = self.runtime.course_id
+            if course_id not in notes_enabled:
+                course = self.descriptor.runtime.modulestore.get_course(course_id)
+                notes_enabled[course_id] = is_feature_enabled(course)
+            if notes_enabled[course_id]:
+                return ()
+        if isinstance(original_user_independent_views, property):
+            return original_user_independent_views.__get__(self, cls)
+        return original_user_independent_views
+
     cls.get_html = get_html
+    cls.user_independent_views = user_independent_views
     return cls
@@ -4,33 +4,32 @@ API for the gating djangoapp
 import logging
 import json
 
-from collections import defaultdict
 from django.contrib.auth.models import User
-from xmodule.modulestore.django import modulestore
 from milestones import api as milestones_api
+from openedx.core.djangoapps.content.block_structure.api import get_course_in_cache
 from openedx.core.lib.gating import api as gating_api
 
 
 log = logging.getLogger(__name__)
 
 
-def _get_xblock_parent(xblock, category=None):
+def _get_block_ancestor(block_structure, usage_key, category):
     """
-    Returns the parent of the given XBlock. If an optional category is supplied,
-    traverses the ancestors of the XBlock and returns the first with the
-    given category.
+    Returns the usage key of the first ancestor of the given block with the
+    given category in the block structure, or None if there is none.
 
     Arguments:
-        xblock (XBlock): Get the parent of this XBlock
+        block_structure (BlockStructure): The course block structure
+        usage_key (UsageKey): Get the ancestor of this block
         category (str): Find an ancestor with this category (e.g. sequential)
     """
-    parent = xblock.get_parent()
-    if parent and category:
-        if parent.category == category:
-            return parent
-        else:
-            return _get_xblock_parent(parent, category)
-    return parent
+    for parent_key in block_structure.get_parents(usage_key):
+        if parent_key.block_type == category:
+            return parent_key
+        ancestor_key = _get_block_ancestor(block_structure, parent_key, category)
+        if ancestor_key:
+            return ancestor_key
+    return None
 
 
 @gating_api.gating_enabled(default=False)
@@ -41,6 +40,10 @@ def evaluate_prerequisite(course, prereq_content_key, user_id):
     grade of the prerequisite subsection meets the minimum score required by
     dependent subsections, the related milestone will be fulfilled for the user.
 
+    The subsection is found in the cached course block structure, and its score
+    is calculated from the persisted scores of its blocks, so that no XBlocks
+    are loaded from the modulestore.
+
     Arguments:
         user_id (int): ID of User for which evaluation should occur
         course (CourseModule): The course
@@ -49,38 +52,32 @@ def evaluate_prerequisite(course, prereq_content_key, user_id):
     Returns:
         None
     """
-    xblock = modulestore().get_item(prereq_content_key)
-    sequential = _get_xblock_parent(xblock, 'sequential')
-    if sequential:
-        prereq_milestone = gating_api.get_gating_milestone(
-            course.id,
-            sequential.location.for_branch(None),
-            'fulfills'
-        )
-        if prereq_milestone:
-            gated_content_milestones = defaultdict(list)
-            for milestone in gating_api.find_gating_milestones(course.id, None, 'requires'):
-                gated_content_milestones[milestone['id']].append(milestone)
+    prerequisites = gating_api.get_prerequisites_by_content(course)
+    if not prerequisites:
+        return
 
-            gated_content = gated_content_milestones.get(prereq_milestone['id'])
-            if gated_content:
-                from courseware.grades import get_module_score
-                user = User.objects.get(id=user_id)
-                score = get_module_score(user, course, sequential) * 100
-                for milestone in gated_content:
-                    # Default minimum score to 100
-                    min_score = 100
-                    requirements = milestone.get('requirements')
-                    if requirements:
-                        try:
-                            min_score = int(requirements.get('min_score'))
-                        except (ValueError, TypeError):
-                            log.warning(
-                                'Failed to find minimum score for gating milestone %s, defaulting to 100',
-                                json.dumps(milestone)
-                            )
+    block_structure = get_course_in_cache(course.id)
+    sequential_key = _get_block_ancestor(block_structure, prereq_content_key.map_into_course(course.id), 'sequential')
+    if sequential_key:
+        prereq_milestone, gated_content = prerequisites.get(unicode(sequential_key), (None, None))
+        if gated_content:
+            from courseware.grades import get_block_score
+            user = User.objects.get(id=user_id)
+            score = get_block_score(user, sequential_key) * 100
+            for milestone in gated_content:
+                # Default minimum score to 100
+                min_score = 100
+                requirements = milestone.get('requirements')
+                if requirements:
+                    try:
+                        min_score = int(requirements.get('min_score'))
+                    except (ValueError, TypeError):
+                        log.warning(
+                            'Failed to find minimum score for gating milestone %s, defaulting to 100',
+                            json.dumps(milestone)
+                        )
 
-                    if score >= min_score:
-                        milestones_api.add_user_milestone({'id': user_id}, prereq_milestone)
-                    else:
-                        milestones_api.remove_user_milestone({'id': user_id}, prereq_milestone)
+                if score >= min_score:
+                    milestones_api.add_user_milestone({'id': user_id}, prereq_milestone)
+                else:
+                    milestones_api.remove_user_milestone({'id': user_id}, prereq_milestone)
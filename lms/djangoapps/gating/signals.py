@@ -1,6 +1,7 @@
 """
 Signal handlers for the gating djangoapp
 """
+import dogstats_wrapper as dog_stats_api
 from django.dispatch import receiver
 from opaque_keys.edx.keys import CourseKey, UsageKey
 from xmodule.modulestore.django import modulestore
@@ -23,8 +24,10 @@ def handle_score_changed(**kwargs):
     """
     course = modulestore().get_course(CourseKey.from_string(kwargs.get('course_id')))
     if course.enable_subsection_gating:
-        gating_api.evaluate_prerequisite(
-            course,
-            UsageKey.from_string(kwargs.get('usage_id')),
-            kwargs.get('user_id'),
-        )
+        # Record the time taken to evaluate the prerequisites for each score change
+        with dog_stats_api.timer('gating.evaluate_prerequisite'):
+            gating_api.evaluate_prerequisite(
+                course,
+                UsageKey.from_string(kwargs.get('usage_id')),
+                kwargs.get('user_id'),
+            )
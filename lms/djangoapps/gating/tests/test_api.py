@@ -11,7 +11,8 @@ from courseware.tests.helpers import LoginEnrollmentTestCase
 from milestones import api as milestones_api
 from milestones.tests.utils import MilestonesTestCaseMixin
 from openedx.core.lib.gating import api as gating_api
-from gating.api import _get_xblock_parent, evaluate_prerequisite
+from gating.api import _get_block_ancestor, evaluate_prerequisite
+from openedx.core.djangoapps.content.block_structure.api import get_course_in_cache
 
 
 class GatingTestCase(LoginEnrollmentTestCase, ModuleStoreTestCase):
@@ -89,29 +90,33 @@ class GatingTestCase(LoginEnrollmentTestCase, ModuleStoreTestCase):
         super(GatingTestCase, self).tearDown()
 
 
-class TestGetXBlockParent(GatingTestCase):
+class TestGetBlockAncestor(GatingTestCase):
     """
-    Tests for the get_xblock_parent function
+    Tests for the _get_block_ancestor function
     """
 
+    def setUp(self):
+        super(TestGetBlockAncestor, self).setUp()
+        self.block_structure = get_course_in_cache(self.course.id)
+
     def test_get_direct_parent(self):
         """ Test test_get_direct_parent """
 
-        result = _get_xblock_parent(self.vert1)
-        self.assertEqual(result.location, self.seq1.location)
+        result = _get_block_ancestor(self.block_structure, self.vert1.location, 'sequential')
+        self.assertEqual(result, self.seq1.location)
 
-    def test_get_parent_with_category(self):
-        """ Test test_get_parent_of_category """
+    def test_get_ancestor(self):
+        """ Test test_get_ancestor """
 
-        result = _get_xblock_parent(self.vert1, 'sequential')
-        self.assertEqual(result.location, self.seq1.location)
-        result = _get_xblock_parent(self.vert1, 'chapter')
-        self.assertEqual(result.location, self.chapter1.location)
+        result = _get_block_ancestor(self.block_structure, self.prob1.location, 'sequential')
+        self.assertEqual(result, self.seq1.location)
+        result = _get_block_ancestor(self.block_structure, self.vert1.location, 'chapter')
+        self.assertEqual(result, self.chapter1.location)
 
-    def test_get_parent_none(self):
-        """ Test test_get_parent_none """
+    def test_get_ancestor_none(self):
+        """ Test test_get_ancestor_none """
 
-        result = _get_xblock_parent(self.vert1, 'unit')
+        result = _get_block_ancestor(self.block_structure, self.vert1.location, 'unit')
         self.assertIsNone(result)
 
 
@@ -136,7 +141,7 @@ class TestEvaluatePrerequisite(GatingTestCase, MilestonesTestCaseMixin):
         gating_api.set_required_content(self.course.id, self.seq2.location, self.seq1.location, min_score)
         self.prereq_milestone = gating_api.get_gating_milestone(self.course.id, self.seq1.location, 'fulfills')
 
-    @patch('courseware.grades.get_module_score')
+    @patch('courseware.grades.get_block_score')
     @data((.5, True), (1, True), (0, False))
     @unpack
     def test_min_score_achieved(self, module_score, result, mock_module_score):
@@ -149,7 +154,7 @@ class TestEvaluatePrerequisite(GatingTestCase, MilestonesTestCaseMixin):
         self.assertEqual(milestones_api.user_has_milestone(self.user_dict, self.prereq_milestone), result)
 
     @patch('gating.api.log.warning')
-    @patch('courseware.grades.get_module_score')
+    @patch('courseware.grades.get_block_score')
     @data((.5, False), (1, True))
     @unpack
     def test_invalid_min_score(self, module_score, result, mock_module_score, mock_log):
@@ -162,21 +167,21 @@ class TestEvaluatePrerequisite(GatingTestCase, MilestonesTestCaseMixin):
         self.assertEqual(milestones_api.user_has_milestone(self.user_dict, self.prereq_milestone), result)
         self.assertTrue(mock_log.called)
 
-    @patch('courseware.grades.get_module_score')
+    @patch('courseware.grades.get_block_score')
     def test_orphaned_xblock(self, mock_module_score):
         """ Test test_orphaned_xblock """
 
         evaluate_prerequisite(self.course, self.prob2.location, self.user.id)
         self.assertFalse(mock_module_score.called)
 
-    @patch('courseware.grades.get_module_score')
+    @patch('courseware.grades.get_block_score')
     def test_no_prerequisites(self, mock_module_score):
         """ Test test_no_prerequisites """
 
         evaluate_prerequisite(self.course, self.prob1.location, self.user.id)
         self.assertFalse(mock_module_score.called)
 
-    @patch('courseware.grades.get_module_score')
+    @patch('courseware.grades.get_block_score')
     def test_no_gated_content(self, mock_module_score):
         """ Test test_no_gated_content """
 
@@ -10,6 +10,7 @@ from django.contrib.auth.models import User
 from django.conf import settings
 from django.core.urlresolvers import reverse
 from django.core.mail import send_mail
+from django.db import transaction
 from django.utils.translation import override as override_language
 
 from course_modes.models import CourseMode
@@ -55,6 +56,41 @@ class EmailEnrollmentState(object):
         self.full_name = full_name
         self.mode = mode
 
+    @classmethod
+    def for_emails(cls, course_id, emails):
+        """
+        Returns a dict mapping each of the emails to its EmailEnrollmentState,
+        loaded with a fixed number of queries.
+        """
+        users = {
+            user.email.lower(): user
+            for user in User.objects.filter(email__in=emails).select_related('profile')
+        }
+        enrollments = {
+            enrollment.user_id: enrollment
+            for enrollment in CourseEnrollment.objects.filter(course_id=course_id, user__in=users.values())
+        }
+        ceas = {
+            cea.email.lower(): cea
+            for cea in CourseEnrollmentAllowed.objects.filter(course_id=course_id, email__in=emails)
+        }
+
+        states = {}
+        for email in emails:
+            user = users.get(email.lower())
+            enrollment = enrollments.get(user.id) if user else None
+            cea = ceas.get(email.lower())
+
+            state = cls.__new__(cls)
+            state.user = user is not None
+            state.enrollment = enrollment is not None and enrollment.is_active
+            state.allowed = cea is not None
+            state.auto_enroll = bool(cea is not None and cea.auto_enroll)
+            state.full_name = user.profile.name if user else None
+            state.mode = enrollment.mode if enrollment else None
+            states[email] = state
+        return states
+
     def __repr__(self):
         return "{}(user={}, enrollment={}, allowed={}, auto_enroll={})".format(
             self.__class__.__name__,
@@ -144,6 +180,83 @@ def enroll_email(course_id, student_email, auto_enroll=False, email_students=Fal
     return previous_state, after_state, enrollment_obj
 
 
+def bulk_enroll_email(course_id, student_emails, auto_enroll=False, email_students=False, email_params=None,
+                      languages=None):
+    """
+    Enroll students by email, as enroll_email does for each of them, but
+    reading and writing their enrollments and enrollment allowances with a
+    fixed number of queries.
+
+    `student_emails` is a list of student's emails e.g. ["foo@bar.com"]
+    `languages` maps emails to the language used to render their email.
+
+    Other arguments are as for enroll_email.
+
+    The enrollments and enrollment allowances are written in a transaction,
+    and the enrollment signals, events and emails are only sent once it is
+    committed, so that this only raises if nothing was enrolled. A failure
+    to send one of the emails is logged.
+
+    returns a dict mapping each email to the EmailEnrollmentState's
+        representing state before and after the action and its enrollment.
+    """
+    languages = languages or {}
+    previous_states = EmailEnrollmentState.for_emails(course_id, student_emails)
+    users = {
+        user.email.lower(): user
+        for user in User.objects.filter(email__in=[
+            email for email in student_emails if previous_states[email].user
+        ])
+    }
+
+    # See enroll_email for the choice of modes.
+    if CourseMode.is_white_label(course_id):
+        course_mode = CourseMode.DEFAULT_SHOPPINGCART_MODE_SLUG
+    else:
+        course_mode = None
+
+    allowed_emails = [email for email in student_emails if not previous_states[email].user]
+    with transaction.atomic():
+        enrollments, activated = CourseEnrollment.bulk_enroll(users.values(), course_id, course_mode)
+        if allowed_emails:
+            existing_allowed_emails = {
+                email.lower() for email in CourseEnrollmentAllowed.objects.filter(
+                    course_id=course_id, email__in=allowed_emails
+                ).values_list('email', flat=True)
+            }
+            CourseEnrollmentAllowed.objects.filter(
+                course_id=course_id, email__in=allowed_emails
+            ).update(auto_enroll=auto_enroll)
+            CourseEnrollmentAllowed.objects.bulk_create([
+                CourseEnrollmentAllowed(course_id=course_id, email=email, auto_enroll=auto_enroll)
+                for email in {email.lower(): email for email in allowed_emails}.itervalues()
+                if email.lower() not in existing_allowed_emails
+            ])
+        after_states = EmailEnrollmentState.for_emails(course_id, student_emails)
+
+    CourseEnrollment.send_bulk_enroll_signals(activated)
+
+    if email_students:
+        for email in student_emails:
+            email_params['email_address'] = email
+            if previous_states[email].user:
+                email_params['message'] = email_params.get('message', 'enrolled_enroll')
+                email_params['full_name'] = previous_states[email].full_name
+            else:
+                email_params['message'] = 'allowed_enroll'
+            try:
+                send_mail_to_student(email, email_params, language=languages.get(email))
+            except Exception:  # pylint: disable=broad-except
+                log.exception(u"Error while sending the enrollment email of %s", email)
+
+    results = {}
+    for email in student_emails:
+        user = users.get(email.lower())
+        enrollment_obj = enrollments.get(user.id) if user else None
+        results[email] = (previous_states[email], after_states[email], enrollment_obj)
+    return results
+
+
 def unenroll_email(course_id, student_email, email_students=False, email_params=None, language=None):
     """
     Unenroll a student by email.
@@ -25,6 +25,7 @@ from student.tests.factories import (
 )
 from instructor.enrollment import (
     EmailEnrollmentState,
+    bulk_enroll_email,
     enroll_email,
     get_email_params,
     reset_student_attempts,
@@ -221,6 +222,55 @@ class TestInstructorEnrollDB(TestEnrollmentChangeBase):
         return self._run_state_change_test(before_ideal, after_ideal, action)
 
 
+@attr('shard_1')
+class TestInstructorBulkEnrollDB(TestEnrollmentChangeBase):
+    """ Test instructor.enrollment.bulk_enroll_email """
+    def test_bulk_enroll(self):
+        enrolled = UserFactory()
+        CourseEnrollment.enroll(enrolled, self.course_key, mode='verified')
+        unenrolled = UserFactory()
+        CourseEnrollment.enroll(unenrolled, self.course_key)
+        CourseEnrollment.unenroll(unenrolled, self.course_key)
+        registered = UserFactory()
+        CourseEnrollmentAllowed.objects.create(email='allowed@edx.org', course_id=self.course_key)
+        emails = [enrolled.email, unenrolled.email, registered.email, 'allowed@edx.org', 'unknown@edx.org']
+
+        before = EmailEnrollmentState.for_emails(self.course_key, emails)
+        for email in emails:
+            self.assertEqual(before[email].to_dict(), EmailEnrollmentState(self.course_key, email).to_dict())
+
+        results = bulk_enroll_email(self.course_key, emails, auto_enroll=True)
+
+        for email in emails:
+            self.assertEqual(results[email][0].to_dict(), before[email].to_dict())
+            self.assertEqual(results[email][1].to_dict(), EmailEnrollmentState(self.course_key, email).to_dict())
+        for user in (enrolled, unenrolled, registered):
+            self.assertTrue(CourseEnrollment.is_enrolled(user, self.course_key))
+            self.assertEqual(results[user.email][2], CourseEnrollment.get_enrollment(user, self.course_key))
+        # Enrolled students keep their mode
+        self.assertEqual(CourseEnrollment.enrollment_mode_for_user(enrolled, self.course_key), ('verified', True))
+        for email in ('allowed@edx.org', 'unknown@edx.org'):
+            self.assertEqual(results[email][1].to_dict(), {
+                'user': False, 'enrollment': False, 'allowed': True, 'auto_enroll': True,
+            })
+            self.assertIsNone(results[email][2])
+
+    @patch('instructor.enrollment.send_mail_to_student')
+    @patch('student.models.CourseEnrollment.emit_event')
+    def test_bulk_enroll_rolled_back(self, mock_emit_event, mock_send_mail):
+        registered = UserFactory()
+        with patch.object(CourseEnrollmentAllowed.objects, 'bulk_create', side_effect=Exception):
+            with self.assertRaises(Exception):
+                bulk_enroll_email(
+                    self.course_key, [registered.email, 'unknown@edx.org'], email_students=True, email_params={}
+                )
+
+        # No enrollment is kept, and nothing is sent for it
+        self.assertFalse(CourseEnrollment.is_enrolled(registered, self.course_key))
+        self.assertFalse(mock_emit_event.called)
+        self.assertFalse(mock_send_mail.called)
+
+
 @attr('shard_1')
 class TestInstructorUnenrollDB(TestEnrollmentChangeBase):
     """ Test instructor.enrollment.unenroll_email """
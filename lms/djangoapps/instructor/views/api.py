@@ -48,7 +48,7 @@ from django_comment_common.models import (
     FORUM_ROLE_COMMUNITY_TA,
 )
 from edxmako.shortcuts import render_to_string
-from courseware.models import StudentModule
+from courseware.models import StudentModule, chunks
 from shoppingcart.models import (
     Coupon,
     CourseRegistrationCode,
@@ -98,6 +98,7 @@ from .tools import (
     dump_module_extensions,
     find_unit,
     get_student_from_identifier,
+    get_students_from_identifiers,
     require_student_from_identifier,
     handle_dashboard_error,
     parse_datetime,
@@ -569,6 +570,105 @@ def create_and_enroll_user(email, username, name, country, password, course_id,
     return errors
 
 
+# Number of identifiers enrolled together by students_update_enrollment.
+BULK_ENROLLMENT_BATCH_SIZE = 500
+
+
+def _enrollment_state_transition(before, after):
+    """
+    Returns the ManualEnrollmentAudit state transition of enrolling a student
+    by email, given the EmailEnrollmentState's before and after.
+    """
+    before, after = before.to_dict(), after.to_dict()
+    if before['user']:
+        if after['enrollment']:
+            if before['enrollment']:
+                return ENROLLED_TO_ENROLLED
+            elif before['allowed']:
+                return ALLOWEDTOENROLL_TO_ENROLLED
+            else:
+                return UNENROLLED_TO_ENROLLED
+    elif after['allowed']:
+        return UNENROLLED_TO_ALLOWEDTOENROLL
+    return DEFAULT_TRANSITION_STATE
+
+
+def _enroll_identifiers(request_user, course_id, identifiers, auto_enroll, email_students, email_params, reason):
+    """
+    Enroll students by email or username, for students_update_enrollment.
+
+    The identifiers are handled in batches of BULK_ENROLLMENT_BATCH_SIZE: the
+    users, enrollments and audits of each batch are read and written together.
+    If the enrollments of a batch fail to commit, no email or event is sent
+    for them, and the identifiers which were not enrolled are enrolled one at
+    a time so that only the identifiers which fail report an error.
+
+    Returns the results of the identifiers, in order.
+    """
+    results = []
+    for batch in chunks(identifiers, BULK_ENROLLMENT_BATCH_SIZE):
+        users = get_students_from_identifiers(batch)
+        emails = {}
+        for identifier in batch:
+            email = users[identifier].email if identifier in users else identifier
+            try:
+                # Use django.core.validators.validate_email to check email address
+                # validity (obviously, cannot check if email actually /exists/,
+                # simply that it is plausibly valid)
+                validate_email(email)  # Raises ValidationError if invalid
+            except ValidationError:
+                continue
+            emails[identifier] = email
+
+        languages = {}
+        if email_students:
+            languages = {users[identifier].email: get_user_email_language(users[identifier]) for identifier in users}
+
+        enrolled = {}
+        try:
+            enrolled = enrollment.bulk_enroll_email(
+                course_id, list(set(emails.values())), auto_enroll, email_students, email_params, languages
+            )
+        except Exception:  # pylint: disable=broad-except
+            log.exception(u"Error while enrolling students in bulk, enrolling them one at a time")
+            # Only the students whose bulk enrollment was rolled back are enrolled again.
+            for email in set(emails.values()) - set(enrolled):
+                try:
+                    enrolled[email] = enroll_email(
+                        course_id, email, auto_enroll, email_students, email_params, language=languages.get(email)
+                    )
+                except Exception:  # pylint: disable=broad-except
+                    # catch and log any exceptions
+                    # so that one error doesn't cause a 500.
+                    log.exception(u"Error while enrolling student %s", email)
+
+        audits = []
+        for identifier in batch:
+            if identifier not in emails:
+                # Flag this email as an error if invalid, but continue checking
+                # the remaining in the list
+                results.append({
+                    'identifier': identifier,
+                    'invalidIdentifier': True,
+                })
+            elif emails[identifier] not in enrolled:
+                results.append({
+                    'identifier': identifier,
+                    'error': True,
+                })
+            else:
+                before, after, enrollment_obj = enrolled[emails[identifier]]
+                audits.append((emails[identifier], _enrollment_state_transition(before, after), enrollment_obj))
+                results.append({
+                    'identifier': identifier,
+                    'before': before.to_dict(),
+                    'after': after.to_dict(),
+                })
+        ManualEnrollmentAudit.bulk_create_manual_enrollment_audits(request_user, audits, reason)
+
+    return results
+
+
 @require_POST
 @ensure_csrf_cookie
 @cache_control(no_cache=True, no_store=True, must_revalidate=True)
@@ -635,6 +735,15 @@ def students_update_enrollment(request, course_id):
         course = get_course_by_id(course_id)
         email_params = get_email_params(course, auto_enroll, secure=request.is_secure())
 
+    if action == 'enroll':
+        return JsonResponse({
+            'action': action,
+            'results': _enroll_identifiers(
+                request.user, course_id, identifiers, auto_enroll, email_students, email_params, reason
+            ),
+            'auto_enroll': auto_enroll,
+        })
+
     results = []
     for identifier in identifiers:
         # First try to get a user object from the identifer
@@ -654,30 +763,7 @@ def students_update_enrollment(request, course_id):
             # validity (obviously, cannot check if email actually /exists/,
             # simply that it is plausibly valid)
             validate_email(email)  # Raises ValidationError if invalid
-            if action == 'enroll':
-                before, after, enrollment_obj = enroll_email(
-                    course_id, email, auto_enroll, email_students, email_params, language=language
-                )
-                before_enrollment = before.to_dict()['enrollment']
-                before_user_registered = before.to_dict()['user']
-                before_allowed = before.to_dict()['allowed']
-                after_enrollment = after.to_dict()['enrollment']
-                after_allowed = after.to_dict()['allowed']
-
-                if before_user_registered:
-                    if after_enrollment:
-                        if before_enrollment:
-                            state_transition = ENROLLED_TO_ENROLLED
-                        else:
-                            if before_allowed:
-                                state_transition = ALLOWEDTOENROLL_TO_ENROLLED
-                            else:
-                                state_transition = UNENROLLED_TO_ENROLLED
-                else:
-                    if after_allowed:
-                        state_transition = UNENROLLED_TO_ALLOWEDTOENROLL
-
-            elif action == 'unenroll':
+            if action == 'unenroll':
                 before, after = unenroll_email(
                     course_id, email, email_students, email_params, language=language
                 )
@@ -6,6 +6,7 @@ import json
 
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.db.models import Q
 from django.http import HttpResponseBadRequest
 from django.utils.timezone import utc
 from django.utils.translation import ugettext as _
@@ -77,6 +78,37 @@ def get_student_from_identifier(unique_student_identifier):
     return student
 
 
+def get_students_from_identifiers(unique_student_identifiers):
+    """
+    Gets the student objects of several email addresses or usernames, with
+    one query.
+
+    Returns a dict mapping each of `unique_student_identifiers` for which a
+    student exists to the student object, as get_student_from_identifier would.
+    """
+    identifiers = {
+        identifier: strip_if_string(identifier) for identifier in unique_student_identifiers
+    }
+    emails = [identifier for identifier in identifiers.itervalues() if "@" in identifier]
+    usernames = [identifier for identifier in identifiers.itervalues() if "@" not in identifier]
+
+    students_by_email = {}
+    students_by_username = {}
+    for student in User.objects.filter(Q(email__in=emails) | Q(username__in=usernames)):
+        students_by_email[student.email.lower()] = student
+        students_by_username[student.username.lower()] = student
+
+    students = {}
+    for unique_student_identifier, identifier in identifiers.iteritems():
+        if "@" in identifier:
+            student = students_by_email.get(identifier.lower())
+        else:
+            student = students_by_username.get(identifier.lower())
+        if student is not None:
+            students[unique_student_identifier] = student
+    return students
+
+
 def require_student_from_identifier(unique_student_identifier):
     """
     Same as get_student_from_identifier() but will raise a DashboardError if
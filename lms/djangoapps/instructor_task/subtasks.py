@@ -24,6 +24,8 @@ SUBTASK_LOCK_EXPIRE = 60 * 10  # Lock expires in 10 minutes
 # Number of times to retry if a subtask update encounters a lock on the InstructorTask.
 # (These are recursive retries, so don't make this number too large.)
 MAX_DATABASE_LOCK_RETRIES = 5
+# Number of items fetched by each query when generating the items for subtasks.
+ITEMS_PER_QUERY = 1000
 
 
 class DuplicateTaskException(Exception):
@@ -77,6 +79,7 @@ def _generate_items_for_subtask(
     items_per_task,
     total_num_subtasks,
     course_id,
+    items_per_query=ITEMS_PER_QUERY,
 ):
     """
     Generates a chunk of "items" that should be passed into a subtask.
@@ -86,9 +89,14 @@ def _generate_items_for_subtask(
         `item_fields` : the fields that should be included in the dict that is returned.
             These are in addition to the 'pk' field.
         `total_num_items` : the result of summing the count of each queryset in `item_querysets`.
-        `items_per_query` : size of chunks to break the query operation into.
         `items_per_task` : maximum size of chunks to break each query chunk into for use by a subtask.
         `course_id` : course_id of the course. Only needed for the track_memory_usage context manager.
+        `items_per_query` : size of chunks to break the query operation into.
+
+    Each queryset is read in pages of `items_per_query` items ordered by 'pk', each
+    page starting after the last 'pk' of the previous one (keyset pagination), so
+    that no single query has to hold the whole result set open and no page needs
+    an OFFSET scan.
 
     Returns:  yields a list of dicts, where each dict contains the fields in `item_fields`, plus the 'pk' field.
 
@@ -103,7 +111,7 @@ def _generate_items_for_subtask(
 
     with track_memory_usage('course_email.subtask_generation.memory', course_id):
         for queryset in item_querysets:
-            for item in queryset.values(*all_item_fields).iterator():
+            for item in _iterate_by_pk(queryset, all_item_fields, items_per_query):
                 if len(items_for_task) == items_per_task and num_subtasks < total_num_subtasks - 1:
                     yield items_for_task
                     num_items_queued += items_per_task
@@ -126,6 +134,25 @@ def _generate_items_for_subtask(
         TASK_LOG.info("Number of items generated by chunking %s not equal to original total %s", num_items_queued, total_num_items)
 
 
+def _iterate_by_pk(queryset, fields, items_per_query):
+    """
+    Yields the `fields` values of the items in `queryset` as dicts in order of 'pk',
+    fetching them in pages of `items_per_query` items.
+
+    `fields` must include 'pk'.
+    """
+    queryset = queryset.order_by('pk')
+    last_pk = None
+    while True:
+        page_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        page = list(page_queryset.values(*fields)[:items_per_query])
+        for item in page:
+            yield item
+        if len(page) < items_per_query:
+            return
+        last_pk = page[-1]['pk']
+
+
 class SubtaskStatus(object):
     """
     Create and return a dict for tracking the status of a subtask.
@@ -285,6 +312,7 @@ def queue_subtasks_for_query(
     item_fields,
     items_per_task,
     total_num_items,
+    items_per_query=ITEMS_PER_QUERY,
 ):
     """
     Generates and queues subtasks to each execute a chunk of "items" generated by a queryset.
@@ -300,6 +328,7 @@ def queue_subtasks_for_query(
             These are in addition to the 'pk' field.
         `items_per_task` : maximum size of chunks to break each query chunk into for use by a subtask.
         `total_num_items` : total amount of items that will be put into subtasks
+        `items_per_query` : size of the pages in which items are read from each queryset.
 
     Returns:  the task progress as stored in the InstructorTask object.
 
@@ -331,6 +360,7 @@ def queue_subtasks_for_query(
         items_per_task,
         total_num_subtasks,
         entry.course_id,
+        items_per_query,
     )
 
     # Now create the subtasks, and start them running.
@@ -44,7 +44,7 @@ from certificates.models import (
     CertificateStatuses,
     GeneratedCertificate
 )
-from certificates.api import generate_user_certificates
+from certificates.api import GENERATE_CERTIFICATES_BATCH_SIZE, generate_certificates_for_students
 from courseware.courses import get_course_by_id, get_problems_in_section
 from courseware.grades import iterate_grades_for
 from courseware.models import StudentModule
@@ -1455,20 +1455,17 @@ def generate_students_certificates(
     task_progress.update_task_state(extra_meta=current_step)
 
     course = modulestore().get_course(course_id, depth=0)
-    # Generate certificate for each student
-    for student in students_require_certs:
+    # Generate certificates for the students in batches, reporting progress after each batch
+    for __, status in generate_certificates_for_students(students_require_certs, course_id, course=course):
         task_progress.attempted += 1
-        status = generate_user_certificates(
-            student,
-            course_id,
-            course=course
-        )
-
         if CertificateStatuses.is_passing_status(status):
             task_progress.succeeded += 1
         else:
             task_progress.failed += 1
 
+        if task_progress.attempted % GENERATE_CERTIFICATES_BATCH_SIZE == 0:
+            task_progress.update_task_state(extra_meta=current_step)
+
     return task_progress.update_task_state(extra_meta=current_step)
 
 
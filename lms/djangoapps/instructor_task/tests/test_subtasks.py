@@ -26,7 +26,7 @@ class TestSubtasks(InstructorTaskCourseTestCase):
             random_id = uuid4().hex[:8]
             self.create_student(username='student{0}'.format(random_id))
 
-    def _queue_subtasks(self, create_subtask_fcn, items_per_task, initial_count, extra_count):
+    def _queue_subtasks(self, create_subtask_fcn, items_per_task, initial_count, extra_count, **kwargs):
         """Queue subtasks while enrolling more students into course in the middle of the process."""
 
         task_id = str(uuid4())
@@ -55,6 +55,7 @@ class TestSubtasks(InstructorTaskCourseTestCase):
                 item_fields=[],
                 items_per_task=items_per_task,
                 total_num_items=initial_count,
+                **kwargs
             )
 
     def test_queue_subtasks_for_query1(self):
@@ -80,3 +81,19 @@ class TestSubtasks(InstructorTaskCourseTestCase):
         self.assertEqual(len(mock_create_subtask_fcn_args[0][0][0]), 3)
         self.assertEqual(len(mock_create_subtask_fcn_args[1][0][0]), 3)
         self.assertEqual(len(mock_create_subtask_fcn_args[2][0][0]), 5)
+
+    def test_queue_subtasks_for_query_paged(self):
+        """Test queue_subtasks_for_query() if the items are read in pages smaller than a subtask."""
+
+        mock_create_subtask_fcn = Mock()
+        self._queue_subtasks(mock_create_subtask_fcn, 3, 7, 0, items_per_query=2)
+
+        # Every enrollment is queued exactly once, in order of pk
+        item_lists = [call[0][0] for call in mock_create_subtask_fcn.call_args_list]
+        self.assertEqual([len(item_list) for item_list in item_lists], [3, 3, 1])
+        pks = [item['pk'] for item_list in item_lists for item in item_list]
+        self.assertEqual(pks, sorted(set(pks)))
+        self.assertEqual(
+            pks,
+            list(CourseEnrollment.objects.filter(course_id=self.course.id).order_by('pk').values_list('pk', flat=True)),
+        )
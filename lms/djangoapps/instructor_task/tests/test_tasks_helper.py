@@ -1672,7 +1672,7 @@ class TestCertificateGeneration(InstructorTaskModuleTestCase):
             'skipped': 2
         }
 
-        with self.assertNumQueries(214):
+        with self.assertNumQueries(153):
             self.assertCertificatesGenerated(task_input, expected_results)
 
     @ddt.data(
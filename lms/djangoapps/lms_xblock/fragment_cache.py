@@ -0,0 +1,139 @@
+"""
+A cache of rendered XBlock view fragments which are shared between users.
+
+Blocks opt in by listing the views whose output does not depend on the
+user in a ``user_independent_views`` attribute. The fragment returned by
+such a view is cached once the runtime's content wrappers (which rewrite
+/static/, /course/ and /jump_to_id/ urls) have been applied to it, so a
+cache hit skips both the view and the url rewriting. The remaining runtime
+wrappers embed per-request and per-user data and are applied on every
+render.
+
+Fragments are cached under a key built from the block's version, the user
+partition groups which apply to the block, the active language, the view
+name and the settings the url rewriting depends on. Since the key contains
+the version of the block, publishing a new version of the block naturally
+stops serving the old fragment; stale entries are left to expire from the
+cache. Urls of course assets embed the asset's digest, so an asset which
+is replaced keeps being linked to under its old url until then; the
+contentserver redirects such urls to the current version of the asset.
+"""
+import hashlib
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import translation
+from xblock.fragment import Fragment
+
+from static_replace.models import AssetBaseUrlConfig, AssetExcludedExtensionsConfig
+
+log = logging.getLogger(__name__)
+
+FRAGMENT_CACHE_KEY_PREFIX = u'xblock.fragment_cache'
+DEFAULT_FRAGMENT_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def is_fragment_cache_enabled():
+    """
+    Returns whether the shared fragment cache is enabled.
+    """
+    return settings.FEATURES.get('ENABLE_XBLOCK_FRAGMENT_CACHE', False)
+
+
+def _get_block_version(block):
+    """
+    Returns a value which changes whenever the content of the given block
+    changes, or None if the block's modulestore doesn't expose one.
+
+    Split blocks carry the version of the structure in which they were
+    last edited; old mongo blocks only expose their edit timestamp.
+    """
+    descriptor = getattr(block, 'descriptor', block)
+    version = getattr(descriptor, 'update_version', None)
+    if version is None:
+        try:
+            version = descriptor.edited_on
+        except (AttributeError, NotImplementedError):
+            version = None
+    return version
+
+
+def _get_user_group_ids(block, partition_service):
+    """
+    Returns a sorted list of (partition id, group id) pairs for the user
+    partitions that restrict access to the given block.
+    """
+    group_access = getattr(block, 'group_access', None) or {}
+    if not group_access or partition_service is None:
+        return []
+    return sorted(
+        (partition_id, partition_service.get_user_group_id_for_partition(partition_id))
+        for partition_id in group_access
+    )
+
+
+def get_fragment_cache_key(block, view_name, partition_service=None, static_asset_path=''):
+    """
+    Returns the key under which the given view of the block is cached, or
+    None if the view of this block must not be shared between users.
+
+    Arguments:
+        block (XBlock): The block being rendered.
+        view_name (str): The name of the view being rendered.
+        partition_service (PartitionService): Used to find the groups of
+            the current user in the partitions applicable to the block.
+        static_asset_path (str): The path /static/ urls of the block are
+            rewritten against, if it overrides the course's data directory.
+    """
+    if not is_fragment_cache_enabled():
+        return None
+
+    if view_name not in getattr(block, 'user_independent_views', ()):
+        return None
+
+    version = _get_block_version(block)
+    if version is None:
+        return None
+
+    key_parts = [
+        unicode(block.scope_ids.usage_id),
+        unicode(version),
+        unicode(_get_user_group_ids(block, partition_service)),
+        unicode(translation.get_language()),
+        unicode(view_name),
+        # The usage id above identifies the course /course/ and /jump_to_id/
+        # urls are rewritten against; these are the inputs of /static/ urls.
+        unicode(getattr(block, 'data_dir', None)),
+        unicode(static_asset_path),
+        unicode(settings.STATIC_URL),
+        unicode(AssetBaseUrlConfig.get_base_url()),
+        unicode(AssetExcludedExtensionsConfig.get_excluded_extensions()),
+    ]
+    return u'{}.{}'.format(
+        FRAGMENT_CACHE_KEY_PREFIX,
+        hashlib.md5(u'|'.join(key_parts).encode('utf-8')).hexdigest(),
+    )
+
+
+def get_cached_fragment(cache_key):
+    """
+    Returns the Fragment cached under the given key, or None.
+    """
+    pods = cache.get(cache_key)
+    if pods is None:
+        return None
+    return Fragment.from_pods(pods)
+
+
+def set_cached_fragment(cache_key, fragment):
+    """
+    Caches the content and resources of the given Fragment under the given key.
+    """
+    timeout = getattr(settings, 'XBLOCK_FRAGMENT_CACHE_TIMEOUT', DEFAULT_FRAGMENT_CACHE_TIMEOUT)
+    try:
+        cache.set(cache_key, fragment.to_pods(), timeout)
+    except Exception:  # pylint: disable=broad-except
+        # Fragments which are too large for the cache backend are simply
+        # rendered on every request.
+        log.warning(u'Unable to cache fragment with key %s', cache_key, exc_info=True)
@@ -18,6 +18,11 @@ from xmodule.partitions.partitions_service import PartitionService
 from xmodule.services import SettingsService
 from xmodule.x_module import ModuleSystem
 
+from lms.djangoapps.lms_xblock.fragment_cache import (
+    get_cached_fragment,
+    get_fragment_cache_key,
+    set_cached_fragment,
+)
 from lms.djangoapps.lms_xblock.models import XBlockAsidesConfig
 
 
@@ -216,8 +221,61 @@ class LmsModuleSystem(ModuleSystem):  # pylint: disable=abstract-method
         if badges_enabled():
             services['badging'] = BadgingService(course_id=kwargs.get('course_id'), modulestore=store)
         self.request_token = kwargs.pop('request_token', None)
+        # Wrappers which only rewrite the urls in the content of a fragment;
+        # they are applied before `wrappers`, see `wrap_xblock`.
+        self.content_wrappers = kwargs.pop('content_wrappers', [])
+        self.static_asset_path = kwargs.pop('static_asset_path', '')
+        # Maps usage ids of blocks being rendered to the key their view
+        # fragment should be cached under, see `render` and `wrap_xblock`.
+        self._pending_fragment_cache_keys = {}
         super(LmsModuleSystem, self).__init__(**kwargs)
 
+    def render(self, block, view_name, context=None):
+        """
+        Render a block by invoking its view.
+
+        If the block declares the view's output to be user-independent, the
+        fragment returned by the view is shared between users through the
+        fragment cache once its urls have been rewritten by the content
+        wrappers; the other wrappers are still applied on each render.
+
+        See :method:`xblock.runtime:Runtime.render`
+        """
+        cache_key = get_fragment_cache_key(
+            block, view_name, self._services.get('partitions'), self.static_asset_path
+        )
+        if cache_key is None:
+            return super(LmsModuleSystem, self).render(block, view_name, context)
+
+        fragment = get_cached_fragment(cache_key)
+        if fragment is not None:
+            context = context or {}
+            fragment = super(LmsModuleSystem, self).wrap_xblock(block, view_name, fragment, context)
+            return self.render_asides(block, view_name, fragment, context)
+
+        usage_id = block.scope_ids.usage_id
+        self._pending_fragment_cache_keys[usage_id] = cache_key
+        try:
+            return super(LmsModuleSystem, self).render(block, view_name, context)
+        finally:
+            self._pending_fragment_cache_keys.pop(usage_id, None)
+
+    def wrap_xblock(self, block, view, frag, context):
+        """
+        Apply the content wrappers, then the other wrappers, to the fragment.
+
+        Fragments of cacheable views are cached in between.
+
+        See :func:`Runtime.wrap_child`
+        """
+        for wrapper in self.content_wrappers:
+            frag = wrapper(block, view, frag, context)
+
+        cache_key = self._pending_fragment_cache_keys.pop(block.scope_ids.usage_id, None)
+        if cache_key is not None:
+            set_cached_fragment(cache_key, frag)
+        return super(LmsModuleSystem, self).wrap_xblock(block, view, frag, context)
+
     def handler_url(self, *args, **kwargs):
         """
         Implement the XBlock runtime handler_url interface.
@@ -0,0 +1,160 @@
+"""
+Tests of the shared XBlock view fragment cache.
+"""
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.utils import translation
+from mock import Mock, patch
+from xblock.fields import ScopeIds
+from xblock.fragment import Fragment
+
+from lms.djangoapps.lms_xblock.fragment_cache import (
+    get_cached_fragment,
+    get_fragment_cache_key,
+    set_cached_fragment,
+)
+from lms.djangoapps.lms_xblock.runtime import LmsModuleSystem
+from opaque_keys.edx.locations import SlashSeparatedCourseKey
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'fragment_cache_tests',
+    },
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+@patch.dict('django.conf.settings.FEATURES', {'ENABLE_XBLOCK_FRAGMENT_CACHE': True})
+class TestFragmentCache(TestCase):
+    """
+    Tests for building fragment cache keys and storing fragments.
+    """
+    def setUp(self):
+        super(TestFragmentCache, self).setUp()
+        cache.clear()
+        self.course_key = SlashSeparatedCourseKey('org', 'course', 'run')
+        self.block = self._make_block()
+
+    def _make_block(self, **kwargs):
+        """
+        Returns a mock block with a user-independent student view.
+        """
+        attributes = {
+            'scope_ids': ScopeIds(None, 'html', 'html_def', self.course_key.make_usage_key('html', 'html_id')),
+            'user_independent_views': ('student_view',),
+            'update_version': 'version_1',
+            'group_access': {},
+        }
+        attributes.update(kwargs)
+        block = Mock(spec=attributes.keys())
+        for name, value in attributes.items():
+            setattr(block, name, value)
+        return block
+
+    def test_not_cacheable_view(self):
+        self.assertIsNone(get_fragment_cache_key(self.block, 'studio_view'))
+
+    def test_no_version(self):
+        self.assertIsNone(get_fragment_cache_key(self._make_block(update_version=None), 'student_view'))
+
+    @patch.dict('django.conf.settings.FEATURES', {'ENABLE_XBLOCK_FRAGMENT_CACHE': False})
+    def test_disabled(self):
+        self.assertIsNone(get_fragment_cache_key(self.block, 'student_view'))
+
+    def test_key_varies_with_version(self):
+        self.assertNotEqual(
+            get_fragment_cache_key(self.block, 'student_view'),
+            get_fragment_cache_key(self._make_block(update_version='version_2'), 'student_view'),
+        )
+
+    def test_key_varies_with_language(self):
+        with translation.override('en'):
+            english_key = get_fragment_cache_key(self.block, 'student_view')
+        with translation.override('fr'):
+            french_key = get_fragment_cache_key(self.block, 'student_view')
+        self.assertNotEqual(english_key, french_key)
+
+    def test_key_varies_with_groups(self):
+        block = self._make_block(group_access={1: [0, 1]})
+        partition_service = Mock()
+        partition_service.get_user_group_id_for_partition.return_value = 0
+        group_0_key = get_fragment_cache_key(block, 'student_view', partition_service)
+        partition_service.get_user_group_id_for_partition.return_value = 1
+        group_1_key = get_fragment_cache_key(block, 'student_view', partition_service)
+        self.assertNotEqual(group_0_key, group_1_key)
+
+    def test_key_varies_with_static_asset_path(self):
+        self.assertNotEqual(
+            get_fragment_cache_key(self.block, 'student_view'),
+            get_fragment_cache_key(self.block, 'student_view', static_asset_path='course_assets'),
+        )
+
+    def test_round_trip(self):
+        cache_key = get_fragment_cache_key(self.block, 'student_view')
+        self.assertIsNone(get_cached_fragment(cache_key))
+
+        fragment = Fragment(u'<p>Hello</p>')
+        fragment.add_css(u'.hello {}')
+        set_cached_fragment(cache_key, fragment)
+
+        cached_fragment = get_cached_fragment(cache_key)
+        self.assertEqual(cached_fragment.content, fragment.content)
+        self.assertEqual(cached_fragment.resources, fragment.resources)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+@patch.dict('django.conf.settings.FEATURES', {'ENABLE_XBLOCK_FRAGMENT_CACHE': True})
+class TestLmsModuleSystemFragmentCache(TestCase):
+    """
+    Tests that the LMS runtime serves cached fragments through its wrappers.
+    """
+    def setUp(self):
+        super(TestLmsModuleSystemFragmentCache, self).setUp()
+        cache.clear()
+        self.wrapper = Mock(side_effect=lambda block, view, frag, context: frag)
+        self.content_wrapper = Mock(
+            side_effect=lambda block, view, frag, context: Fragment(frag.content.replace(u'/static/', u'/asset/'))
+        )
+        self.runtime = LmsModuleSystem(
+            static_url='/static',
+            track_function=Mock(),
+            get_module=Mock(),
+            render_template=Mock(),
+            replace_urls=str,
+            course_id=SlashSeparatedCourseKey('org', 'course', 'run'),
+            descriptor_runtime=Mock(),
+            wrappers=[self.wrapper],
+            content_wrappers=[self.content_wrapper],
+        )
+        self.block = Mock()
+        self.block.scope_ids = ScopeIds(None, 'html', 'html_def', 'html_id')
+
+    @patch('lms.djangoapps.lms_xblock.runtime.get_fragment_cache_key', Mock(return_value='fragment_key'))
+    def test_cached_fragment_is_wrapped(self):
+        set_cached_fragment('fragment_key', Fragment(u'<img src="/asset/image.png"/>'))
+        with patch.object(self.runtime, 'render_asides', side_effect=lambda block, view, frag, context: frag):
+            fragment = self.runtime.render(self.block, 'student_view')
+
+        self.assertEqual(fragment.content, u'<img src="/asset/image.png"/>')
+        self.assertEqual(self.wrapper.call_count, 1)
+        self.assertFalse(self.content_wrapper.called)
+        self.assertFalse(self.block.student_view.called)
+
+    @patch('lms.djangoapps.lms_xblock.runtime.get_fragment_cache_key', Mock(return_value='fragment_key'))
+    def test_rewritten_fragment_is_cached(self):
+        wrapped_fragment = Fragment(u'<div><img src="/asset/image.png"/></div>')
+        self.wrapper.side_effect = lambda block, view, frag, context: wrapped_fragment
+        self.runtime._pending_fragment_cache_keys[self.block.scope_ids.usage_id] = 'fragment_key'  # pylint: disable=protected-access
+
+        fragment = self.runtime.wrap_xblock(self.block, 'student_view', Fragment(u'<img src="/static/image.png"/>'), {})
+
+        self.assertEqual(fragment.content, wrapped_fragment.content)
+        self.assertEqual(get_cached_fragment('fragment_key').content, u'<img src="/asset/image.png"/>')
+
+    def test_uncacheable_fragment_is_rewritten(self):
+        fragment = self.runtime.wrap_xblock(self.block, 'student_view', Fragment(u'<img src="/static/image.png"/>'), {})
+
+        self.assertEqual(fragment.content, u'<img src="/asset/image.png"/>')
+        self.assertIsNone(get_cached_fragment('fragment_key'))
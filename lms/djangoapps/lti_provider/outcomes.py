@@ -20,6 +20,11 @@ from lti_provider.models import GradedAssignment, OutcomeService
 
 log = logging.getLogger("edx.lti_provider")
 
+# Shared by all outcome passbacks, so that connections to the outcome services
+# of the consumers are pooled and kept alive between score updates. The OAuth
+# signature depends on the consumer, so it is passed with each request.
+OUTCOME_SERVICE_SESSION = requests.Session()
+
 
 class BodyHashClient(Client):
     """
@@ -197,7 +202,7 @@ def sign_and_send_replace_result(assignment, xml):
     )
 
     headers = {'content-type': 'application/xml'}
-    response = requests.post(
+    response = OUTCOME_SERVICE_SESSION.post(
         assignment.outcome_service.lis_outcome_service_url,
         data=xml,
         auth=oauth,
@@ -7,7 +7,7 @@ from django.contrib.auth.models import User
 from django.dispatch import receiver
 import logging
 
-from courseware.grades import get_weighted_scores
+from courseware.grades import get_weighted_scores_for_block
 from courseware.models import SCORE_CHANGED
 from lms import CELERY_APP
 from lti_provider.models import GradedAssignment
@@ -79,9 +79,8 @@ def send_composite_outcome(user_id, course_id, assignment_id, version):
     vertical).
 
     A composite module may contain multiple problems, so we need to
-    calculate the total points earned and possible for all child problems. This
-    requires calculating the scores for the whole course, which is an expensive
-    operation.
+    calculate the total points earned and possible for all child problems. Only
+    the scores of the blocks in the subtree of the assignment are computed.
 
     Callers should be aware that the score calculation code accesses the latest
     scores from the database. This can lead to a race condition between a view
@@ -93,10 +92,12 @@ def send_composite_outcome(user_id, course_id, assignment_id, version):
     The GradedAssignment model has a version_number field that is incremented
     whenever the score is updated. It is used by this method for two purposes.
     First, it allows the task to exit if it detects that it has been superseded
-    by another task that will transmit the score for the same assignment.
-    Second, it prevents a race condition where two tasks calculate different
-    scores for a single assignment, and may potentially update the campus LMS
-    in the wrong order.
+    by another task that will transmit the score for the same assignment, so
+    that a burst of score changes for one (user, assignment) pair results in a
+    single score calculation and passback, for the latest version. Second, it
+    prevents a race condition where two tasks calculate different scores for a
+    single assignment, and may potentially update the campus LMS in the wrong
+    order.
     """
     assignment = GradedAssignment.objects.get(id=assignment_id)
     if version != assignment.version_number:
@@ -109,8 +110,7 @@ def send_composite_outcome(user_id, course_id, assignment_id, version):
     mapped_usage_key = assignment.usage_key.map_into_course(course_key)
     user = User.objects.get(id=user_id)
     course = modulestore().get_course(course_key, depth=0)
-    progress_summary = get_weighted_scores(user, course)
-    earned, possible = progress_summary.score_for_module(mapped_usage_key)
+    earned, possible = get_weighted_scores_for_block(user, course, mapped_usage_key)
     if possible == 0:
         weighted_score = 0
     else:
@@ -170,7 +170,7 @@ class SignAndSendReplaceResultTest(TestCase):
         )
         self.assignment.save()
 
-    @patch('requests.post', return_value='response')
+    @patch('lti_provider.outcomes.OUTCOME_SERVICE_SESSION.post', return_value='response')
     def test_sign_and_send_replace_result(self, post_mock):
         response = outcomes.sign_and_send_replace_result(self.assignment, 'xml')
         post_mock.assert_called_with(
@@ -99,9 +99,8 @@ class SendCompositeOutcomeTest(BaseOutcomeTest):
             block_type='problem',
             block_id='problem',
         )
-        self.weighted_scores = MagicMock()
         self.weighted_scores_mock = self.setup_patch(
-            'lti_provider.tasks.get_weighted_scores', self.weighted_scores
+            'lti_provider.tasks.get_weighted_scores_for_block', None
         )
         self.module_store = MagicMock()
         self.module_store.get_item = MagicMock(return_value=self.descriptor)
@@ -117,12 +116,20 @@ class SendCompositeOutcomeTest(BaseOutcomeTest):
     )
     @ddt.unpack
     def test_outcome_with_score_score(self, earned, possible, expected):
-        self.weighted_scores.score_for_module = MagicMock(return_value=(earned, possible))
+        self.weighted_scores_mock.return_value = (earned, possible)
         tasks.send_composite_outcome(
             self.user.id, unicode(self.course_key), self.assignment.id, 1
         )
         self.send_score_update_mock.assert_called_once_with(self.assignment, expected)
 
+    def test_scores_only_assignment(self):
+        self.weighted_scores_mock.return_value = (1, 2)
+        tasks.send_composite_outcome(
+            self.user.id, unicode(self.course_key), self.assignment.id, 1
+        )
+        __, __, usage_key = self.weighted_scores_mock.call_args[0]
+        self.assertEqual(usage_key, self.usage_key)
+
     def test_outcome_with_outdated_version(self):
         self.assignment.version_number = 2
         self.assignment.save()
@@ -3,26 +3,31 @@ Serializer for video outline
 """
 from rest_framework.reverse import reverse
 
+from lms.djangoapps.course_blocks.api import COURSE_BLOCK_ACCESS_TRANSFORMERS, get_course_blocks
+from lms.djangoapps.course_blocks.transformers.library_content import ContentLibraryTransformer
+from lms.djangoapps.course_blocks.transformers.user_partitions import (
+    UserPartitionTransformer, _get_user_partition_groups
+)
+from lms.djangoapps.course_blocks.usage_info import CourseUsageInfo
+from openedx.core.djangoapps.content.block_structure.api import get_course_in_cache
+from openedx.core.lib.block_structure.transformers import BlockStructureTransformers
 from xmodule.modulestore.mongo.base import BLOCK_TYPES_WITH_CHILDREN
-from xmodule.modulestore.django import modulestore
-from courseware.access import has_access
-from courseware.courses import get_course_by_id
-from courseware.model_data import FieldDataCache
-from courseware.module_render import get_module_for_descriptor
-from util.module_utils import get_dynamic_descriptor_children
 
 from edxval.api import (
     get_video_info_for_course_and_profiles, ValInternalError
 )
 
+from .transformers import VideoOutlineTransformer
+
 
 class BlockOutline(object):
     """
-    Serializes course videos, pulling data from VAL and the video modules.
+    Serializes course videos, pulling data from VAL and the collected
+    block structure of the course.
     """
-    def __init__(self, course_id, start_block, block_types, request, video_profiles):
-        """Create a BlockOutline using `start_block` as a starting point."""
-        self.start_block = start_block
+    def __init__(self, course_id, start_block_key, block_types, request, video_profiles):
+        """Create a BlockOutline using `start_block_key` as a starting point."""
+        self.start_block_key = start_block_key
         self.block_types = block_types
         self.course_id = course_id
         self.request = request  # needed for making full URLS
@@ -44,77 +49,115 @@ class BlockOutline(object):
                 usage_key.block_type in BLOCK_TYPES_WITH_CHILDREN
             )
 
-        def create_module(descriptor):
-            """
-            Factory method for creating and binding a module for the given descriptor.
-            """
-            field_data_cache = FieldDataCache.cache_for_descriptor_descendents(
-                self.course_id, self.request.user, descriptor, depth=0,
-            )
-            course = get_course_by_id(self.course_id)
-            return get_module_for_descriptor(
-                self.request.user, self.request, descriptor, field_data_cache, self.course_id, course=course
-            )
-
-        with modulestore().bulk_operations(self.course_id):
-            child_to_parent = {}
-            stack = [self.start_block]
-            while stack:
-                curr_block = stack.pop()
-
-                if curr_block.hide_from_toc:
-                    # For now, if the 'hide_from_toc' setting is set on the block, do not traverse down
-                    # the hierarchy.  The reason being is that these blocks may not have human-readable names
-                    # to display on the mobile clients.
-                    # Eventually, we'll need to figure out how we want these blocks to be displayed on the
-                    # mobile clients.  As they are still accessible in the browser, just not navigatable
-                    # from the table-of-contents.
+        block_structure = get_course_in_cache(self.course_id)
+        accessible_blocks = self._get_accessible_blocks()
+        user_groups = None
+
+        child_to_parent = {}
+        stack = [self.start_block_key]
+        while stack:
+            curr_block_key = stack.pop()
+
+            if block_structure.get_xblock_field(curr_block_key, 'hide_from_toc'):
+                # For now, if the 'hide_from_toc' setting is set on the block, do not traverse down
+                # the hierarchy.  The reason being is that these blocks may not have human-readable names
+                # to display on the mobile clients.
+                # Eventually, we'll need to figure out how we want these blocks to be displayed on the
+                # mobile clients.  As they are still accessible in the browser, just not navigatable
+                # from the table-of-contents.
+                continue
+
+            if curr_block_key.block_type in self.block_types:
+                if curr_block_key not in accessible_blocks:
                     continue
 
-                if curr_block.location.block_type in self.block_types:
-                    if not has_access(self.request.user, 'load', curr_block, course_key=self.course_id):
-                        continue
-
-                    summary_fn = self.block_types[curr_block.category]
-                    block_path = list(path(curr_block, child_to_parent, self.start_block))
-                    unit_url, section_url = find_urls(self.course_id, curr_block, child_to_parent, self.request)
-
-                    yield {
-                        "path": block_path,
-                        "named_path": [b["name"] for b in block_path],
-                        "unit_url": unit_url,
-                        "section_url": section_url,
-                        "summary": summary_fn(self.course_id, curr_block, self.request, self.local_cache)
-                    }
-
-                if curr_block.has_children:
-                    children = get_dynamic_descriptor_children(
-                        curr_block,
-                        self.request.user.id,
-                        create_module,
-                        usage_key_filter=parent_or_requested_block_type
+                summary_fn = self.block_types[curr_block_key.block_type]
+                block_path = list(path(curr_block_key, child_to_parent, self.start_block_key, block_structure))
+                unit_url, section_url = find_urls(
+                    self.course_id, curr_block_key, child_to_parent, block_structure, self.request
+                )
+
+                yield {
+                    "path": block_path,
+                    "named_path": [b["name"] for b in block_path],
+                    "unit_url": unit_url,
+                    "section_url": section_url,
+                    "summary": summary_fn(
+                        self.course_id, block_structure, curr_block_key, self.request, self.local_cache
                     )
-                    for block in reversed(children):
-                        stack.append(block)
-                        child_to_parent[block] = curr_block
+                }
+
+            if curr_block_key.block_type == 'split_test':
+                # Only the child for the user's group is displayed, even to
+                # staff, as when the split_test module is rendered.
+                if user_groups is None:
+                    user_partitions = block_structure.get_transformer_data(UserPartitionTransformer, 'user_partitions')
+                    user_groups = _get_user_partition_groups(
+                        self.course_id, user_partitions or [], self.request.user
+                    )
+                children = _get_split_test_children(block_structure, curr_block_key, user_groups)
+            else:
+                children = [
+                    child_key for child_key in block_structure.get_children(curr_block_key)
+                    if child_key.block_type == 'split_test' or child_key in accessible_blocks
+                ]
+
+            for child_key in reversed(children):
+                if parent_or_requested_block_type(child_key):
+                    stack.append(child_key)
+                    child_to_parent[child_key] = curr_block_key
+
+    def _get_accessible_blocks(self):
+        """
+        Returns the block structure of the course blocks which the user
+        may load.
+
+        Staff have access to all the blocks except the library content
+        children which aren't selected for them.  In both cases, the
+        children of split_test blocks are chosen during the traversal.
+        """
+        usage_info = CourseUsageInfo(self.course_id, self.request.user)
+        if usage_info.has_staff_access:
+            transformers = [ContentLibraryTransformer()]
+        else:
+            transformers = COURSE_BLOCK_ACCESS_TRANSFORMERS
+        return get_course_blocks(
+            self.request.user, self.start_block_key, BlockStructureTransformers(transformers)
+        )
+
+
+def _get_split_test_children(block_structure, block_key, user_groups):
+    """
+    Returns the children of the given split_test block for the user's
+    group in its user partition.
+    """
+    split_test_data = block_structure.get_transformer_block_field(
+        block_key, VideoOutlineTransformer, VideoOutlineTransformer.SPLIT_TEST_DATA, {}
+    )
+    group = user_groups.get(split_test_data.get('user_partition_id'))
+    if group is None:
+        return []
+    child_key = split_test_data['group_id_to_child'].get(unicode(group.id))
+    return [child_key] if child_key in block_structure.get_children(block_key) else []
 
 
-def path(block, child_to_parent, start_block):
+def path(block_key, child_to_parent, start_block_key, block_structure):
     """path for block"""
     block_path = []
-    while block in child_to_parent:
-        block = child_to_parent[block]
-        if block is not start_block:
+    while block_key in child_to_parent:
+        block_key = child_to_parent[block_key]
+        if block_key != start_block_key:
             block_path.append({
-                # to be consistent with other edx-platform clients, return the defaulted display name
-                'name': block.display_name_with_default_escaped,
-                'category': block.category,
-                'id': unicode(block.location)
+                'name': block_structure.get_transformer_block_field(
+                    block_key, VideoOutlineTransformer, VideoOutlineTransformer.DISPLAY_NAME
+                ),
+                'category': block_key.block_type,
+                'id': unicode(block_key)
             })
     return reversed(block_path)
 
 
-def find_urls(course_id, block, child_to_parent, request):
+def find_urls(course_id, block_key, child_to_parent, block_structure, request):
     """
     Find the section and unit urls for a block.
 
@@ -125,21 +168,21 @@ def find_urls(course_id, block, child_to_parent, request):
 
     """
     block_path = []
-    while block in child_to_parent:
-        block = child_to_parent[block]
-        block_path.append(block)
+    while block_key in child_to_parent:
+        block_key = child_to_parent[block_key]
+        block_path.append(block_key)
 
     block_list = list(reversed(block_path))
     block_count = len(block_list)
 
-    chapter_id = block_list[1].location.block_id if block_count > 1 else None
+    chapter_id = block_list[1].block_id if block_count > 1 else None
     section = block_list[2] if block_count > 2 else None
     position = None
 
     if block_count > 3:
         position = 1
-        for block in section.children:
-            if block.name == block_list[3].url_name:
+        for child_key in block_structure.get_children(section):
+            if child_key.block_id == block_list[3].block_id:
                 break
             position += 1
 
@@ -153,7 +196,7 @@ def find_urls(course_id, block, child_to_parent, request):
         chapter_url = reverse("courseware_chapter", kwargs=kwargs, request=request)
         return chapter_url, chapter_url
 
-    kwargs['section'] = section.url_name
+    kwargs['section'] = section.block_id
     section_url = reverse("courseware_section", kwargs=kwargs, request=request)
     if position is None:
         return section_url, section_url
@@ -163,18 +206,21 @@ def find_urls(course_id, block, child_to_parent, request):
     return unit_url, section_url
 
 
-def video_summary(video_profiles, course_id, video_descriptor, request, local_cache):
+def video_summary(video_profiles, course_id, block_structure, video_key, request, local_cache):
     """
-    returns summary dict for the given video module
+    returns summary dict for the given video block
     """
+    video_descriptor_data = block_structure.get_transformer_block_field(
+        video_key, VideoOutlineTransformer, VideoOutlineTransformer.VIDEO_DATA
+    )
     always_available_data = {
-        "name": video_descriptor.display_name,
-        "category": video_descriptor.category,
-        "id": unicode(video_descriptor.scope_ids.usage_id),
-        "only_on_web": video_descriptor.only_on_web,
+        "name": video_descriptor_data['display_name'],
+        "category": video_key.block_type,
+        "id": unicode(video_key),
+        "only_on_web": video_descriptor_data['only_on_web'],
     }
 
-    if video_descriptor.only_on_web:
+    if video_descriptor_data['only_on_web']:
         ret = {
             "video_url": None,
             "video_thumbnail_url": None,
@@ -187,7 +233,7 @@ def video_summary(video_profiles, course_id, video_descriptor, request, local_ca
         return ret
 
     # Get encoded videos
-    video_data = local_cache['course_videos'].get(video_descriptor.edx_video_id, {})
+    video_data = local_cache['course_videos'].get(video_descriptor_data['edx_video_id'], {})
 
     # Get highest priority video to populate backwards compatible field
     default_encoded_video = {}
@@ -201,25 +247,24 @@ def video_summary(video_profiles, course_id, video_descriptor, request, local_ca
     if default_encoded_video:
         video_url = default_encoded_video['url']
     # Then fall back to VideoDescriptor fields for video URLs
-    elif video_descriptor.html5_sources:
-        video_url = video_descriptor.html5_sources[0]
+    elif video_descriptor_data['html5_sources']:
+        video_url = video_descriptor_data['html5_sources'][0]
     else:
-        video_url = video_descriptor.source
+        video_url = video_descriptor_data['source']
 
     # Get duration/size, else default
     duration = video_data.get('duration', None)
     size = default_encoded_video.get('file_size', 0)
 
     # Transcripts...
-    transcripts_info = video_descriptor.get_transcripts_info()
-    transcript_langs = video_descriptor.available_translations(transcripts_info, verify_assets=False)
+    transcript_langs = video_descriptor_data['transcript_languages']
 
     transcripts = {
         lang: reverse(
             'video-transcripts-detail',
             kwargs={
                 'course_id': unicode(course_id),
-                'block_id': video_descriptor.scope_ids.usage_id.block_id,
+                'block_id': video_key.block_id,
                 'lang': lang
             },
             request=request,
@@ -233,7 +278,7 @@ def video_summary(video_profiles, course_id, video_descriptor, request, local_ca
         "duration": duration,
         "size": size,
         "transcripts": transcripts,
-        "language": video_descriptor.get_default_transcript_language(transcripts_info),
+        "language": video_descriptor_data['default_transcript_language'],
         "encoded_videos": video_data.get('profiles')
     }
     ret.update(always_available_data)
@@ -8,20 +8,23 @@ from uuid import uuid4
 from collections import namedtuple
 
 import ddt
+from mock import patch
 from nose.plugins.attrib import attr
 from edxval import api
 from xmodule.modulestore.tests.factories import ItemFactory
 from xmodule.video_module import transcripts_utils
-from xmodule.modulestore.django import modulestore
 from xmodule.partitions.partitions import Group, UserPartition
 from milestones.tests.utils import MilestonesTestCaseMixin
 
 from mobile_api.models import MobileApiConfig
+from openedx.core.djangoapps.content.block_structure.api import clear_course_from_cache
 from openedx.core.djangoapps.course_groups.tests.helpers import CohortFactory
 from openedx.core.djangoapps.course_groups.models import CourseUserGroupPartitionGroup
 from openedx.core.djangoapps.course_groups.cohorts import add_user_to_cohort, remove_user_from_cohort
 from mobile_api.testutils import MobileAPITestCase, MobileAuthTestMixin, MobileCourseAccessTestMixin
 
+from .transformers import VideoOutlineTransformer
+
 
 class TestVideoAPITestCase(MobileAPITestCase):
     """
@@ -133,6 +136,14 @@ class TestVideoAPIMixin(object):
             sub=subid
         )
 
+    def _update_item(self, xblock):
+        """
+        Updates the given xblock and clears the cached block structure of
+        the course, which is otherwise only updated when it is published.
+        """
+        self._update_item(xblock)
+        clear_course_from_cache(self.course.id)
+
     def _verify_paths(self, course_outline, path_list, outline_index=0):
         """
         Takes a path_list and compares it against the course_outline
@@ -165,12 +176,12 @@ class TestVideoAPIMixin(object):
             ),
         ]
         self.course.cohort_config = {'cohorted': is_cohorted}
-        self.store.update_item(self.course, self.user.id)
+        self._update_item(self.course)
 
     def _setup_group_access(self, xblock, partition_id, group_ids):
         """Helper method to configure the partition and group mapping for the given xblock."""
         xblock.group_access = {partition_id: group_ids}
-        self.store.update_item(xblock, self.user.id)
+        self._update_item(xblock)
 
     def _setup_split_module(self, sub_block_category):
         """Helper method to configure a split_test unit with children of type sub_block_category."""
@@ -194,7 +205,7 @@ class TestVideoAPIMixin(object):
         self.split_test.group_id_to_child = {
             str(index): url for index, url in enumerate([sub_block_a.location, sub_block_b.location])
         }
-        self.store.update_item(self.split_test, self.user.id)
+        self._update_item(self.split_test)
         return sub_block_a, sub_block_b
 
 
@@ -417,6 +428,19 @@ class TestVideoSummaryList(TestVideoAPITestCase, MobileAuthTestMixin, MobileCour
     """
     REVERSE_INFO = {'name': 'video-summary-list', 'params': ['course_id']}
 
+    def test_collected_block_structure(self):
+        self.login_and_enroll()
+        self._create_video_with_subs()
+        self.api_response()
+
+        # The outline is built from the cached block structure, without
+        # collecting the video data again.
+        with patch.object(VideoOutlineTransformer, 'collect') as mock_collect:
+            course_outline = self.api_response().data
+        self.assertFalse(mock_collect.called)
+        self.assertEqual(len(course_outline), 1)
+        self.assertEqual(course_outline[0]['summary']['name'], u"test video omega \u03a9")
+
     def test_only_on_web(self):
         self.login_and_enroll()
 
@@ -823,7 +847,7 @@ class TestVideoSummaryList(TestVideoAPITestCase, MobileAuthTestMixin, MobileCour
 
         for case in language_cases:
             video.transcripts = case.transcripts
-            modulestore().update_item(video, self.user.id)
+            self._update_item(video)
             course_outline = self.api_response().data
             self.assertEqual(len(course_outline), 1)
             self.assertEqual(course_outline[0]['summary']['language'], case.expected_language)
@@ -856,7 +880,7 @@ class TestVideoSummaryList(TestVideoAPITestCase, MobileAuthTestMixin, MobileCour
         for case in transcript_cases:
             video.transcripts = case.transcripts
             video.sub = case.english_subtitle
-            modulestore().update_item(video, self.user.id)
+            self._update_item(video)
             course_outline = self.api_response().data
             self.assertEqual(len(course_outline), 1)
             self.assertSetEqual(
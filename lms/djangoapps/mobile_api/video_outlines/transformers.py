@@ -0,0 +1,77 @@
+"""
+Video Outline Transformer
+"""
+from openedx.core.lib.block_structure.transformer import BlockStructureTransformer
+
+
+class VideoOutlineTransformer(BlockStructureTransformer):
+    """
+    The VideoOutlineTransformer collects the data needed to build the
+    video outlines of the mobile API, so that they can be built from the
+    block structure of a course without loading any XModules.
+
+    No runtime transformations are performed.
+
+    The following values are stored as transformer_block_fields:
+
+        display_name: (string) the defaulted, escaped display name of
+            every block.
+        video_data: (dict) the display name, only_on_web, edx_video_id,
+            html5_sources, source, transcript languages and default
+            transcript language of each video block.
+        split_test_data: (dict) the user_partition_id and
+            group_id_to_child of each split_test block.
+    """
+    VERSION = 1
+    DISPLAY_NAME = 'display_name'
+    VIDEO_DATA = 'video_data'
+    SPLIT_TEST_DATA = 'split_test_data'
+
+    @classmethod
+    def name(cls):
+        """
+        Unique identifier for the transformer's class;
+        same identifier used in setup.py.
+        """
+        return "video_outlines"
+
+    @classmethod
+    def collect(cls, block_structure):
+        """
+        Collects any information that's necessary to build the video
+        outlines.
+        """
+        block_structure.request_xblock_fields('hide_from_toc')
+
+        for block_key in block_structure.topological_traversal():
+            xblock = block_structure.get_xblock(block_key)
+
+            # to be consistent with other edx-platform clients, paths use the defaulted display name
+            block_structure.set_transformer_block_field(
+                block_key, cls, cls.DISPLAY_NAME, xblock.display_name_with_default_escaped
+            )
+
+            if block_key.block_type == 'video':
+                transcripts_info = xblock.get_transcripts_info()
+                block_structure.set_transformer_block_field(block_key, cls, cls.VIDEO_DATA, {
+                    'display_name': xblock.display_name,
+                    'only_on_web': xblock.only_on_web,
+                    'edx_video_id': xblock.edx_video_id,
+                    'html5_sources': list(xblock.html5_sources),
+                    'source': xblock.source,
+                    'transcript_languages': list(
+                        xblock.available_translations(transcripts_info, verify_assets=False)
+                    ),
+                    'default_transcript_language': xblock.get_default_transcript_language(transcripts_info),
+                })
+            elif block_key.block_type == 'split_test':
+                block_structure.set_transformer_block_field(block_key, cls, cls.SPLIT_TEST_DATA, {
+                    'user_partition_id': xblock.user_partition_id,
+                    'group_id_to_child': dict(xblock.group_id_to_child),
+                })
+
+    def transform(self, usage_info, block_structure):
+        """
+        Perform no transformations.
+        """
+        pass
@@ -74,13 +74,13 @@ class VideoSummaryList(generics.ListAPIView):
               Management System.
     """
 
-    @mobile_course_access(depth=None)
+    @mobile_course_access()
     def list(self, request, course, *args, **kwargs):
         video_profiles = MobileApiConfig.get_video_profiles()
         video_outline = list(
             BlockOutline(
                 course.id,
-                course,
+                course.location,
                 {"video": partial(video_summary, video_profiles)},
                 request,
                 video_profiles,
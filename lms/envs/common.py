@@ -363,8 +363,26 @@ FEATURES = {
 
     # WIP -- will be removed in Ticket #TNL-4750.
     'ENABLE_TIME_ZONE_PREFERENCE': False,
+
+    # Share the rendered output of XBlock views which are declared
+    # user-independent (e.g. HTML components) between users.
+    'ENABLE_XBLOCK_FRAGMENT_CACHE': False,
+
+    # Load all of a user's enrollments with one query the first time one is
+    # checked during a request, and answer the other checks of the request
+    # from them.
+    'ENABLE_ENROLLMENT_SNAPSHOT': False,
 }
 
+# Number of seconds to keep shared XBlock view fragments in the cache.
+XBLOCK_FRAGMENT_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Local disk cache for course assets too large for the Django cache, e.g.
+# {'LOCATION': '/edx/var/edxapp/asset_cache', 'MAX_SIZE': 10 * 1024 ** 3}.
+# MAX_SIZE bounds the directory, which all the processes of a host share.
+# Disabled when empty.
+CONTENTSERVER_DISK_CACHE = None
+
 # Ignore static asset files on import which match this pattern
 ASSET_IGNORE_REGEX = r"(^\._.*$)|(^\.DS_Store$)|(^.*~$)"
 
@@ -461,6 +479,9 @@ OAUTH2_PROVIDER = {
 # TODO: Move the Mako templating into a different engine in TEMPLATES below.
 import tempfile
 MAKO_MODULE_DIR = os.path.join(tempfile.gettempdir(), 'mako_lms')
+# Load the templates precompiled into MAKO_MODULE_DIR by the
+# `compile_mako_templates` management command at startup.
+MAKO_WARM_UP_TEMPLATES = False
 MAKO_TEMPLATES = {}
 MAKO_TEMPLATES['main'] = [PROJECT_ROOT / 'templates',
                           COMMON_ROOT / 'templates',
@@ -1072,6 +1093,15 @@ FOOTER_CACHE_TIMEOUT = 30 * 60
 # Max age cache control header for the footer (controls browser caching).
 FOOTER_BROWSER_CACHE_MAX_AGE = 5 * 60
 
+# Number of seconds for which each process keeps ConfigurationModel entries in
+# memory, in front of the 'configuration' cache, or 0 not to keep them.
+CONFIGURATION_MODEL_LOCAL_CACHE_TIMEOUT = 0
+
+# Number of seconds for which the blocks of a course which a user can access
+# are cached after get_course_blocks applies the access transformers, or 0
+# not to cache them.
+COURSE_BLOCKS_FILTER_CACHE_TIMEOUT = 0
+
 # Credit api notification cache timeout
 CREDIT_NOTIFICATION_CACHE_TIMEOUT = 5 * 60 * 60
 
@@ -1109,6 +1139,7 @@ MIDDLEWARE_CLASSES = (
     'django.contrib.auth.middleware.SessionAuthenticationMiddleware',
 
     'student.middleware.UserStandingMiddleware',
+    'student.middleware.EnrollmentSnapshotMiddleware',
     'contentserver.middleware.StaticContentServer',
 
     # Adds user tags to tracking events
@@ -1900,6 +1931,7 @@ INSTALLED_APPS = (
     'dashboard',
     'instructor',
     'instructor_task',
+    'class_dashboard.apps.ClassDashboardConfig',
     'openedx.core.djangoapps.course_groups',
     'bulk_email',
     'branding',
@@ -2269,9 +2301,14 @@ VERIFY_STUDENT = {
 }
 
 ### This enables the Metrics tab for the Instructor dashboard ###########
+# The class_dashboard app is always installed, since the instructor dashboard
+# imports it.
 FEATURES['CLASS_DASHBOARD'] = False
-if FEATURES.get('CLASS_DASHBOARD'):
-    INSTALLED_APPS += ('class_dashboard',)
+
+# Keep the Metrics tab's grade and subsection open counts in their own tables as
+# student modules change, rather than aggregating them on each load. Run the
+# backfill_class_dashboard management command after enabling it.
+FEATURES['ENABLE_CLASS_DASHBOARD_COUNTS'] = False
 
 ################ Enable credit eligibility feature ####################
 ENABLE_CREDIT_ELIGIBILITY = True
@@ -2736,6 +2773,10 @@ ACCOUNT_VISIBILITY_CONFIGURATION = {
     ]
 }
 
+# Number of seconds to cache the users, profiles and preferences loaded for the
+# accounts API, or 0 not to cache them.
+USER_BUNDLE_CACHE_TIMEOUT = 0
+
 # E-Commerce API Configuration
 ECOMMERCE_PUBLIC_URL_ROOT = None
 ECOMMERCE_API_URL = None
@@ -10,6 +10,7 @@ settings.INSTALLED_APPS  # pylint: disable=pointless-statement
 
 from openedx.core.lib.django_startup import autostartup
 import edxmako
+import edxmako.startup
 import logging
 import analytics
 from monkey_patch import (
@@ -85,6 +86,9 @@ def run():
     xmodule.x_module.descriptor_global_handler_url = lms_xblock.runtime.handler_url
     xmodule.x_module.descriptor_global_local_resource_url = lms_xblock.runtime.local_resource_url
 
+    # Now that all the template directories are added.
+    edxmako.startup.warm_up()
+
 
 def add_mimetypes():
     """
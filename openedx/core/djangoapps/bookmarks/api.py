@@ -71,6 +71,9 @@ def get_bookmarks(user, course_key=None, fields=None, serialized=True):
     bookmarks_queryset = bookmarks_queryset.order_by('-created')
 
     if serialized:
+        if 'path' in (fields or []):
+            bookmarks_queryset = list(bookmarks_queryset)
+            Bookmark.update_paths(bookmarks_queryset)
         return BookmarkSerializer(bookmarks_queryset, context={'fields': fields}, many=True).data
 
     return bookmarks_queryset
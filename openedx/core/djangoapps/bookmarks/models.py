@@ -10,6 +10,7 @@ from jsonfield.fields import JSONField
 from model_utils.models import TimeStampedModel
 
 from opaque_keys.edx.keys import UsageKey
+from openedx.core.djangoapps.content.block_structure.paths import get_paths_to_locations
 from xmodule.modulestore import search
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.exceptions import ItemNotFoundError, NoPathToItem
@@ -126,6 +127,36 @@ class Bookmark(TimeStampedModel):
 
         return parse_path_data(self._path)
 
+    @classmethod
+    def update_paths(cls, bookmarks):
+        """
+        Bring the paths of the given bookmarks up to date, as the path property
+        does for each bookmark, but resolving the paths of all of them at once.
+
+        The bookmarks should have their xblock_cache already loaded.
+        """
+        stale_bookmarks = [
+            bookmark for bookmark in bookmarks
+            if bookmark.modified < bookmark.xblock_cache.modified  # pylint: disable=no-member
+        ]
+        if not stale_bookmarks:
+            return
+
+        paths = {}
+        unresolved_usage_keys = []
+        for bookmark in stale_bookmarks:
+            cached_paths = bookmark.xblock_cache.paths  # pylint: disable=no-member
+            if cached_paths and len(cached_paths) == 1:
+                paths[bookmark.usage_key] = cached_paths[0]
+            else:
+                unresolved_usage_keys.append(bookmark.usage_key)
+        if unresolved_usage_keys:
+            paths.update(cls.get_paths(unresolved_usage_keys))
+
+        for bookmark in stale_bookmarks:
+            bookmark._path = prepare_path_for_serialization(paths[bookmark.usage_key])  # pylint: disable=protected-access
+            bookmark.save()  # Always save so that bookmark.modified is updated.
+
     @staticmethod
     def updated_path(usage_key, xblock_cache):
         """
@@ -183,6 +214,56 @@ class Bookmark(TimeStampedModel):
 
         return path_data
 
+    @staticmethod
+    def get_paths(usage_keys):
+        """
+        Bulk version of get_path.
+
+        The paths are looked up in the ancestor index of the courses, and the
+        display names of the blocks on the paths are read from XBlockCache
+        with a single query. Only the blocks which aren't in XBlockCache are
+        loaded from the modulestore.
+
+        Arguments:
+            usage_keys (list of UsageKey): The blocks whose paths are required.
+
+        Returns:
+            dict mapping each usage key to its list of PathItems
+        """
+        locations = get_paths_to_locations(usage_keys, full_path=True)
+        for usage_key in usage_keys:
+            if usage_key not in locations:
+                log.error(u'No path to block with usage_key: %s.', usage_key)
+
+        ancestor_usage_keys = set(
+            ancestor_usage_key
+            for usage_key, path in locations.iteritems()
+            for ancestor_usage_key in path
+            if ancestor_usage_key != usage_key and ancestor_usage_key.block_type != 'course'  # pylint: disable=no-member
+        )
+        display_names = {}
+        if ancestor_usage_keys:
+            for xblock_cache in XBlockCache.objects.filter(usage_key__in=ancestor_usage_keys):
+                display_names[xblock_cache.usage_key] = xblock_cache.display_name
+
+        paths = {}
+        for usage_key in usage_keys:
+            path_data = []
+            for ancestor_usage_key in locations.get(usage_key, []):
+                if ancestor_usage_key == usage_key or ancestor_usage_key.block_type == 'course':  # pylint: disable=no-member
+                    continue
+                if ancestor_usage_key not in display_names:
+                    try:
+                        block = modulestore().get_item(ancestor_usage_key)
+                    except ItemNotFoundError:
+                        path_data = []  # No valid path can be found.
+                        break
+                    display_names[ancestor_usage_key] = block.display_name_with_default
+                path_data.append(PathItem(ancestor_usage_key, display_names[ancestor_usage_key]))
+            paths[usage_key] = path_data
+
+        return paths
+
 
 class XBlockCache(TimeStampedModel):
     """
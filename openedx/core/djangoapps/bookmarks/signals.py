@@ -4,15 +4,21 @@ Signals for bookmarks.
 from importlib import import_module
 
 from django.dispatch.dispatcher import receiver
+from xblock.fields import Scope
 
 from xmodule.modulestore.django import SignalHandler
 
 
 @receiver(SignalHandler.course_published)
-def trigger_update_xblocks_cache_task(sender, course_key, **kwargs):  # pylint: disable=invalid-name,unused-argument
+def trigger_update_xblocks_cache_task(sender, course_key, structure_diff=None, **kwargs):  # pylint: disable=invalid-name,unused-argument
     """
     Trigger update_xblocks_cache() when course_published signal is fired.
     """
+    # XBlockCache only stores display names (settings) and paths (children),
+    # so publishes which only changed the content of blocks can be ignored.
+    if structure_diff is not None and not structure_diff.includes_changes([Scope.settings, Scope.children]):
+        return
+
     tasks = import_module('openedx.core.djangoapps.bookmarks.tasks')  # Importing tasks early causes issues in tests.
 
     # Note: The countdown=0 kwarg is set to ensure the method below does not attempt to access the course
@@ -2,7 +2,7 @@
 Tasks for bookmarks.
 """
 import logging
-from django.db import transaction
+from django.db import IntegrityError, transaction
 
 from celery.task import task  # pylint: disable=import-error,no-name-in-module
 from opaque_keys.edx.keys import CourseKey
@@ -126,18 +126,38 @@ def _update_xblocks_cache(course_key):
             if block_data:
                 update_block_cache_if_needed(block_cache, block_data)
 
+    if not blocks_data:
+        return
+
+    new_block_caches = []
     for block_data in blocks_data.values():
+        log.info(u'Creating XBlockCache with usage_key: %s', unicode(block_data['usage_key']))
+        new_block_caches.append(XBlockCache(
+            usage_key=block_data['usage_key'],
+            course_key=course_key,
+            display_name=block_data['display_name'],
+            paths=_paths_from_data(block_data['paths']),
+        ))
+
+    try:
         with transaction.atomic():
-            paths = _paths_from_data(block_data['paths'])
-            log.info(u'Creating XBlockCache with usage_key: %s', unicode(block_data['usage_key']))
-            block_cache, created = XBlockCache.objects.get_or_create(usage_key=block_data['usage_key'], defaults={
-                'course_key': course_key,
-                'display_name': block_data['display_name'],
-                'paths': paths,
-            })
-
-            if not created:
-                update_block_cache_if_needed(block_cache, block_data)
+            XBlockCache.objects.bulk_create(new_block_caches)
+    except IntegrityError:
+        # Another update of the course created some of the rows meanwhile, so
+        # fall back to creating or updating the rows one at a time.
+        for block_data in blocks_data.values():
+            with transaction.atomic():
+                block_cache, created = XBlockCache.objects.get_or_create(
+                    usage_key=block_data['usage_key'],
+                    defaults={
+                        'course_key': course_key,
+                        'display_name': block_data['display_name'],
+                        'paths': _paths_from_data(block_data['paths']),
+                    }
+                )
+
+                if not created:
+                    update_block_cache_if_needed(block_cache, block_data)
 
 
 @task(name=u'openedx.core.djangoapps.bookmarks.tasks.update_xblock_cache')
@@ -384,6 +384,38 @@ class BookmarkModelTests(BookmarksTestsBase):
             path = Bookmark.get_path(block.location)
             self.assertEqual(len(path), depth - 2)
 
+    def test_get_paths(self):
+        missing_usage_key = self.course.id.make_usage_key('html', 'interactive')
+        usage_keys = [self.vertical_1.location, self.html_1.location, missing_usage_key]
+
+        paths = Bookmark.get_paths(usage_keys)
+        self.assertEqual(paths[self.vertical_1.location], Bookmark.get_path(self.vertical_1.location))
+        self.assertEqual(paths[self.html_1.location], Bookmark.get_path(self.html_1.location))
+        self.assertEqual(paths[missing_usage_key], [])
+
+    def test_update_paths(self):
+        bookmarks = [
+            Bookmark.create(self.get_bookmark_data(block))[0] for block in (self.vertical_1, self.html_1)
+        ]
+
+        modification_datetime = datetime.datetime.now(pytz.utc) + datetime.timedelta(seconds=30)
+        with freeze_time(modification_datetime):
+            for bookmark in bookmarks:
+                bookmark.xblock_cache.paths = []
+                bookmark.xblock_cache.save()
+
+        bookmark_ids = [bookmark.id for bookmark in bookmarks]
+        bookmarks = list(Bookmark.objects.filter(id__in=bookmark_ids).select_related('xblock_cache'))
+        with freeze_time(modification_datetime + datetime.timedelta(seconds=1)):
+            Bookmark.update_paths(bookmarks)
+
+        for bookmark in bookmarks:
+            self.assertEqual(bookmark.path, Bookmark.get_path(bookmark.usage_key))
+
+        # Up to date bookmarks are left alone.
+        with self.assertNumQueries(0):
+            Bookmark.update_paths(bookmarks)
+
     def test_get_path_in_case_of_exceptions(self):
 
         user = UserFactory.create()
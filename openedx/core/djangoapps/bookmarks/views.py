@@ -31,6 +31,7 @@ from lms.djangoapps.lms_xblock.runtime import unquote_slashes
 from openedx.core.lib.api.paginators import DefaultPagination
 
 from . import DEFAULT_FIELDS, OPTIONAL_FIELDS, api
+from .models import Bookmark
 from .serializers import BookmarkSerializer
 
 log = logging.getLogger(__name__)
@@ -201,6 +202,10 @@ class BookmarksListView(ListCreateAPIView, BookmarksViewMixin):
         """ Override GenericAPIView.paginate_queryset for the purpose of eventing """
         page = super(BookmarksListView, self).paginate_queryset(queryset)
 
+        if page and 'path' in self.fields_to_return(self.request.query_params):
+            # Resolve the stale paths of the whole page at once.
+            Bookmark.update_paths(page)
+
         course_id = self.request.query_params.get('course_id')
         if course_id:
             try:
@@ -0,0 +1,152 @@
+"""
+An index of the ancestors of every block in a published course, built from
+the collected course block structure, so that the courseware path to a block
+(as returned by path_to_location) can be found without walking up the
+modulestore one parent at a time.
+
+The index is rebuilt asynchronously whenever the course is published, and
+lazily by the first lookup which doesn't find it in the cache. For blocks
+which aren't in it (e.g. orphans) and for courses which don't exist, the
+lookups fall back to path_to_location, so that the same errors are raised.
+"""
+from django.core.cache import cache
+
+from openedx.core.lib.cache_utils import zpickle, zunpickle
+from xmodule.modulestore.django import modulestore
+from xmodule.modulestore.exceptions import ItemNotFoundError
+from xmodule.modulestore.search import location_from_path, path_to_location, paths_to_locations
+
+from .api import get_course_in_cache
+
+# Set the timeout value for the cache to 1 day as a fail-safe
+# in case the signal to invalidate the cache doesn't come through.
+ANCESTOR_INDEX_TIMEOUT = 60 * 60 * 24
+
+
+def _ancestor_index_cache_key(course_key):
+    """
+    Returns the key under which the ancestor index of the course is cached.
+    """
+    return u'block_structure.ancestor_index.{}'.format(course_key)
+
+
+def build_ancestor_index(block_structure):
+    """
+    Returns a dict mapping the usage key of every block in the given block
+    structure to a (parent usage key, 1-based position among the parent's
+    children) tuple. The root block is mapped to (None, None).
+
+    In case of DAGs, the first parent of a block is the one used.
+    """
+    ancestor_index = {}
+    for block_key in block_structure.topological_traversal():
+        parents = block_structure.get_parents(block_key)
+        if parents:
+            parent_key = parents[0]
+            ancestor_index[block_key] = (parent_key, block_structure.get_children(parent_key).index(block_key) + 1)
+        else:
+            ancestor_index[block_key] = (None, None)
+    return ancestor_index
+
+
+def update_ancestor_index(course_key):
+    """
+    Builds the ancestor index of the given course from its collected block
+    structure, stores it in the cache and returns it.
+    """
+    ancestor_index = build_ancestor_index(get_course_in_cache(course_key))
+    cache.set(_ancestor_index_cache_key(course_key), zpickle(ancestor_index), ANCESTOR_INDEX_TIMEOUT)
+    return ancestor_index
+
+
+def clear_ancestor_index(course_key):
+    """
+    Removes the ancestor index of the given course from the cache.
+    """
+    cache.delete(_ancestor_index_cache_key(course_key))
+
+
+def get_ancestor_index(course_key):
+    """
+    Returns the ancestor index of the given course, building and caching it
+    if it isn't in the cache yet, or None if the course doesn't exist.
+    """
+    zp_ancestor_index = cache.get(_ancestor_index_cache_key(course_key))
+    if zp_ancestor_index is None:
+        try:
+            return update_ancestor_index(course_key)
+        except ItemNotFoundError:
+            return None
+    return zunpickle(zp_ancestor_index)
+
+
+def _path_from_index(ancestor_index, usage_key):
+    """
+    Returns the list of usage keys from the course down to the given block,
+    or None if the block isn't in the index.
+    """
+    if usage_key not in ancestor_index:
+        return None
+    path = []
+    while usage_key is not None:
+        path.append(usage_key)
+        usage_key = ancestor_index[usage_key][0]
+    path.reverse()
+    return path
+
+
+def _location_from_index(ancestor_index, usage_key, full_path):
+    """
+    Returns the result of path_to_location for the given block using the
+    ancestor index, or None if there's no index or the block isn't in it.
+    """
+    if ancestor_index is None:
+        return None
+    path = _path_from_index(ancestor_index, usage_key)
+    if path is None or full_path:
+        return path
+    return location_from_path(path, lambda parent, child: ancestor_index[child][1])
+
+
+def get_path_to_location(usage_key, full_path=False):
+    """
+    Returns the same result as path_to_location, looking the block up in the
+    ancestor index of its course.
+
+    Raises:
+        ItemNotFoundError if the location doesn't exist.
+        NoPathToItem if the location exists, but isn't accessible via
+            a chapter/section path in the course.
+    """
+    location = _location_from_index(get_ancestor_index(usage_key.course_key), usage_key, full_path)
+    if location is None:
+        return path_to_location(modulestore(), usage_key, full_path)
+    return location
+
+
+def get_paths_to_locations(usage_keys, full_path=False):
+    """
+    Bulk version of get_path_to_location, which reads the ancestor index of
+    each course only once.
+
+    Returns:
+        a dict mapping each of the given usage keys to its result from
+        get_path_to_location. Usage keys which don't exist or have no path
+        are left out.
+    """
+    locations = {}
+    ancestor_indexes = {}
+    missing_usage_keys = []
+    for usage_key in usage_keys:
+        course_key = usage_key.course_key
+        if course_key not in ancestor_indexes:
+            ancestor_indexes[course_key] = get_ancestor_index(course_key)
+        location = _location_from_index(ancestor_indexes[course_key], usage_key, full_path)
+        if location is None:
+            missing_usage_keys.append(usage_key)
+        else:
+            locations[usage_key] = location
+
+    if missing_usage_keys:
+        locations.update(paths_to_locations(modulestore(), missing_usage_keys, full_path))
+    return locations
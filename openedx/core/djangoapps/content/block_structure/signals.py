@@ -6,16 +6,22 @@ from django.dispatch.dispatcher import receiver
 from xmodule.modulestore.django import SignalHandler
 
 from .api import clear_course_from_cache
+from .paths import clear_ancestor_index
 from .tasks import update_course_in_cache
 
 
 @receiver(SignalHandler.course_published)
-def _listen_for_course_publish(sender, course_key, **kwargs):  # pylint: disable=unused-argument
+def _listen_for_course_publish(sender, course_key, structure_diff=None, **kwargs):  # pylint: disable=unused-argument
     """
     Catches the signal that a course has been published in the module
     store and creates/updates the corresponding cache entry.
     """
+    if structure_diff is not None and not structure_diff:
+        # Nothing changed in the published course.
+        return
+
     clear_course_from_cache(course_key)
+    clear_ancestor_index(course_key)
 
     # The countdown=0 kwarg ensures the call occurs after the signal emitter
     # has finished all operations.
@@ -30,3 +36,4 @@ def _listen_for_course_delete(sender, course_key, **kwargs):  # pylint: disable=
     exists.
     """
     clear_course_from_cache(course_key)
+    clear_ancestor_index(course_key)
@@ -5,7 +5,7 @@ import logging
 from celery.task import task
 from opaque_keys.edx.keys import CourseKey
 
-from openedx.core.djangoapps.content.block_structure import api
+from openedx.core.djangoapps.content.block_structure import api, paths
 
 log = logging.getLogger('edx.celery.task')
 
@@ -13,7 +13,9 @@ log = logging.getLogger('edx.celery.task')
 @task
 def update_course_in_cache(course_key):
     """
-    Updates the course blocks (in the database) for the specified course.
+    Updates the course blocks (in the database) and the ancestor index
+    for the specified course.
     """
     course_key = CourseKey.from_string(course_key)
     api.update_course_in_cache(course_key)
+    paths.update_ancestor_index(course_key)
@@ -0,0 +1,78 @@
+"""
+Unit tests for the ancestor index of courses.
+"""
+from xmodule.modulestore.django import modulestore
+from xmodule.modulestore.exceptions import ItemNotFoundError
+from xmodule.modulestore.search import path_to_location
+from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
+from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory, check_mongo_calls
+
+from ..paths import (
+    clear_ancestor_index,
+    get_ancestor_index,
+    get_path_to_location,
+    get_paths_to_locations,
+    update_ancestor_index,
+)
+
+
+class AncestorIndexTest(ModuleStoreTestCase):
+    """
+    Tests for looking up the path to blocks in the ancestor index.
+    """
+    def setUp(self):
+        super(AncestorIndexTest, self).setUp()
+        self.course = CourseFactory.create()
+        self.chapter = ItemFactory.create(category='chapter', parent_location=self.course.location)
+        self.sequential = ItemFactory.create(category='sequential', parent_location=self.chapter.location)
+        self.vertical_1 = ItemFactory.create(category='vertical', parent_location=self.sequential.location)
+        self.vertical_2 = ItemFactory.create(category='vertical', parent_location=self.sequential.location)
+        self.html = ItemFactory.create(category='html', parent_location=self.vertical_2.location)
+        update_ancestor_index(self.course.id)
+
+    def test_matches_path_to_location(self):
+        for block in (self.course, self.chapter, self.sequential, self.vertical_2, self.html):
+            self.assertEqual(
+                get_path_to_location(block.location),
+                path_to_location(modulestore(), block.location),
+            )
+            self.assertEqual(
+                get_path_to_location(block.location, full_path=True),
+                path_to_location(modulestore(), block.location, full_path=True),
+            )
+
+    def test_lookup_without_queries(self):
+        with check_mongo_calls(0):
+            __, __, __, __, position, __ = get_path_to_location(self.html.location)
+        self.assertEqual(position, '2')
+
+    def test_new_block(self):
+        other_html = ItemFactory.create(category='html', parent_location=self.vertical_1.location)
+        self.assertEqual(
+            get_path_to_location(other_html.location),
+            path_to_location(modulestore(), other_html.location),
+        )
+
+    def test_not_in_cache(self):
+        clear_ancestor_index(self.course.id)
+        self.assertEqual(
+            get_path_to_location(self.html.location),
+            path_to_location(modulestore(), self.html.location),
+        )
+        # The lookup rebuilt the index, so the next one doesn't query the modulestore.
+        with check_mongo_calls(0):
+            get_path_to_location(self.html.location)
+
+    def test_missing_course(self):
+        missing_course_key = self.course.id.replace(run='missing')
+        self.assertIsNone(get_ancestor_index(missing_course_key))
+        with self.assertRaises(ItemNotFoundError):
+            get_path_to_location(missing_course_key.make_usage_key('html', 'missing'))
+
+    def test_bulk_lookup(self):
+        missing_location = self.course.id.make_usage_key('html', 'missing')
+        locations = get_paths_to_locations([self.html.location, self.vertical_1.location, missing_location])
+        self.assertEqual(locations, {
+            self.html.location: path_to_location(modulestore(), self.html.location),
+            self.vertical_1.location: path_to_location(modulestore(), self.vertical_1.location),
+        })
@@ -8,11 +8,18 @@ from xmodule.modulestore.django import SignalHandler
 
 
 @receiver(SignalHandler.course_published)
-def _listen_for_course_publish(sender, course_key, **kwargs):  # pylint: disable=unused-argument
+def _listen_for_course_publish(sender, course_key, structure_diff=None, **kwargs):  # pylint: disable=unused-argument
     """
     Catches the signal that a course has been published in Studio and
     updates the corresponding CourseOverview cache entry.
     """
+    if structure_diff is not None and not any(
+            structure_diff.includes_block_type(block_type) for block_type in ('course', 'about')
+    ):
+        # Course overviews only hold data of the course block and its about
+        # blocks (short description, effort), which are published on their own.
+        return
+
     CourseOverview.objects.filter(id=course_key).delete()
     CourseOverview.load_from_module_store(course_key)
 
@@ -291,6 +291,22 @@ class CourseOverviewTestCase(ModuleStoreTestCase):
                 self.store.delete_course(course.id, ModuleStoreEnum.UserID.test)
                 CourseOverview.get_from_id(course.id)
 
+    @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
+    def test_course_overview_about_invalidation(self, modulestore_type):
+        """
+        Tests that publishing an about block of a course, without changing
+        the course block, updates the about data of its course_overview.
+        """
+        with self.store.default_store(modulestore_type):
+            course = CourseFactory.create(default_store=modulestore_type)
+            CourseDetails.update_about_item(course, 'short_description', u'Old description', self.user.id)
+            self.assertEqual(CourseOverview.get_from_id(course.id).short_description, u'Old description')
+
+            with self.store.branch_setting(ModuleStoreEnum.Branch.draft_preferred):
+                CourseDetails.update_about_item(course, 'short_description', u'New description', self.user.id)
+
+            self.assertEqual(CourseOverview.get_from_id(course.id).short_description, u'New description')
+
     @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
     def test_course_overview_caching(self, modulestore_type):
         """
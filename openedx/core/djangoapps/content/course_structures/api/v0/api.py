@@ -94,7 +94,8 @@ def course_structure(course_key, block_types=None):
                     if block_data['block_type'] in block_types:
                         required_blocks[usage_id] = block_data
 
-                structure['blocks'] = required_blocks
+                # The structure is shared, so it is copied rather than modified.
+                structure = dict(structure, blocks=required_blocks)
 
             data = CourseStructureSerializer(structure).data
             cache.set(cache_key, data, None)  # pylint: disable=maybe-no-member
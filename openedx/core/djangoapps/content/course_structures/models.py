@@ -1,8 +1,10 @@
 """
 Django ORM model specifications for the Course Structures sub-application
 """
+import hashlib
 import json
 import logging
+import threading
 
 from collections import OrderedDict
 from model_utils.models import TimeStampedModel
@@ -13,6 +15,16 @@ from xmodule_django.models import CourseKeyField, UsageKey
 
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
+# Maximum number of values kept in the process-local cache of decoded values.
+DECODED_CACHE_MAX_ENTRIES = 300
+
+# Process-local cache of the values decoded from the JSON fields of course
+# structures, so that each version of a row is only decoded once per process.
+# Maps (course id, value name) to (digest of the JSON, decoded value) tuples,
+# least recently used first.
+_decoded_cache = OrderedDict()  # pylint: disable=invalid-name
+_decoded_cache_lock = threading.Lock()  # pylint: disable=invalid-name
+
 
 class CourseStructure(TimeStampedModel):
     """
@@ -38,33 +50,82 @@ class CourseStructure(TimeStampedModel):
     def structure(self):
         """
         Deserializes a course structure JSON object
+
+        The result is shared within the process and must not be modified.
         """
-        if self.structure_json:
-            return json.loads(self.structure_json)
-        return None
+        return self._get_decoded('structure', 'structure_json', json.loads)
 
     @property
     def ordered_blocks(self):
         """
         Return the blocks in the order with which they're seen in the courseware. Parents are ordered before children.
+
+        The result is shared within the process and must not be modified.
         """
-        if self.structure:
-            ordered_blocks = OrderedDict()
-            self._traverse_tree(self.structure['root'], self.structure['blocks'], ordered_blocks)
-            return ordered_blocks
+        return self._get_decoded('ordered_blocks', 'structure_json', self._order_blocks)
 
     @property
     def discussion_id_map(self):
         """
         Return a mapping of discussion ids to usage keys of the corresponding discussion modules.
+
+        The result is shared within the process and must not be modified.
+        """
+        return self._get_decoded('discussion_id_map', 'discussion_id_map_json', self._decode_discussion_id_map)
+
+    def _get_decoded(self, name, field_name, decode):
+        """
+        Returns the value of the given name decoded from the JSON of the given
+        field with the decode function, or None if the field is empty.
+
+        Decoded values are cached in the process by the digest of the JSON they
+        were decoded from, so they are decoded again once the field changes.
+        """
+        json_value = getattr(self, field_name)
+        if not json_value:
+            return None
+
+        if isinstance(json_value, unicode):
+            json_value = json_value.encode('utf8')
+        digest = hashlib.md5(json_value).hexdigest()
+        cache_key = (unicode(self.course_id), name)
+
+        with _decoded_cache_lock:
+            cached_digest, value = _decoded_cache.pop(cache_key, (None, None))
+            if cached_digest == digest:
+                _decoded_cache[cache_key] = (digest, value)
+                return value
+
+        value = decode(json_value)
+        with _decoded_cache_lock:
+            _decoded_cache[cache_key] = (digest, value)
+            while len(_decoded_cache) > DECODED_CACHE_MAX_ENTRIES:
+                _decoded_cache.popitem(last=False)
+        return value
+
+    def _order_blocks(self, structure_json):
+        """
+        Decodes the structure JSON and returns its blocks in the order with
+        which they're seen in the courseware.
+        """
+        # Decoded separately from self.structure, as _traverse_tree adds
+        # the parents to the blocks.
+        structure = json.loads(structure_json)
+        if not structure:
+            return None
+        ordered_blocks = OrderedDict()
+        self._traverse_tree(structure['root'], structure['blocks'], ordered_blocks)
+        return ordered_blocks
+
+    def _decode_discussion_id_map(self, discussion_id_map_json):
+        """
+        Decodes the discussion id map JSON into a mapping of discussion ids to usage keys.
         """
-        if self.discussion_id_map_json:
-            result = json.loads(self.discussion_id_map_json)
-            for discussion_id in result:
-                # Usage key strings might not include the course run, so we add it back in with map_into_course
-                result[discussion_id] = UsageKey.from_string(result[discussion_id]).map_into_course(self.course_id)
-            return result
-        return None
+        result = json.loads(discussion_id_map_json)
+        for discussion_id in result:
+            # Usage key strings might not include the course run, so we add it back in with map_into_course
+            result[discussion_id] = UsageKey.from_string(result[discussion_id]).map_into_course(self.course_id)
+        return result
 
     def _traverse_tree(self, block, unordered_structure, ordered_blocks, parent=None):
         """
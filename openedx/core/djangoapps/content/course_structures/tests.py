@@ -2,6 +2,9 @@
 Course Structure Content sub-application test cases
 """
 import json
+from uuid import uuid4
+
+from mock import patch
 from nose.plugins.attrib import attr
 
 from xmodule_django.models import UsageKey
@@ -148,6 +151,36 @@ class CourseStructureTaskTests(ModuleStoreTestCase):
 
         self.assertEqual(retrieved_course_structure.ordered_blocks.keys(), in_order_blocks)
 
+    def test_structure_decoded_once_per_version(self):
+        """
+        CourseStructure.structure should only decode each version of the structure JSON once.
+        """
+        structure = {
+            'root': 'a/b/c',
+            'blocks': {
+                'a/b/c': {
+                    'id': 'a/b/c',
+                    'display_name': uuid4().hex,
+                    'children': []
+                }
+            }
+        }
+        CourseStructure.objects.create(course_id=self.course.id, structure_json=json.dumps(structure))
+
+        with patch(
+            'openedx.core.djangoapps.content.course_structures.models.json.loads', wraps=json.loads
+        ) as mock_loads:
+            for __ in range(2):
+                self.assertDictEqual(CourseStructure.objects.get(course_id=self.course.id).structure, structure)
+            self.assertEqual(mock_loads.call_count, 1)
+
+            structure['blocks']['a/b/c']['display_name'] = uuid4().hex
+            course_structure = CourseStructure.objects.get(course_id=self.course.id)
+            course_structure.structure_json = json.dumps(structure)
+            course_structure.save()
+            self.assertDictEqual(CourseStructure.objects.get(course_id=self.course.id).structure, structure)
+            self.assertEqual(mock_loads.call_count, 2)
+
     def test_block_with_missing_fields(self):
         """
         The generator should continue to operate on blocks/XModule that do not have graded or format fields.
@@ -5,11 +5,13 @@ from django.utils.translation import ugettext as _
 from django.db import transaction, IntegrityError
 import datetime
 from pytz import UTC
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.conf import settings
 from django.core.validators import validate_email, validate_slug, ValidationError
 from openedx.core.djangoapps.user_api.preferences.api import update_user_preferences
 from openedx.core.djangoapps.user_api.errors import PreferenceValidationError
+from openedx.core.djangoapps.user_api.models import PREFERENCE_VALUES_ATTR, UserPreference, user_bundle_cache_key
 
 from student.models import User, UserProfile, Registration
 from student import views as student_views
@@ -26,7 +28,7 @@ from ..forms import PasswordResetFormNoActive
 from ..helpers import intercept_errors
 
 from . import (
-    EMAIL_MIN_LENGTH, EMAIL_MAX_LENGTH, PASSWORD_MIN_LENGTH, PASSWORD_MAX_LENGTH,
+    ACCOUNT_VISIBILITY_PREF_KEY, EMAIL_MIN_LENGTH, EMAIL_MAX_LENGTH, PASSWORD_MIN_LENGTH, PASSWORD_MAX_LENGTH,
     USERNAME_MIN_LENGTH, USERNAME_MAX_LENGTH
 )
 from .serializers import (
@@ -72,7 +74,7 @@ def get_account_settings(request, usernames=None, configuration=None, view=None)
     requesting_user = request.user
     usernames = usernames or [requesting_user.username]
 
-    requested_users = User.objects.select_related('profile').filter(username__in=usernames)
+    requested_users = get_user_bundles(usernames)
     if not requested_users:
         raise UserNotFound()
 
@@ -93,6 +95,57 @@ def get_account_settings(request, usernames=None, configuration=None, view=None)
     return serialized_users
 
 
+def get_user_bundles(usernames, preference_keys=(ACCOUNT_VISIBILITY_PREF_KEY,)):
+    """Returns the users with the given usernames, with the data needed to serialize their accounts.
+
+    The profile, language proficiencies and given preferences of the users are
+    loaded along with them, with a fixed number of queries whatever the number
+    of users, so that serializing the users and reading those preferences with
+    UserPreference.get_value does not query them again. The profile image
+    metadata is part of the profile.
+
+    If settings.USER_BUNDLE_CACHE_TIMEOUT is set, the bundles are also cached
+    for that many seconds. They are invalidated when the user, profile, language
+    proficiencies or preferences of the user are saved or deleted.
+
+    Args:
+        usernames (list): The usernames of the users.
+        preference_keys (tuple): The keys of the preferences to load.
+
+    Returns:
+        A list of the User objects of the usernames which exist, in no particular order.
+    """
+    cache_timeout = getattr(settings, 'USER_BUNDLE_CACHE_TIMEOUT', 0)
+    users = []
+    if cache_timeout:
+        cached_users = cache.get_many([user_bundle_cache_key(username) for username in usernames])
+        users = [
+            user for user in cached_users.itervalues()
+            if all(key in getattr(user, PREFERENCE_VALUES_ATTR) for key in preference_keys)
+        ]
+        usernames = set(usernames) - set(user.username for user in users)
+        if not usernames:
+            return users
+
+    loaded_users = list(
+        User.objects.select_related('profile').prefetch_related('profile__language_proficiencies').filter(
+            username__in=usernames
+        )
+    )
+    preferences = {(user.id, key): None for user in loaded_users for key in preference_keys}
+    if loaded_users and preference_keys:
+        preferences.update(
+            ((preference.user_id, preference.key), preference.value)
+            for preference in UserPreference.objects.filter(user__in=loaded_users, key__in=preference_keys)
+        )
+    for user in loaded_users:
+        setattr(user, PREFERENCE_VALUES_ATTR, {key: preferences[(user.id, key)] for key in preference_keys})
+
+    if cache_timeout:
+        cache.set_many({user_bundle_cache_key(user.username): user for user in loaded_users}, cache_timeout)
+    return users + loaded_users
+
+
 @intercept_errors(UserAPIInternalError, ignore_errors=[UserAPIRequestError])
 def update_account_settings(requesting_user, update, username=None):
     """Update user account information.
@@ -17,16 +17,23 @@ from django.conf import settings
 from django.contrib.auth.models import User
 from django.core import mail
 from django.test.client import RequestFactory
+from django.test.utils import override_settings
 from student.models import PendingEmailChange
 from student.tests.tests import UserSettingsEventTestMixin
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
 from ...errors import (
     UserNotFound, UserNotAuthorized, AccountUpdateError, AccountValidationError,
     AccountUserAlreadyExists, AccountUsernameInvalid, AccountEmailInvalid, AccountPasswordInvalid, AccountRequestError
 )
 from ..api import (
-    get_account_settings, update_account_settings, create_account, activate_account, request_password_change
+    get_account_settings, update_account_settings, create_account, activate_account, request_password_change,
+    get_user_bundles
 )
-from .. import USERNAME_MAX_LENGTH, EMAIL_MAX_LENGTH, PASSWORD_MAX_LENGTH, PRIVATE_VISIBILITY
+from .. import (
+    USERNAME_MAX_LENGTH, EMAIL_MAX_LENGTH, PASSWORD_MAX_LENGTH, PRIVATE_VISIBILITY, ACCOUNT_VISIBILITY_PREF_KEY
+)
+from ...models import UserPreference
+from ...preferences.api import set_user_preference
 
 
 def mock_render_to_string(template_name, context):
@@ -66,6 +73,23 @@ class TestAccountApi(UserSettingsEventTestMixin, TestCase):
         account_settings = get_account_settings(self.default_request, usernames=[self.different_user.username])[0]
         self.assertEqual(self.different_user.username, account_settings["username"])
 
+    def test_get_user_bundles(self):
+        set_user_preference(self.user, ACCOUNT_VISIBILITY_PREF_KEY, PRIVATE_VISIBILITY)
+        usernames = [self.user.username, self.different_user.username, self.staff_user.username, 'does_not_exist']
+
+        with self.assertNumQueries(3):
+            users = {user.username: user for user in get_user_bundles(usernames)}
+        self.assertEqual(set(users), set(usernames[:3]))
+
+        with self.assertNumQueries(0):
+            for user in users.values():
+                self.assertEqual(list(user.profile.language_proficiencies.all()), [])
+            self.assertEqual(
+                UserPreference.get_value(users[self.user.username], ACCOUNT_VISIBILITY_PREF_KEY),
+                PRIVATE_VISIBILITY,
+            )
+            self.assertIsNone(UserPreference.get_value(users[self.different_user.username], ACCOUNT_VISIBILITY_PREF_KEY))
+
     def test_get_configuration_provided(self):
         """Test the difference in behavior when a configuration is supplied to get_account_settings."""
         config = {
@@ -232,6 +256,46 @@ class TestAccountApi(UserSettingsEventTestMixin, TestCase):
         verify_event_emitted([], [{"code": "en"}, {"code": "fr"}])
 
 
+@attr('shard_2')
+@override_settings(USER_BUNDLE_CACHE_TIMEOUT=60)
+class UserBundleCacheTest(CacheIsolationTestCase):
+    """
+    Tests for the caching of the bundles of get_user_bundles.
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super(UserBundleCacheTest, self).setUp()
+        self.user = UserFactory.create()
+
+    def test_cached(self):
+        get_user_bundles([self.user.username])
+        with self.assertNumQueries(0):
+            user = get_user_bundles([self.user.username])[0]
+        self.assertIsNone(UserPreference.get_value(user, ACCOUNT_VISIBILITY_PREF_KEY))
+
+    def test_invalidated_on_change(self):
+        get_user_bundles([self.user.username])
+
+        set_user_preference(self.user, ACCOUNT_VISIBILITY_PREF_KEY, PRIVATE_VISIBILITY)
+        user = get_user_bundles([self.user.username])[0]
+        self.assertEqual(UserPreference.get_value(user, ACCOUNT_VISIBILITY_PREF_KEY), PRIVATE_VISIBILITY)
+
+        self.user.profile.name = u"New Name"
+        self.user.profile.save()
+        user = get_user_bundles([self.user.username])[0]
+        self.assertEqual(user.profile.name, u"New Name")
+
+    def test_invalidated_on_username_change(self):
+        old_username = self.user.username
+        get_user_bundles([old_username])
+
+        self.user.username = u"new_username"
+        self.user.save()
+        self.assertEqual(get_user_bundles([old_username]), [])
+        self.assertEqual(get_user_bundles([u"new_username"])[0].id, self.user.id)
+
+
 @attr('shard_2')
 @patch('openedx.core.djangoapps.user_api.accounts.image_helpers._PROFILE_IMAGE_SIZES', [50, 10])
 @patch.dict(
@@ -1,7 +1,9 @@
 """
 Django ORM model specifications for the User API application
 """
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.validators import RegexValidator
 from django.db import models
 from django.db.models.signals import post_delete, pre_save, post_save
@@ -17,7 +19,15 @@ from xmodule_django.models import CourseKeyField
 # but currently the rest of the system assumes that "student" defines
 # certain models.  For now we will leave the models in "student" and
 # create an alias in "user_api".
-from student.models import UserProfile, Registration, PendingEmailChange  # pylint: disable=unused-import
+from student.models import (  # pylint: disable=unused-import
+    UserProfile, Registration, PendingEmailChange, LanguageProficiency
+)
+
+
+# Attribute of User instances holding a dict of the values of some of their
+# preferences, None for those which are not set, which UserPreference.get_value
+# returns instead of querying them.
+PREFERENCE_VALUES_ATTR = '_preference_values'
 
 
 class UserPreference(models.Model):
@@ -46,6 +56,11 @@ class UserPreference(models.Model):
         Returns:
             The user preference value, or None if one is not set.
         """
+        # Preferences already loaded with the user, e.g. by get_user_bundles.
+        preference_values = getattr(user, PREFERENCE_VALUES_ATTR, {})
+        if preference_key in preference_values:
+            return preference_values[preference_key]
+
         try:
             user_preference = cls.objects.get(user=user, key=preference_key)
             return user_preference.value
@@ -86,6 +101,76 @@ def post_delete_callback(sender, **kwargs):
     )
 
 
+def user_bundle_cache_key(username):
+    """
+    Returns the cache key of the bundle of the user with the given username
+    cached by get_user_bundles.
+    """
+    return u"user_api.bundle.{}".format(username)
+
+
+def _invalidate_user_bundle(user_id):
+    """
+    Removes the cached bundle of the user, if bundles are cached.
+    """
+    if getattr(settings, 'USER_BUNDLE_CACHE_TIMEOUT', 0):
+        for username in User.objects.filter(id=user_id).values_list('username', flat=True):
+            cache.delete(user_bundle_cache_key(username))
+
+
+@receiver(pre_save, sender=User)
+def record_user_bundle_username(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Records the previous username of a user whose username changes, under
+    which their bundle may still be cached.
+    """
+    if getattr(settings, 'USER_BUNDLE_CACHE_TIMEOUT', 0) and instance.pk:
+        # Already set by the pre_save receiver of the student app, when it runs first.
+        changed_fields = getattr(instance, '_changed_fields', None)
+        if changed_fields is None:
+            changed_fields = get_changed_fields_dict(instance, sender)
+        instance._old_bundle_username = changed_fields.get('username')  # pylint: disable=protected-access
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_bundle_on_user_change(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidates the cached bundle of a changed user, under their current and
+    previous usernames.
+    """
+    if getattr(settings, 'USER_BUNDLE_CACHE_TIMEOUT', 0):
+        usernames = [instance.username]
+        old_username = getattr(instance, '_old_bundle_username', None)
+        if old_username:
+            usernames.append(old_username)
+            instance._old_bundle_username = None  # pylint: disable=protected-access
+        cache.delete_many([user_bundle_cache_key(username) for username in usernames])
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+@receiver(post_save, sender=UserPreference)
+@receiver(post_delete, sender=UserPreference)
+def invalidate_user_bundle_on_change(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidates the cached bundle of the user of a changed profile or preference.
+    """
+    _invalidate_user_bundle(instance.user_id)
+
+
+@receiver(post_save, sender=LanguageProficiency)
+@receiver(post_delete, sender=LanguageProficiency)
+def invalidate_user_bundle_on_language_change(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidates the cached bundle of the user of a changed language proficiency.
+    """
+    if getattr(settings, 'USER_BUNDLE_CACHE_TIMEOUT', 0):
+        _invalidate_user_bundle(
+            UserProfile.objects.filter(id=instance.user_profile_id).values_list('user_id', flat=True).first()
+        )
+
+
 class UserCourseTag(models.Model):
     """
     Per-course user tags, to be used by various things that want to store tags about
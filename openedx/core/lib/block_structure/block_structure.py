@@ -400,11 +400,17 @@ class BlockStructureBlockData(BlockStructure):
     # update this value whenever the data structure changes. Dependent storage
     # layers can then use this value when serializing/deserializing block
     # structures, and invalidating any previously cached/stored data.
-    VERSION = 1
+    VERSION = 2
 
     def __init__(self, root_block_usage_key):
         super(BlockStructureBlockData, self).__init__(root_block_usage_key)
 
+        # Identifier of the collected data of the structure, renewed each
+        # time the structure is collected and stored, so that results of
+        # transforms can be cached against it.
+        # str or None
+        self.collected_version = None
+
         # Map of a block's usage key to its collected data, including
         # its xBlock fields and block-specific transformer data.
         # dict {UsageKey: BlockData}
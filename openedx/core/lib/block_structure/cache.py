@@ -3,6 +3,7 @@ Module for the Cache class for BlockStructure objects.
 """
 # pylint: disable=protected-access
 from logging import getLogger
+from uuid import uuid4
 
 from openedx.core.lib.cache_utils import zpickle, zunpickle
 
@@ -32,16 +33,19 @@ class BlockStructureCache(object):
 
         The key in the cache is 'root.key.<root_block_usage_key>'.
         The data stored in the cache includes the structure's
-        block relations, transformer data, and block data.
+        block relations, transformer data, and block data, along with
+        a new collected_version which is also set on the block structure.
 
         Arguments:
             block_structure (BlockStructure) - The block structure
                 that is to be serialized to the given cache.
         """
+        block_structure.collected_version = uuid4().hex
         data_to_cache = (
             block_structure._block_relations,
             block_structure.transformer_data,
             block_structure._block_data_map,
+            block_structure.collected_version,
         )
         zp_data_to_cache = zpickle(data_to_cache)
 
@@ -96,11 +100,12 @@ class BlockStructureCache(object):
             )
 
         # Deserialize and construct the block structure.
-        block_relations, transformer_data, block_data_map = zunpickle(zp_data_from_cache)
+        block_relations, transformer_data, block_data_map, collected_version = zunpickle(zp_data_from_cache)
         block_structure = BlockStructureModulestoreData(root_block_usage_key)
         block_structure._block_relations = block_relations
         block_structure.transformer_data = transformer_data
         block_structure._block_data_map = block_data_map
+        block_structure.collected_version = collected_version
 
         return block_structure
 
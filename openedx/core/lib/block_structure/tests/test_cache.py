@@ -41,6 +41,8 @@ class TestBlockStructureCache(ChildrenMapTestMixin, TestCase):
         cached_value = self.block_structure_cache.get(self.block_structure.root_block_usage_key)
         self.assertIsNotNone(cached_value)
         self.assert_block_structure(cached_value, self.children_map)
+        self.assertIsNotNone(cached_value.collected_version)
+        self.assertEquals(cached_value.collected_version, self.block_structure.collected_version)
 
     def test_get_none(self):
         self.assertIsNone(
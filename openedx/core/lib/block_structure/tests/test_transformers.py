@@ -81,3 +81,25 @@ class TestBlockStructureTransformers(ChildrenMapTestMixin, TestCase):
             self.assertTrue(self.transformers.is_collected_outdated(block_structure))
             self.transformers.collect(block_structure)
             self.assertFalse(self.transformers.is_collected_outdated(block_structure))
+
+    def test_transform_with_filter_cache(self):
+        self.add_mock_transformer()
+        self.transformers.filter_cache = MagicMock()
+        self.transformers.filter_cache.can_cache.return_value = True
+        self.transformers.filter_cache.get_key.return_value = 'filter_cache_key'
+
+        # On a cache miss, the filters are applied and the remaining blocks cached.
+        self.transformers.filter_cache.get.return_value = None
+        block_structure = self.create_block_structure(self.SIMPLE_CHILDREN_MAP)
+        self.transformers.transform(block_structure)
+        self.transformers.filter_cache.set.assert_called_once_with('filter_cache_key', {0, 1, 2, 3, 4})
+
+        # On a cache hit, the blocks which aren't cached are removed without applying the filters.
+        self.transformers.filter_cache.get.return_value = {0, 1, 3}
+        block_structure = self.create_block_structure(self.SIMPLE_CHILDREN_MAP)
+        with patch(
+            'openedx.core.lib.block_structure.tests.helpers.MockFilteringTransformer.transform_block_filters'
+        ) as mock_transform_block_filters:
+            self.transformers.transform(block_structure)
+            self.assertFalse(mock_transform_block_filters.called)
+        self.assert_block_structure(block_structure, [[1], [3], [], [], []], missing_blocks=[2, 4])
@@ -41,6 +41,18 @@ class BlockStructureTransformers(object):
                 Transformer Registry.
         """
         self.usage_info = usage_info
+
+        # Optional cache of the blocks remaining after applying filtering
+        # transformers, providing the following methods:
+        #   can_cache(transformer) - returns whether the result of the
+        #       transformer's filters may be cached.
+        #   get_key(usage_info, transformers, block_structure) - returns
+        #       the cache key for the result of the filters of the given
+        #       transformers, or None if it can't be cached.
+        #   get(key) - returns the cached set of block keys, or None.
+        #   set(key, block_keys) - caches the given set of block keys.
+        self.filter_cache = None
+
         self._transformers = {'supports_filter': [], 'no_filter': []}
         if transformers:
             self.__iadd__(transformers)
@@ -122,8 +134,37 @@ class BlockStructureTransformers(object):
         if not self._transformers['supports_filter']:
             return
 
+        transformers = self._transformers['supports_filter']
+        if self.filter_cache is not None:
+            cached_transformers = [
+                transformer for transformer in transformers if self.filter_cache.can_cache(transformer)
+            ]
+            cache_key = None
+            if cached_transformers:
+                cache_key = self.filter_cache.get_key(self.usage_info, cached_transformers, block_structure)
+            if cache_key is not None:
+                block_keys = self.filter_cache.get(cache_key)
+                if block_keys is None:
+                    self._apply_filters(cached_transformers, block_structure)
+                    self.filter_cache.set(cache_key, set(block_structure.topological_traversal()))
+                else:
+                    block_structure.remove_block_traversal(lambda block_key: block_key not in block_keys)
+                transformers = [
+                    transformer for transformer in transformers if transformer not in cached_transformers
+                ]
+
+        self._apply_filters(transformers, block_structure)
+
+    def _apply_filters(self, transformers, block_structure):
+        """
+        Applies the combined transform_block_filters of the given
+        transformers to the block_structure in a single traversal.
+        """
+        if not transformers:
+            return
+
         filters = []
-        for transformer in self._transformers['supports_filter']:
+        for transformer in transformers:
             filters.extend(transformer.transform_block_filters(self.usage_info, block_structure))
 
         combined_filters = functools.reduce(
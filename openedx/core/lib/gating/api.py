@@ -2,10 +2,12 @@
 API for the gating djangoapp
 """
 import logging
+from collections import defaultdict
 
+from django.core.cache import cache
 from django.utils.translation import ugettext as _
 from milestones import api as milestones_api
-from opaque_keys.edx.keys import UsageKey
+from opaque_keys.edx.keys import CourseKey, UsageKey
 from xmodule.modulestore.django import modulestore
 from openedx.core.lib.gating.exceptions import GatingValidationError
 
@@ -15,6 +17,9 @@ log = logging.getLogger(__name__)
 # This is used to namespace gating-specific milestones
 GATING_NAMESPACE_QUALIFIER = '.gating'
 
+# Time in seconds for which the prerequisites of a course are cached
+PREREQUISITES_CACHE_TIMEOUT = 60 * 60
+
 
 def _get_prerequisite_milestone(prereq_content_key):
     """
@@ -108,6 +113,66 @@ def find_gating_milestones(course_key, content_key=None, relationship=None, user
     ]
 
 
+def _prerequisites_cache_key(course_key):
+    """
+    Returns the cache key of the prerequisites of the given course, which is
+    the same for all of the branches of the course.
+    """
+    if not isinstance(course_key, CourseKey):
+        course_key = CourseKey.from_string(course_key)
+    return u'gating.prerequisites.{}'.format(course_key.for_branch(None))
+
+
+def clear_prerequisites_cache(course_key):
+    """
+    Clears the cached prerequisites of the given course.
+
+    Arguments:
+        course_key (str|CourseKey): The course key
+
+    Returns:
+        None
+    """
+    cache.delete(_prerequisites_cache_key(course_key))
+
+
+def get_prerequisites_by_content(course):
+    """
+    Returns the gating relationships of the given course, keyed by the
+    prerequisite content.
+
+    The result is cached per course version, and the cache is cleared
+    whenever the prerequisites of the course change through this API.
+
+    Arguments:
+        course (CourseDescriptor): The course
+
+    Returns:
+        dict: Maps the usage key string of each prerequisite to a tuple of its
+            'fulfills' milestone dict and the list of 'requires' milestone dicts
+            of the content gated by it
+    """
+    cache_key = _prerequisites_cache_key(course.id)
+    version = unicode(getattr(course, 'course_version', None))
+    cached = cache.get(cache_key)
+    if cached and cached['version'] == version:
+        return cached['prerequisites']
+
+    gated_content_milestones = defaultdict(list)
+    for milestone in find_gating_milestones(course.id, None, 'requires'):
+        gated_content_milestones[milestone['id']].append(milestone)
+
+    prerequisites = {}
+    for milestone in find_gating_milestones(course.id, None, 'fulfills'):
+        prerequisites.setdefault(
+            milestone['content_id'],
+            (milestone, gated_content_milestones.get(milestone['id'], []))
+        )
+
+    cache.set(cache_key, {'version': version, 'prerequisites': prerequisites}, PREREQUISITES_CACHE_TIMEOUT)
+    return prerequisites
+
+
 def get_gating_milestone(course_key, content_key, relationship):
     """
     Gets a single gating milestone dict related to the given supplied parameters.
@@ -182,6 +247,7 @@ def add_prerequisite(course_key, prereq_content_key):
         propagate=False
     )
     milestones_api.add_course_content_milestone(course_key, prereq_content_key, 'fulfills', milestone)
+    clear_prerequisites_cache(course_key)
 
 
 def remove_prerequisite(prereq_content_key):
@@ -201,6 +267,9 @@ def remove_prerequisite(prereq_content_key):
     ))
     for milestone in milestones:
         milestones_api.remove_milestone(milestone.get('id'))
+    if not isinstance(prereq_content_key, UsageKey):
+        prereq_content_key = UsageKey.from_string(prereq_content_key)
+    clear_prerequisites_cache(prereq_content_key.course_key)
 
 
 def is_prerequisite(course_key, prereq_content_key):
@@ -251,6 +320,8 @@ def set_required_content(course_key, gated_content_key, prereq_content_key, min_
             milestone = _get_prerequisite_milestone(prereq_content_key)
         milestones_api.add_course_content_milestone(course_key, gated_content_key, 'requires', milestone, requirements)
 
+    clear_prerequisites_cache(course_key)
+
 
 def get_required_content(course_key, gated_content_key):
     """
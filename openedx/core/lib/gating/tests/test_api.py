@@ -153,6 +153,25 @@ class TestGatingApi(ModuleStoreTestCase, MilestonesTestCaseMixin):
         self.assertIsNone(prereq_content_key)
         self.assertIsNone(min_score)
 
+    def test_get_prerequisites_by_content(self):
+        """ Test test_get_prerequisites_by_content """
+
+        self.assertEqual(gating_api.get_prerequisites_by_content(self.course), {})
+
+        gating_api.add_prerequisite(self.course.id, self.seq1.location)
+        gating_api.set_required_content(self.course.id, self.seq2.location, self.seq1.location, 100)
+        prereq_milestone = gating_api.get_gating_milestone(self.course.id, self.seq1.location, 'fulfills')
+        gated_milestone = gating_api.get_gating_milestone(self.course.id, self.seq2.location, 'requires')
+
+        self.assertEqual(
+            gating_api.get_prerequisites_by_content(self.course),
+            {unicode(self.seq1.location): (prereq_milestone, [gated_milestone])}
+        )
+
+        gating_api.remove_prerequisite(self.seq1.location)
+
+        self.assertEqual(gating_api.get_prerequisites_by_content(self.course), {})
+
     def test_get_gated_content(self):
         """ Test test_get_gated_content """
 
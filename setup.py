@@ -55,6 +55,7 @@ setup(
             "course_blocks_api = lms.djangoapps.course_api.blocks.transformers.blocks_api:BlocksAPITransformer",
             "proctored_exam = lms.djangoapps.course_api.blocks.transformers.proctored_exam:ProctoredExamTransformer",
             "grades = lms.djangoapps.courseware.transformers.grades:GradesTransformer",
+            "video_outlines = lms.djangoapps.mobile_api.video_outlines.transformers:VideoOutlineTransformer",
         ],
     }
 )